@@ -3,8 +3,15 @@
 
 from __future__ import annotations
 from enum import Enum
-from typing import Callable, List
+from typing import Dict, Iterable, List, Tuple, Union
+
+# External Dependencies
+import numpy as np
+
 from .Country import Country
+from .ResourceQuantity import ResourceQuantity
+from .StateRegistry import StateRegistry
+from .WorldState import WorldState
 
 class ActionType(Enum):
   TRANSFER=1
@@ -12,18 +19,88 @@ class ActionType(Enum):
 
 class Action(object):
   ACTION_TYPE: ActionType
-  NEXT_STATE: Callable[[List[Country]], List[Country]]
   ACTION_COST: float
-  PRECONDITIONS: List[Callable[[List[Country]], bool]]
+  # Position in the canonical list of all actions built for a run
+  INDEX: int
+  # (country name, resource name, minimum quantity) entries that must all hold for the action to apply
+  REQUIREMENTS: List[Tuple[str, str, int]]
+  # Net (country name, resource name, quantity delta) entries changed by the action
+  EFFECTS: List[Tuple[str, str, int]]
+  # Change in state quality per impacted country, built from the resource weights
+  QUALITY_DELTAS: Dict[str, float]
+  # Compiled form used by the array state engine, see compile
+  REQUIRED_INDICES: np.ndarray
+  REQUIRED_QUANTITIES: np.ndarray
+  DELTA: np.ndarray
+
+  # Dict engine only, children share unmodified Country objects with their parent
+  COPY_ON_WRITE: bool = True
 
-  def __init__(self, preconditions: List[Callable[[List[Country]], bool]], cost: float, next_state_fn: Callable[[List[Country]], List[Country]]) -> None:
+  def __init__(self, cost: float) -> None:
     super().__init__()
-    self.NEXT_STATE = next_state_fn
     self.ACTION_COST = cost
-    self.PRECONDITIONS = preconditions
+    self.INDEX = None
+    self.REQUIREMENTS = []
+    self.EFFECTS = []
+    self.QUALITY_DELTAS = None
+    self.REQUIRED_INDICES = None
+    self.REQUIRED_QUANTITIES = None
+    self.DELTA = None
+
+  def apply(self, countries: Union[Dict[str, Country], WorldState]) -> Union[Dict[str, Country], WorldState]:
+    return self.next_state(countries) if self.is_applicable(countries) else None
+
+  def is_applicable(self, countries: Union[Dict[str, Country], WorldState]) -> bool:
+    if isinstance(countries, WorldState):
+      return countries.satisfies(self.REQUIRED_INDICES, self.REQUIRED_QUANTITIES)
+    for country_name, resource_name, quantity in self.REQUIREMENTS:
+      if not countries[country_name].has_resource_quantity(resource_name, quantity):
+        return False
+    return True
+
+  # Applies the action's EFFECTS without checking its REQUIREMENTS
+  def next_state(self, countries: Union[Dict[str, Country], WorldState]) -> Union[Dict[str, Country], WorldState]:
+    if isinstance(countries, WorldState):
+      return countries.apply_delta(self.DELTA)
+
+    modified_resources = {}
+    for country_name, resource_name, _delta in self.EFFECTS:
+      modified_resources.setdefault(country_name, []).append(resource_name)
+    new_country_states = Country.copy_country_states(countries, modified_resources, Action.COPY_ON_WRITE)
+
+    for country_name, resource_name, delta in self.EFFECTS:
+      resources = new_country_states[country_name].resources
+      resource_quantity = resources.get(resource_name)
+      if resource_quantity is None:
+        resources[resource_name] = ResourceQuantity(resource_name, delta)
+      else:
+        resource_quantity.quantity += delta
+    return new_country_states
+
+  # Translates the action into flat requirement indices/quantities and a countries x resources
+  # delta matrix so it can be applied to a WorldState with a single array add
+  def compile(self, registry: StateRegistry) -> Action:
+    requirements = {registry.flat_index(country_name, resource_name): quantity for country_name, resource_name, quantity in self.REQUIREMENTS}
+    self.REQUIRED_INDICES = np.fromiter(requirements.keys(), dtype=np.int64, count=len(requirements))
+    self.REQUIRED_QUANTITIES = np.fromiter(requirements.values(), dtype=np.int64, count=len(requirements))
+    self.DELTA = registry.empty_matrix()
+    for country_name, resource_name, delta in self.EFFECTS:
+      self.DELTA[registry.country_index(country_name), registry.resource_index(resource_name)] += delta
+    return self
+
+  @staticmethod
+  def net_requirements(entries: Iterable[Tuple[str, str, int]]) -> List[Tuple[str, str, int]]:
+    net = {}
+    for country_name, resource_name, quantity in entries:
+      net[(country_name, resource_name)] = net.get((country_name, resource_name), 0) + quantity
+    return [(country_name, resource_name, quantity) for (country_name, resource_name), quantity in net.items()]
 
-  def apply(self, countries: List[Country]) -> List[Country]:
-    return self.NEXT_STATE(countries) if all([precondition(countries) for precondition in self.PRECONDITIONS]) else None
+  @staticmethod
+  def net_effects(entries: Iterable[Tuple[str, str, int]]) -> List[Tuple[str, str, int]]:
+    net = {}
+    for country_name, resource_name, delta in entries:
+      net[(country_name, resource_name)] = net.get((country_name, resource_name), 0) + delta
+    return [(country_name, resource_name, delta) for (country_name, resource_name), delta in net.items() if delta]
 
   def calculate_action_cost(countries: List[Country]) -> float:
     return 0.0
@@ -0,0 +1,59 @@
+# Standard Libraries
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+# External Dependencies
+import numpy as np
+
+# Local Modules
+from .Action import Action
+from .ActionTable import ActionTable
+from .Country import Country
+from .WorldState import WorldState
+
+# Maps each (country, resource) entry onto the positions of the actions whose requirements read it
+# A child's applicable actions are its parent's with only the dependents of the entries the last
+# action changed re-checked, so the work per expansion follows the size of the change rather than
+# the number of actions
+class ActionDependencyIndex(object):
+  ACTIONS: List[Action]
+  TABLE: Optional[ActionTable]
+  DEPENDENTS: Dict[Tuple[str, str], np.ndarray]
+
+  def __init__(self, actions: Union[List[Action], ActionTable]) -> None:
+    super().__init__()
+    # Compiled tables re-check their rows with one vectorized comparison
+    self.TABLE = actions if isinstance(actions, ActionTable) else None
+    self.ACTIONS = list(actions)
+
+    dependents = {}
+    for position, action in enumerate(self.ACTIONS):
+      for country_name, resource_name, _quantity in action.REQUIREMENTS:
+        dependents.setdefault((country_name, resource_name), []).append(position)
+    self.DEPENDENTS = {entry: np.array(positions, dtype=np.int64) for entry, positions in dependents.items()}
+
+  def __len__(self) -> int:
+    return len(self.ACTIONS)
+
+  def dependents(self, effects: Iterable[Tuple[str, str, int]]) -> np.ndarray:
+    positions = [self.DEPENDENTS[(country_name, resource_name)] for country_name, resource_name, _delta in effects if (country_name, resource_name) in self.DEPENDENTS]
+    if not positions:
+      return np.zeros(0, dtype=np.int64)
+    return np.unique(np.concatenate(positions))
+
+  # Mask over every action position of whether it can be applied to the state
+  def applicable(self, state: Union[Dict[str, Country], WorldState]) -> np.ndarray:
+    if self.TABLE is not None and isinstance(state, WorldState):
+      return self.TABLE.satisfied(state)
+    return np.fromiter((action.is_applicable(state) for action in self.ACTIONS), dtype=bool, count=len(self.ACTIONS))
+
+  def update(self, parent_applicable: np.ndarray, state: Union[Dict[str, Country], WorldState], effects: Iterable[Tuple[str, str, int]]) -> np.ndarray:
+    positions = self.dependents(effects)
+    applicable = parent_applicable.copy()
+    if not len(positions):
+      return applicable
+    if self.TABLE is not None and isinstance(state, WorldState):
+      applicable[positions] = self.TABLE.satisfied(state, positions)
+    else:
+      applicable[positions] = [self.ACTIONS[position].is_applicable(state) for position in positions.tolist()]
+    return applicable
@@ -0,0 +1,86 @@
+# Standard Libraries
+from __future__ import annotations
+from typing import Iterator, List, Optional, Tuple
+
+# External Dependencies
+import numpy as np
+
+# Local Modules
+from .Action import Action
+from .StateRegistry import StateRegistry
+from .WorldState import WorldState
+
+# Requirement padding always passes, effect padding adds nothing
+UNCONSTRAINED = np.iinfo(np.int64).min
+
+# Every compiled action of a search held as padded requirement and effect matrices
+# Rows follow the order of the actions given, so children come out in the same order the
+# per action loop would produce them
+# Applicability of every action is one gather and comparison against the parent state, and
+# all children are produced by a single scatter add into copies of the parent
+class ActionTable(object):
+  ACTIONS: List[Action]
+  REGISTRY: StateRegistry
+  REQUIRED_INDICES: np.ndarray
+  REQUIRED_QUANTITIES: np.ndarray
+  EFFECT_INDICES: np.ndarray
+  EFFECT_DELTAS: np.ndarray
+
+  def __init__(self, actions: List[Action], registry: StateRegistry) -> None:
+    super().__init__()
+    self.ACTIONS = list(actions)
+    self.REGISTRY = registry
+
+    action_count = len(self.ACTIONS)
+    requirement_width = max([len(action.REQUIRED_INDICES) for action in self.ACTIONS] + [1])
+    effect_width = max([len(action.EFFECTS) for action in self.ACTIONS] + [1])
+
+    self.REQUIRED_INDICES = np.zeros((action_count, requirement_width), dtype=np.int64)
+    self.REQUIRED_QUANTITIES = np.full((action_count, requirement_width), UNCONSTRAINED, dtype=np.int64)
+    self.EFFECT_INDICES = np.zeros((action_count, effect_width), dtype=np.int64)
+    self.EFFECT_DELTAS = np.zeros((action_count, effect_width), dtype=np.int64)
+
+    for row, action in enumerate(self.ACTIONS):
+      requirement_count = len(action.REQUIRED_INDICES)
+      self.REQUIRED_INDICES[row, :requirement_count] = action.REQUIRED_INDICES
+      self.REQUIRED_QUANTITIES[row, :requirement_count] = action.REQUIRED_QUANTITIES
+      for column, (country_name, resource_name, delta) in enumerate(action.EFFECTS):
+        self.EFFECT_INDICES[row, column] = registry.flat_index(country_name, resource_name)
+        self.EFFECT_DELTAS[row, column] = delta
+
+  def __len__(self) -> int:
+    return len(self.ACTIONS)
+
+  def __iter__(self) -> Iterator[Action]:
+    return iter(self.ACTIONS)
+
+  def __getitem__(self, index: int) -> Action:
+    return self.ACTIONS[index]
+
+  # Whether each of the given rows, or every row, is satisfied by the state
+  def satisfied(self, state: WorldState, rows: Optional[np.ndarray] = None) -> np.ndarray:
+    flat = state.MATRIX.reshape(-1)
+    if rows is None:
+      return np.all(flat[self.REQUIRED_INDICES] >= self.REQUIRED_QUANTITIES, axis=1)
+    return np.all(flat[self.REQUIRED_INDICES[rows]] >= self.REQUIRED_QUANTITIES[rows], axis=1)
+
+  def applicable(self, state: WorldState) -> np.ndarray:
+    return np.flatnonzero(self.satisfied(state))
+
+  # Rows already known to be applicable skip the requirement check
+  def successors(self, state: WorldState, rows: Optional[np.ndarray] = None) -> List[Tuple[Action, WorldState]]:
+    if rows is None:
+      rows = self.applicable(state)
+    if not len(rows):
+      return []
+
+    flat = state.MATRIX.reshape(-1)
+    children = np.tile(flat, (len(rows), 1))
+    # add.at so the zero padding cannot overwrite a real effect on the same index
+    np.add.at(children, (np.arange(len(rows))[:, None], self.EFFECT_INDICES[rows]), self.EFFECT_DELTAS[rows])
+
+    shape = self.REGISTRY.shape
+    return [
+      (self.ACTIONS[row], WorldState(self.REGISTRY, children[child_index].reshape(shape)))
+      for child_index, row in enumerate(rows.tolist())
+    ]
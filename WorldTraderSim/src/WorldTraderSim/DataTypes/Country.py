@@ -1,8 +1,9 @@
 # Standard Libraries
 from __future__ import annotations
+import copy
 from dataclasses import dataclass, field
 import json
-from typing import Dict, List
+from typing import Dict, Iterable, List
 
 # Local Modules
 from .ResourceQuantity import ResourceQuantity
@@ -42,8 +43,9 @@ class Country:
 
     changes = []
     for resource_name, final_quantity in final_resurces.items():
-      start_quantity = start_resources[resource_name]
-      change = final_quantity.quantity - start_quantity.quantity
+      # Array engine states may hold resources the initial state did not define
+      start_quantity = start_resources.get(resource_name)
+      change = final_quantity.quantity - (start_quantity.quantity if start_quantity else 0)
       if change:
         changes.append(ResourceQuantity(resource_name, change))
     return changes
@@ -53,5 +55,29 @@ class Country:
     for resource_quantity in resource_quantities:
       print("{} changed by {}".format(resource_quantity.name, resource_quantity.quantity))
 
+  # Shallow copy that shares every ResourceQuantity except the named ones, which are copied
+  # so the returned country can be modified without touching this one
+  def copy_on_write(self, resource_names: Iterable[str]) -> Country:
+    resources = dict(self.resources)
+    for resource_name in resource_names:
+      resource_quantity = resources.get(resource_name)
+      if resource_quantity is not None:
+        resources[resource_name] = ResourceQuantity(resource_quantity.name, resource_quantity.quantity)
+    return Country(name=self.name, resources=resources)
+
+  @staticmethod
+  def copy_country_states(country_states: Dict[str, Country], modified_resources: Dict[str, Iterable[str]], copy_on_write: bool) -> Dict[str, Country]:
+    # Without copy on write every country is deep copied
+    if not copy_on_write:
+      return copy.deepcopy(country_states)
+
+    # Otherwise unmodified countries are shared with the original states
+    new_country_states = dict(country_states)
+    for country_name, resource_names in modified_resources.items():
+      new_country_states[country_name] = country_states[country_name].copy_on_write(resource_names)
+    return new_country_states
+
   def has_resource_quantity(self, resource_name: str, resource_quantity: int) -> bool:
-    return (self.resources.get(resource_name).quantity >= resource_quantity)
+    # Resources a country has never held count as zero
+    resource = self.resources.get(resource_name)
+    return ((resource.quantity if resource is not None else 0) >= resource_quantity)
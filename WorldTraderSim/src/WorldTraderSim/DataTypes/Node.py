@@ -3,61 +3,121 @@
 
 # Standard Libraries
 from __future__ import annotations
-import hashlib
-import json
-from typing import Dict, Any
-from uuid import UUID, uuid4
+import itertools
+import sys
+from typing import Dict, Any, Tuple, Union
+
+# External Dependencies
+import numpy as np
 
 # Local Modules
 from .Action import Action
 from .Country import Country
+from .WorldState import WorldState
+from .ZobristHasher import ZobristHasher
 
+# Slotted so a node is a fixed size record without an instance __dict__, the parent action is
+# a reference to the shared Action rather than a copy
+# With a CHECKPOINT_INTERVAL only the root and every k-th level keep their state once released,
+# any other state is rebuilt on access by replaying actions from the nearest kept ancestor
 class Node(object):
+   __slots__ = ("ID", "_STATE", "STATE_HASH", "PARENT", "PARENT_ACTION", "PATH_COST", "DEPTH", "IMPACTED", "QUALITY_DELTAS", "APPLICABLE")
 
-   ID: UUID
-   STATE: Dict[str, Country]
-   STATE_HASH: str
+   ID: int
+   STATE: Union[Dict[str, Country], WorldState]
+   STATE_HASH: int
    PARENT: Node
    PARENT_ACTION: Action
    PATH_COST: float
+   DEPTH: int
+   # Countries impacted by any action on the path to this node, in the order first impacted
+   IMPACTED: Tuple[Country, ...]
+   # Change in state quality from the initial state for each impacted country, filled in and
+   # cached by the ScheduleEvaluator from the parent's deltas
+   QUALITY_DELTAS: Dict[str, float]
+   # Mask over the search's action positions of the actions applicable to STATE, filled in when
+   # the node is expanded with an ActionDependencyIndex
+   APPLICABLE: np.ndarray
+
+   # Shared so hashes are comparable between every node of a run
+   HASHER: ZobristHasher = ZobristHasher()
+   # Sequential ids, unique within a process
+   IDS = itertools.count()
+   # Levels between kept states, 0 keeps every state
+   CHECKPOINT_INTERVAL: int = 0
 
-   def __init__(self, state: Dict[str, Country], parent: Node, parent_action: Action, path_cost: float) -> None:
+   def __init__(self, state: Union[Dict[str, Country], WorldState], parent: Node, parent_action: Action, path_cost: float) -> None:
       super().__init__()
-      self.ID = uuid4()
-      self.STATE = state
+      self.ID = next(Node.IDS)
+      self._STATE = state
       self.STATE_HASH = None
       self.PARENT = parent
       self.PARENT_ACTION = parent_action
       self.PATH_COST = path_cost
-      self.DEPTH = None
+      self.DEPTH = parent.DEPTH + 1 if parent is not None else 1
+      self.IMPACTED = Node._carry_impacted(parent, parent_action)
+      self.QUALITY_DELTAS = None
+      self.APPLICABLE = None
+
+   @staticmethod
+   def _carry_impacted(parent: Node, parent_action: Action) -> Tuple[Country, ...]:
+      if parent is None or parent_action is None:
+         return ()
+      impacted = parent.IMPACTED
+      impacted_names = [country.name for country in impacted]
+      new_countries = tuple(country for country in parent_action.get_impacted_countries() if country.name not in impacted_names)
+      return impacted + new_countries if new_countries else impacted
+
+   @property
+   def STATE(self) -> Union[Dict[str, Country], WorldState]:
+      if self._STATE is None and self.PARENT is not None:
+         # The rebuilt state is kept until the node is released again
+         replay = []
+         node = self
+         while node._STATE is None:
+            replay.append(node)
+            node = node.PARENT
+         state = node._STATE
+         for node in reversed(replay):
+            state = node.PARENT_ACTION.next_state(state)
+         self._STATE = state
+      return self._STATE
+
+   @STATE.setter
+   def STATE(self, state: Union[Dict[str, Country], WorldState]):
+      self._STATE = state
+
+   def is_checkpoint(self) -> bool:
+      return not Node.CHECKPOINT_INTERVAL or self.PARENT is None or self.DEPTH % Node.CHECKPOINT_INTERVAL == 0
+
+   # Drops the state of non checkpoint nodes, called once the search no longer needs it directly
+   def release_state(self):
+      if not self.is_checkpoint():
+         self._STATE = None
 
    def __eq__(self, other: Node) -> bool:
       return self.state_hash() == other.state_hash()
 
-   def state_hash(self) -> str:
-      if self.STATE_HASH:
+   def state_hash(self) -> int:
+      if self.STATE_HASH is not None:
          return self.STATE_HASH
-      
-      json_state = {}
-      for name, country in self.STATE.items():
-         json_state[name] = dict(country)
-
-      dhash = hashlib.md5()
-      encoded = json.dumps(json_state, sort_keys=True).encode()
-      dhash.update(encoded)
 
-      self.STATE_HASH = dhash.hexdigest()
+      # Children of hashed parents only rehash the entries their action changed
+      parent = self.PARENT
+      if parent is not None and parent.STATE_HASH is not None and self.PARENT_ACTION is not None:
+         self.STATE_HASH = Node.HASHER.update(parent.STATE_HASH, parent.STATE, self.PARENT_ACTION.EFFECTS)
+      else:
+         self.STATE_HASH = Node.HASHER.hash_state(self.STATE)
       return self.STATE_HASH
 
-   def depth(self):
-      if self.DEPTH:
-         return self.DEPTH
-      
-      node_count = 1
-      current_node = self.PARENT
-      while current_node:
-         node_count += 1
-         current_node = current_node.PARENT
-      self.DEPTH = node_count
-
+   def depth(self) -> int:
       return self.DEPTH
+
+   # Approximate bytes held by this node alone, the state is excluded as it may be shared
+   def memory_bytes(self) -> int:
+      size = sys.getsizeof(self)
+      if self.QUALITY_DELTAS is not None and (self.PARENT is None or self.PARENT.QUALITY_DELTAS is not self.QUALITY_DELTAS):
+         size += sys.getsizeof(self.QUALITY_DELTAS)
+      if self.APPLICABLE is not None:
+         size += self.APPLICABLE.nbytes
+      return size
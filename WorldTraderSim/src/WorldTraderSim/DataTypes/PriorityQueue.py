@@ -2,39 +2,103 @@
 # -*- coding: utf-8 -*-
 
 from __future__ import annotations
-from typing import Callable, List, Tuple
+import heapq
+import itertools
+from typing import Callable, Iterator, List, Optional
 from .Node import Node
-import operator
+
+# Heap entries are [priority, tiebreak, node], priority is negated for descending queues so the
+# best entry is always the smallest. The tiebreak pops the most recently added of equal entries
+# first, matching the order of the original sorted list implementation
+PRIORITY = 0
+TIEBREAK = 1
+NODE = 2
+REMOVED = None
 
 class PriorityQueue(object):
 
-   queue: List[Tuple[Node, float]]
+   queue: List[list]
+   worst_queue: List[list]
    evaluation_function: Callable[[Node], float]
-   priority_operator: bool
+   ascending: bool
+   capacity: Optional[int]
+   evicted_count: int
+   dropped_count: int
 
-   def __init__(self, eval_fn: Callable[[Node], float], ascending: bool) -> None:
+   def __init__(self, eval_fn: Callable[[Node], float], ascending: bool, capacity: Optional[int] = None) -> None:
       super().__init__()
       self.queue = []
+      # Bounded queues keep a second heap ordered worst first so eviction is O(log n)
+      self.worst_queue = []
       self.evaluation_function = eval_fn
-      self.priority_operator = operator.gt if ascending else operator.lt
-
-   def add(self, node: Node) -> PriorityQueue:
-      cost = self.evaluation_function(node)
-      for idx, node_and_cost in enumerate(self.queue):
-         if self.priority_operator(cost, node_and_cost[1]):
-            self.queue.insert(idx, (node, cost))
-            return self
-      self.queue.append((node, cost))
+      self.ascending = ascending
+      self.capacity = capacity
+      self.counter = itertools.count()
+      self.size = 0
+      self.evicted_count = 0
+      self.dropped_count = 0
+
+   # A priority already computed for the node is used instead of the evaluation function
+   def add(self, node: Node, priority: Optional[float] = None) -> PriorityQueue:
+      cost = self.evaluation_function(node) if priority is None else priority
+      entry = [cost if self.ascending else -cost, -next(self.counter), node]
+
+      if self.capacity is not None:
+         if self.size >= self.capacity:
+            worst = self._peek_worst()
+            if worst is None or entry[:NODE] >= worst[:NODE]:
+               self.dropped_count += 1
+               return self
+            self._remove(worst)
+            self.evicted_count += 1
+            self._compact()
+         heapq.heappush(self.worst_queue, [-entry[PRIORITY], -entry[TIEBREAK], entry])
+
+      heapq.heappush(self.queue, entry)
+      self.size += 1
       return self
 
    def is_empty(self) -> bool:
-      return len(self.queue) == 0
-   
+      return self.size == 0
+
    def length(self) -> int:
-      return len(self.queue)
+      return self.size
 
    def pop(self) -> Node:
-      return self.queue.pop()[0]
+      while self.queue:
+         entry = heapq.heappop(self.queue)
+         node = entry[NODE]
+         if node is not REMOVED:
+            # Leave a tombstone for the worst first heap to skip
+            entry[NODE] = REMOVED
+            self.size -= 1
+            self._compact()
+            return node
+      raise IndexError("pop from empty priority queue")
 
    def as_list(self) -> List[Node]:
-      return [item for item, _ in self.queue][::-1]
+      return [entry[NODE] for entry in sorted(self._entries())]
+
+   def _entries(self) -> Iterator[list]:
+      return (entry for entry in self.queue if entry[NODE] is not REMOVED)
+
+   def _peek_worst(self) -> Optional[list]:
+      while self.worst_queue:
+         entry = self.worst_queue[0][NODE]
+         if entry[NODE] is not REMOVED:
+            return entry
+         heapq.heappop(self.worst_queue)
+      return None
+
+   def _remove(self, entry: list):
+      entry[NODE] = REMOVED
+      self.size -= 1
+
+   def _compact(self):
+      # Rebuild once tombstones outnumber live entries to keep both heaps O(n)
+      if len(self.worst_queue) > 2 * self.size + 32:
+         self.worst_queue = [worst for worst in self.worst_queue if worst[NODE][NODE] is not REMOVED]
+         heapq.heapify(self.worst_queue)
+      if len(self.queue) > 2 * self.size + 32:
+         self.queue = list(self._entries())
+         heapq.heapify(self.queue)
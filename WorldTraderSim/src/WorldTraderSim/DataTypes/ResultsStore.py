@@ -0,0 +1,145 @@
+# Standard Libraries
+from __future__ import annotations
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import time
+import uuid
+from typing import Dict, List, Union
+
+# External Dependencies
+import numpy as np
+
+# Local Modules
+from .Country import Country
+from .SearchStats import SearchStats
+
+# Append only store of every schedule of every run as columnar NumPy partitions
+#   <directory>/scenario=<key>/config=<hash>/seed=<seed>/<run id>.npz
+# Each run adds one partition and never touches another, so runs can be filtered by path before anything is read
+# A partition holds
+# - one row per step, schedule, step, action_type, action, expected_utility and state_quality
+#   where action indexes the partition's action_names so each distinct action string is stored once
+# - one row per schedule, schedule_expected_utility, schedule_steps and a schedule_<field> column per SearchStats field
+# - the run's run_id, scenario, config, seed, country, created and config_json as 0-d arrays
+PARTITION_EXTENSION = ".npz"
+STEP_COLUMNS = ["schedule", "step", "action_type", "action", "expected_utility", "state_quality"]
+RUN_COLUMNS = ["run_id", "scenario", "config", "seed"]
+
+
+class ResultsStore(object):
+  DIRECTORY: str
+  RUN_ID: str
+  SCENARIO: str
+  CONFIG: str
+  CONFIG_JSON: str
+  SEED: str
+  COUNTRY: Country
+  STEPS: Dict[str, List]
+  SCHEDULES: Dict[str, List]
+  ACTION_CODES: Dict[str, int]
+
+  def __init__(self, directory: str, scenario: str, config: Dict[str, Dict[str, str]], seed: Union[int, None], country: Country) -> None:
+    super().__init__()
+    self.DIRECTORY = directory
+    # Time ordered so the latest run sorts last
+    self.RUN_ID = "{}-{}".format(time.strftime("%Y%m%dT%H%M%S"), uuid.uuid4().hex[:8])
+    self.SCENARIO = scenario
+    self.CONFIG_JSON = json.dumps(config, sort_keys=True)
+    self.CONFIG = ResultsStore.config_key(config)
+    self.SEED = "none" if seed is None else str(seed)
+    self.COUNTRY = country
+    self.STEPS = {column: [] for column in STEP_COLUMNS}
+    self.SCHEDULES = {"schedule_expected_utility": [], "schedule_steps": []}
+    self.SCHEDULES.update({"schedule_" + field: [] for field in SearchStats().to_dict()})
+    self.ACTION_CODES = {}
+
+  @staticmethod
+  def config_key(config: Dict[str, Dict[str, str]]) -> str:
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()[:16]
+
+  # Takes a schedule's steps as computed by Schedule.path_steps
+  def add(self, steps: List[Dict], expected_utility: float, stats: SearchStats = None):
+    schedule = len(self.SCHEDULES["schedule_steps"]) + 1
+    for step in steps:
+      action_name = step["action"].to_string(self.COUNTRY)
+      self.STEPS["schedule"].append(schedule)
+      self.STEPS["step"].append(step["step"])
+      self.STEPS["action_type"].append(step["action"].ACTION_TYPE.name)
+      self.STEPS["action"].append(self.ACTION_CODES.setdefault(action_name, len(self.ACTION_CODES)))
+      self.STEPS["expected_utility"].append(step["expected_utility"])
+      self.STEPS["state_quality"].append(step["state_quality"])
+    self.SCHEDULES["schedule_expected_utility"].append(expected_utility)
+    self.SCHEDULES["schedule_steps"].append(len(steps))
+    for field, value in (stats or SearchStats()).to_dict().items():
+      self.SCHEDULES["schedule_" + field].append(value)
+
+  def partition_path(self) -> str:
+    return os.path.join(self.DIRECTORY, "scenario=" + self.SCENARIO, "config=" + self.CONFIG, "seed=" + self.SEED, self.RUN_ID + PARTITION_EXTENSION)
+
+  def write(self) -> str:
+    columns = {
+      "schedule": np.array(self.STEPS["schedule"], dtype=np.int32),
+      "step": np.array(self.STEPS["step"], dtype=np.int32),
+      "action_type": np.array(self.STEPS["action_type"], dtype=np.str_),
+      "action": np.array(self.STEPS["action"], dtype=np.int32),
+      "expected_utility": np.array(self.STEPS["expected_utility"], dtype=np.float64),
+      "state_quality": np.array(self.STEPS["state_quality"], dtype=np.float64),
+      "action_names": np.array(list(self.ACTION_CODES), dtype=np.str_),
+    }
+    for column, values in self.SCHEDULES.items():
+      columns[column] = np.array(values)
+    for column, value in [("run_id", self.RUN_ID), ("scenario", self.SCENARIO), ("config", self.CONFIG), ("seed", self.SEED),
+                          ("country", self.COUNTRY.name), ("created", time.strftime("%Y-%m-%dT%H:%M:%S")), ("config_json", self.CONFIG_JSON)]:
+      columns[column] = np.array(value)
+
+    # Written under a temporary name and renamed so readers never see a partial partition
+    partition_path = self.partition_path()
+    os.makedirs(os.path.dirname(partition_path), exist_ok=True)
+    file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(partition_path), suffix=".tmp")
+    try:
+      with os.fdopen(file_descriptor, "wb") as file:
+        np.savez(file, **columns)
+      os.replace(temp_path, partition_path)
+    finally:
+      if os.path.exists(temp_path):
+        os.remove(temp_path)
+    return partition_path
+
+  # Partitions matching every given key, oldest run first, filtering only looks at paths
+  @staticmethod
+  def partitions(directory: str, run_id: str = None, scenario: str = None, config: str = None, seed: Union[int, str, None] = None) -> List[str]:
+    pattern = os.path.join(
+      directory,
+      "scenario=" + (scenario or "*"),
+      "config=" + (config or "*"),
+      "seed=" + ("*" if seed is None else str(seed)),
+      (run_id or "*") + PARTITION_EXTENSION
+    )
+    return sorted(glob.glob(pattern), key=os.path.basename)
+
+  # Step rows of the matching runs as one dict of columns, with the run keys repeated on every row
+  # and actions decoded to their strings, pandas.DataFrame(columns) turns it into a table
+  # With schedules set, one row per schedule with its schedule_ columns instead
+  @staticmethod
+  def query(directory: str, run_id: str = None, scenario: str = None, config: str = None, seed: Union[int, str, None] = None, schedules: bool = False) -> Dict[str, np.ndarray]:
+    if schedules:
+      row_columns = ["schedule", "schedule_expected_utility", "schedule_steps"] + ["schedule_" + field for field in SearchStats().to_dict()]
+    else:
+      row_columns = STEP_COLUMNS
+    parts = {column: [] for column in RUN_COLUMNS + row_columns}
+    for partition_path in ResultsStore.partitions(directory, run_id, scenario, config, seed):
+      with np.load(partition_path) as partition:
+        rows = len(partition[row_columns[1]])
+        for column in RUN_COLUMNS:
+          parts[column].append(np.full(rows, str(partition[column])))
+        for column in row_columns:
+          if schedules and column == "schedule":
+            parts[column].append(np.arange(1, rows+1, dtype=np.int32))
+          elif column == "action":
+            parts[column].append(partition["action_names"][partition["action"]] if rows else np.array([], dtype=np.str_))
+          else:
+            parts[column].append(partition[column])
+    return {column: np.concatenate(values) if values else np.array([]) for column, values in parts.items()}
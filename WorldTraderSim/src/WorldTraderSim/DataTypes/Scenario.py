@@ -0,0 +1,18 @@
+# Standard Libraries
+from dataclasses import dataclass, field
+from typing import List
+
+# Local Modules
+from .Action import Action
+from .Country import Country
+from .ResourceTemplate import ResourceTemplate
+from .TransformTemplate import TransformTemplate
+
+# Everything a run builds from its input files before searching
+# Actions reference the Country objects of initial_state and are in canonical order
+@dataclass
+class Scenario:
+  initial_state: List[Country] = field(default_factory=list)
+  resources: List[ResourceTemplate] = field(default_factory=list)
+  transform_templates: List[TransformTemplate] = field(default_factory=list)
+  actions: List[Action] = field(default_factory=list)
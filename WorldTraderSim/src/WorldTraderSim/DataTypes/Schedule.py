@@ -1,14 +1,20 @@
 # Standard Libraries
 from __future__ import annotations
 import csv
+import json
 from dataclasses import dataclass, field
 from os import path, PathLike
 from typing import Callable, Dict, List, Union
 
+# External Dependencies
+import numpy as np
+
 # Local Modules
 from .Country import Country
 from .Node import Node
+from .SearchStats import SearchStats
 from .Solution import Solution
+from .WorldState import WorldState
 
 @dataclass
 class Schedule:
@@ -16,72 +22,91 @@ class Schedule:
   countries: List[Country] = field(default_factory=list)
 
   # Returns the current state of country on the given node
-  def get_country_state(self, country_name: str) -> Country:
-    return self.node.STATE.get(country_name)
+  # For the array engine this is the country's row of resource quantities
+  def get_country_state(self, country_name: str) -> Union[Country, np.ndarray]:
+    state = self.node.STATE
+    if isinstance(state, WorldState):
+      return state.quantities(country_name)
+    return state.get(country_name)
 
   def get_impacted_countries(self) -> List[Country]:
     if self.countries and len(self.countries):
       return self.countries
-    
-    found_country_names = {}
-    current_node = self.node
-    while current_node:
-      last_action = current_node.PARENT_ACTION
-      if last_action:
-        countries = last_action.get_impacted_countries()
-        for country in countries:
-          if not found_country_names.get(country.name, False):
-            found_country_names[country.name] = True
-            self.countries.append(country)
-      current_node = current_node.PARENT
 
+    # Nodes carry the impacted countries forward from their parent
+    self.countries = list(self.node.IMPACTED)
     return self.countries
 
   def get_steps(self):
     return self.node.depth()
 
+  # Per step metrics of a schedule computed in a single forward pass along its path
+  # Each node's state is rebuilt from its predecessor and its EU carries forward the quality deltas
+  # cached on the predecessor, so every step costs one action rather than a walk back to the root
+  @staticmethod
+  def path_steps(solution: Solution, state_quality_fn: Callable[[Country], float], expected_utility_fn: Callable[[Country, Schedule], float], self_country: Country) -> List[Dict]:
+    steps = []
+    for index, node in enumerate(solution.PATH):
+      if node.PARENT_ACTION:
+        schedule = Schedule(node)
+        steps.append({
+          "action": node.PARENT_ACTION,
+          "step": index+1,
+          "expected_utility": expected_utility_fn(self_country, schedule),
+          "state_quality": state_quality_fn(schedule.get_country_state(self_country.name)),
+        })
+    return steps
+
+  @staticmethod
+  def format_steps(steps: List[Dict], self_country: Country) -> str:
+    lines = ["["]
+    for step in steps:
+      lines.append("  " + step["action"].to_string(self_country) + " EU: {}".format(step["expected_utility"]))
+    lines.append("]")
+    return "\n".join(lines)
+
   @staticmethod
-  def write_solutions(solutions: Dict[str, Solution], expected_utility_fn: Callable[[Country, Schedule], float], self_country: Country, output_file_name: str, output_dir: Union[str, PathLike, None] = None):
+  def write_solutions(solutions: Dict[str, Solution], expected_utility_fn: Callable[[Country, Schedule], float], self_country: Country, output_file_name: str, output_dir: Union[str, PathLike, None] = None, state_quality_fn: Callable[[Country], float] = None):
     if not output_dir:
       module_path = path.dirname(path.abspath(__file__))
       output_dir =  path.join(module_path, "../data/schedules/")
 
     utilities = sorted(list(solutions.keys()), reverse=True)
+    state_quality_fn = state_quality_fn or (lambda country_state: None)
 
     with open(output_dir+output_file_name, "w") as file:
-      solutions_count = 0
-      for utility in utilities:
-        solution = solutions[utility]
-        if solutions_count:
-          file.write(",\n")
-        file.write("[\n")
-        for node in solution.PATH:
-          if node.PARENT_ACTION:
-            eu = expected_utility_fn(self_country, Schedule(node))
-            file.write("  " + node.PARENT_ACTION.to_string(self_country) + " EU: {}\n".format(eu))
-        file.write("]")
-        solutions_count += 1
+      file.write(",\n".join(
+        Schedule.format_steps(Schedule.path_steps(solutions[utility], state_quality_fn, expected_utility_fn, self_country), self_country)
+        for utility in utilities
+      ))
+
+  @staticmethod
+  def write_stats(stats: List[SearchStats], output_file_name: str, output_dir: Union[str, PathLike, None] = None):
+    if not output_dir:
+      module_path = path.dirname(path.abspath(__file__))
+      output_dir =  path.join(module_path, "../data/schedules/")
+
+    # One entry per searched schedule in search order
+    with open(path.join(output_dir, output_file_name), "w") as file:
+      json.dump([search_stats.to_dict() if search_stats else None for search_stats in stats], file, indent=2)
     
   @staticmethod
   def write_csv(solution: Solution, state_quality_fn: Callable[[Country], float], expected_utility_fn: Callable[[Country, Schedule], float], self_country: Country, output_file_name: str, output_dir: Union[str, PathLike, None] = None):
+    Schedule.write_steps_csv(Schedule.path_steps(solution, state_quality_fn, expected_utility_fn, self_country), output_file_name, output_dir)
+
+  @staticmethod
+  def write_steps_csv(steps: List[Dict], output_file_name: str, output_dir: Union[str, PathLike, None] = None):
     if not output_dir:
       module_path = path.dirname(path.abspath(__file__))
       output_dir =  path.join(module_path, "../data/schedules/")
 
-    solution_path = []
-    for index, node in enumerate(solution.PATH):
-      if node.PARENT_ACTION:
-        state_quality = state_quality_fn(node.STATE[self_country.name])
-        eu = expected_utility_fn(self_country, Schedule(node))
-        solution_path.append({
-          "action_type": node.PARENT_ACTION.ACTION_TYPE,
-          "step": index+1,
-          "expected_utility": eu,
-          "state_quality": state_quality,
-        })
-
     with open(path.join(output_dir, output_file_name), 'w', newline='') as file:
       csv_file = csv.DictWriter(file, fieldnames=["action_type", "step", "expected_utility", "state_quality"])
 
       csv_file.writeheader()
-      csv_file.writerows(solution_path)
+      csv_file.writerows({
+        "action_type": step["action"].ACTION_TYPE,
+        "step": step["step"],
+        "expected_utility": step["expected_utility"],
+        "state_quality": step["state_quality"],
+      } for step in steps)
@@ -0,0 +1,91 @@
+# Standard Libraries
+from __future__ import annotations
+import json
+from typing import Callable, Dict, List, TextIO, Tuple
+
+# Local Modules
+from .Country import Country
+from .Schedule import Schedule
+from .Solution import Solution
+
+SCHEDULE_FORMATS = ["text", "jsonl"]
+
+# Streams every schedule to the output file as soon as its search finishes
+# text keeps the schedules file format, blocks are appended in search order while the run is going
+# and rewritten best EU first, one schedule per EU, once it closes, jsonl writes one object per schedule with its steps
+# Steps are computed once per schedule and kept for the best schedule so its CSV needs no second pass
+class ScheduleWriter(object):
+  OUTPUT_PATH: str
+  OUTPUT_FORMAT: str
+  SELF_COUNTRY: Country
+  STATE_QUALITY_FN: Callable[[Country], float]
+  EXPECTED_UTILITY_FN: Callable[[Country, Schedule], float]
+  FILE: TextIO
+  # (expected utility, formatted block) of every text schedule written
+  BLOCKS: List[Tuple[float, str]]
+  COUNT: int
+  BEST_EU: float
+  BEST_STEPS: List[Dict]
+
+  def __init__(self, output_path: str, output_format: str, self_country: Country, state_quality_fn: Callable[[Country], float], expected_utility_fn: Callable[[Country, Schedule], float]) -> None:
+    super().__init__()
+    if output_format not in SCHEDULE_FORMATS:
+      raise Exception("Schedule output format '{}' is not one of {}".format(output_format, ", ".join(SCHEDULE_FORMATS)))
+    self.OUTPUT_PATH = output_path
+    self.OUTPUT_FORMAT = output_format
+    self.SELF_COUNTRY = self_country
+    self.STATE_QUALITY_FN = state_quality_fn
+    self.EXPECTED_UTILITY_FN = expected_utility_fn
+    self.FILE = open(output_path, "w")
+    self.BLOCKS = []
+    self.COUNT = 0
+    self.BEST_EU = None
+    self.BEST_STEPS = None
+
+  def __enter__(self) -> ScheduleWriter:
+    return self
+
+  def __exit__(self, *exc_info):
+    self.close()
+
+  def write(self, solution: Solution, expected_utility: float) -> List[Dict]:
+    steps = Schedule.path_steps(solution, self.STATE_QUALITY_FN, self.EXPECTED_UTILITY_FN, self.SELF_COUNTRY)
+    self.COUNT += 1
+    if self.OUTPUT_FORMAT == "jsonl":
+      self.FILE.write(json.dumps({
+        "schedule": self.COUNT,
+        "expected_utility": expected_utility,
+        "steps": [{
+          "step": step["step"],
+          "action_type": step["action"].ACTION_TYPE.name,
+          "action": step["action"].to_string(self.SELF_COUNTRY),
+          "expected_utility": step["expected_utility"],
+          "state_quality": step["state_quality"],
+        } for step in steps],
+      }) + "\n")
+    else:
+      block = Schedule.format_steps(steps, self.SELF_COUNTRY)
+      self.FILE.write((",\n" if self.BLOCKS else "") + block)
+      self.BLOCKS.append((expected_utility, block))
+    # Flushed so finished schedules are on disk while later searches run
+    self.FILE.flush()
+
+    # Ties go to the later schedule as they did when schedules were keyed by EU
+    if self.BEST_EU is None or expected_utility >= self.BEST_EU:
+      self.BEST_EU = expected_utility
+      self.BEST_STEPS = steps
+    return steps
+
+  def close(self):
+    if self.FILE.closed:
+      return
+    self.FILE.close()
+    if self.OUTPUT_FORMAT == "text" and len(self.BLOCKS) > 1:
+      # Schedules were always keyed by EU, the last schedule found with an EU is the one kept
+      blocks = dict(self.BLOCKS)
+      with open(self.OUTPUT_PATH, "w") as file:
+        file.write(",\n".join(blocks[utility] for utility in sorted(blocks, reverse=True)))
+
+  def write_best_csv(self, output_file_name: str, output_dir: str = None):
+    if self.BEST_STEPS is not None:
+      Schedule.write_steps_csv(self.BEST_STEPS, output_file_name, output_dir)
@@ -0,0 +1,30 @@
+# Standard Libraries
+from __future__ import annotations
+from dataclasses import asdict, dataclass
+from typing import Dict, Union
+
+# Counters and timings a SearchStrategy fills in over one search, attached to its Solution
+# Timings are cumulative seconds measured around each expansion's batch of calls
+@dataclass
+class SearchStats:
+  strategy: str = ""
+  # Why the search stopped, depth_bound, exhausted, time_budget, expansion_budget or interrupted
+  stop_reason: str = ""
+  generated: int = 0
+  expanded: int = 0
+  duplicates_pruned: int = 0
+  frontier_dropped: int = 0
+  peak_frontier: int = 0
+  peak_reached: int = 0
+  apply_seconds: float = 0.0
+  state_hash_seconds: float = 0.0
+  heuristic_seconds: float = 0.0
+  search_seconds: float = 0.0
+  bytes_per_node: float = 0.0
+
+  def record_frontier(self, size: int):
+    if size > self.peak_frontier:
+      self.peak_frontier = size
+
+  def to_dict(self) -> Dict[str, Union[str, int, float]]:
+    return asdict(self)
@@ -6,6 +6,7 @@ from typing import List, Union
 
 from .Action import ActionType
 from .Node import Node
+from .SearchStats import SearchStats
 from .Country import Country
 from .TransferAction import TransferAction
 from .TransformAction import TransformAction
@@ -14,9 +15,10 @@ class Solution(object):
 
   NODE: Node
   PATH: List[Node]
-  VISITED: List[Country]
+  VISITED: List[Node]
+  STATS: SearchStats
 
-  def __init__(self, goal_node: Node, visited_nodes: List[Country]) -> None:
+  def __init__(self, goal_node: Node, visited_nodes: List[Node]) -> None:
     super().__init__()
     self.NODE = goal_node
     self.PATH = []
@@ -26,6 +28,7 @@ class Solution(object):
       current_node = current_node.PARENT
     self.PATH.reverse()
     self.VISITED = visited_nodes
+    self.STATS = None
 
   def print_path(self):
     step = 1
@@ -56,5 +59,5 @@ class Solution(object):
   def print_visited_order(self):
     print('Visited Nodes: ', end='')
     for node in self.VISITED[:-1]:
-      print('{} -> '.format(node), end='')
-    print('{}'.format(self.VISITED[-1]))
+      print('{} -> '.format(node.STATE), end='')
+    print('{}'.format(self.VISITED[-1].STATE))
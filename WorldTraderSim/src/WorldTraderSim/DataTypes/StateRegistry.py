@@ -0,0 +1,71 @@
+# Standard Libraries
+from __future__ import annotations
+from typing import Dict, Iterable, List, Tuple
+
+# External Dependencies
+import numpy as np
+
+# Local Modules
+from .Country import Country
+from .ResourceTemplate import ResourceTemplate
+from .TransformTemplate import TransformTemplate
+
+# Maps country and resource names onto the rows and columns of a world state matrix
+# A single registry is shared by every state, action and evaluator of a run
+class StateRegistry(object):
+  COUNTRIES: List[str]
+  RESOURCES: List[str]
+  COUNTRY_INDEX: Dict[str, int]
+  RESOURCE_INDEX: Dict[str, int]
+
+  def __init__(self, countries: List[str], resources: List[str]) -> None:
+    super().__init__()
+    self.COUNTRIES = list(countries)
+    self.RESOURCES = list(resources)
+    self.COUNTRY_INDEX = {name: index for index, name in enumerate(self.COUNTRIES)}
+    self.RESOURCE_INDEX = {name: index for index, name in enumerate(self.RESOURCES)}
+
+  @staticmethod
+  def from_states(initial_state: List[Country], resources: List[ResourceTemplate], transform_templates: Iterable[TransformTemplate] = ()) -> StateRegistry:
+    # Resources held by the countries come first, followed by any resource that is only
+    # weighted or only produced/consumed by a template so every action can be compiled
+    resource_names = []
+    def register(resource_name: str):
+      if resource_name not in resource_names:
+        resource_names.append(resource_name)
+
+    for country in initial_state:
+      for resource_name in country.resources.keys():
+        register(resource_name)
+    for resource in resources:
+      register(resource.name)
+    for transform_template in transform_templates:
+      for resource_quantity in transform_template.inputs + transform_template.outputs:
+        register(resource_quantity.name)
+
+    return StateRegistry([country.name for country in initial_state], resource_names)
+
+  @property
+  def shape(self) -> Tuple[int, int]:
+    return (len(self.COUNTRIES), len(self.RESOURCES))
+
+  def country_index(self, country_name: str) -> int:
+    index = self.COUNTRY_INDEX.get(country_name)
+    if index is None:
+      raise Exception("Country '{}' is not defined in the state registry".format(country_name))
+    return index
+
+  def resource_index(self, resource_name: str) -> int:
+    index = self.RESOURCE_INDEX.get(resource_name)
+    if index is None:
+      raise Exception("Resource '{}' is not defined in the state registry".format(resource_name))
+    return index
+
+  def flat_index(self, country_name: str, resource_name: str) -> int:
+    return self.country_index(country_name) * len(self.RESOURCES) + self.resource_index(resource_name)
+
+  def empty_matrix(self) -> np.ndarray:
+    return np.zeros(self.shape, dtype=np.int64)
+
+  def weight_vector(self, resource_weights: Dict[str, float]) -> np.ndarray:
+    return np.array([resource_weights.get(resource_name, 0.0) for resource_name in self.RESOURCES], dtype=np.float64)
@@ -0,0 +1,84 @@
+# Standard Libraries
+from __future__ import annotations
+from collections import deque
+from configparser import ConfigParser
+import json
+import logging
+import time
+from typing import Deque, Dict, List, Tuple, Union
+
+DEFAULT_BUFFER_SIZE = 100000
+DEFAULT_SAMPLE_EVERY = 1
+
+# Process wide structured event tracing for the hot loops
+# Call sites guard with `if Tracer.ENABLED:` so a disabled tracer costs one attribute lookup and
+# never builds the event, an enabled tracer keeps every SAMPLE_EVERY-th event as a raw tuple in a
+# ring buffer of the most recent BUFFER_SIZE events that is only formatted when dumped
+class Tracer(object):
+  ENABLED: bool = False
+  SAMPLE_EVERY: int = DEFAULT_SAMPLE_EVERY
+  COUNT: int = 0
+  START: float = 0.0
+  BUFFER: Deque[Tuple[int, float, str, Dict]] = deque(maxlen=DEFAULT_BUFFER_SIZE)
+
+  @staticmethod
+  def configure(config: ConfigParser):
+    enabled = config.getboolean("Trace", "Enabled", fallback=None)
+    buffer_size = config.getint("Trace", "BufferSize", fallback=None)
+    sample_every = config.getint("Trace", "SampleEvery", fallback=None)
+    if buffer_size is not None:
+      if buffer_size < 1:
+        raise Exception("Trace buffer size must be at least 1, got '{}'".format(buffer_size))
+      logging.info(f"Tracer set buffer size to {buffer_size}")
+    if sample_every is not None:
+      if sample_every < 1:
+        raise Exception("Trace sample interval must be at least 1, got '{}'".format(sample_every))
+      logging.info(f"Tracer set sample interval to {sample_every}")
+    Tracer.enable(bool(enabled), buffer_size or Tracer.BUFFER.maxlen, sample_every or Tracer.SAMPLE_EVERY)
+    if enabled:
+      logging.info("Tracer enabled")
+
+  @staticmethod
+  def enable(enabled: bool = True, buffer_size: int = DEFAULT_BUFFER_SIZE, sample_every: int = DEFAULT_SAMPLE_EVERY):
+    Tracer.ENABLED = enabled
+    Tracer.SAMPLE_EVERY = sample_every
+    Tracer.COUNT = 0
+    Tracer.START = time.perf_counter()
+    Tracer.BUFFER = deque(maxlen=buffer_size)
+
+  @staticmethod
+  def record(event: str, **fields):
+    Tracer.COUNT += 1
+    if Tracer.COUNT % Tracer.SAMPLE_EVERY:
+      return
+    Tracer.BUFFER.append((Tracer.COUNT, time.perf_counter() - Tracer.START, event, fields))
+
+  # Rare summary events are always kept regardless of sampling
+  @staticmethod
+  def mark(event: str, **fields):
+    Tracer.COUNT += 1
+    Tracer.BUFFER.append((Tracer.COUNT, time.perf_counter() - Tracer.START, event, fields))
+
+  # Hands the buffered events over, used to collect them from worker processes
+  @staticmethod
+  def drain() -> List[Tuple[int, float, str, Dict]]:
+    events = list(Tracer.BUFFER)
+    Tracer.BUFFER.clear()
+    return events
+
+  @staticmethod
+  def extend(events: List[Tuple[int, float, str, Dict]]):
+    Tracer.BUFFER.extend(events)
+
+  # One JSON object per line, seq counts every event including those not sampled or overwritten
+  @staticmethod
+  def dump(output_path: str) -> int:
+    events = Tracer.drain()
+    with open(output_path, "w") as file:
+      for seq, seconds, event, fields in events:
+        file.write(json.dumps({"seq": seq, "t": round(seconds, 6), "event": event, **fields}, default=str) + "\n")
+    return len(events)
+
+  @staticmethod
+  def describe() -> Dict[str, Union[int, bool]]:
+    return {"enabled": Tracer.ENABLED, "events": Tracer.COUNT, "buffered": len(Tracer.BUFFER), "buffer_size": Tracer.BUFFER.maxlen}
@@ -3,10 +3,8 @@
 
 # Standard Libraries
 from __future__ import annotations
-import copy
 from enum import Enum
-import logging
-from typing import Callable, Dict, List
+from typing import Callable, List
 
 # Local Modules
 from .Action import Action, ActionType
@@ -35,34 +33,6 @@ class TransferDirection(Enum):
     else:
       raise Exception("Unrecognized Transfer Direction")
 
-# Runtime
-def determine_country_states(self_country: Country, other_country: Country, country_states: Dict[str, Country], resource_quantities: List[ResourceQuantity], transfer_direction: TransferDirection) -> Dict[str, Country]:
-  logging.debug(determine_country_states.__name__)
-  new_country_states = copy.deepcopy(country_states)
-
-  sender_country = TransferDirection.determine_sending_country(transfer_direction, self_country, other_country)
-  receiver_country = TransferDirection.determine_receiving_country(transfer_direction, self_country, other_country) 
-  sender = new_country_states[sender_country.name]
-  receiver = new_country_states[receiver_country.name]
-
-  for resource_quantity in resource_quantities:
-    name = resource_quantity.name
-    quantity = resource_quantity.quantity
-
-    logging.debug("Evaluating a transfer of {} {} from {} to {}".format(quantity, name, sender.name, receiver.name))
-
-    sender_resource = sender.resources.get(name)
-    sender_resource.quantity -= quantity
-    sender.resources[name] = sender_resource
-    new_country_states[sender.name] = sender
-
-    receiver_resource = receiver.resources.get(name)
-    receiver_resource.quantity += quantity
-    receiver.resources[name] = receiver_resource
-    new_country_states[receiver.name] = receiver
-
-  return new_country_states
-
 # Transfers
 # Are from one country to another country, constituting one transfer (turn or step)
 # Experiment with varied amounts of resources
@@ -74,14 +44,14 @@ def determine_country_states(self_country: Country, other_country: Country, coun
 
 # Transfers need to be translated into Actions
 # These Actions operate on Country as the state
-# PRECONDITIONS are created from resource quantities
+# REQUIREMENTS are created from resource quantities held by the sender
 #     1 to N #TODO
 #     Single or Multi
-# NEXT_STATE would involve subtracting or adding quantities depending on direction
+# EFFECTS subtract quantities from the sender and add them to the receiver
 # ACTION_COST is less clear at this stage 
 class TransferAction(Action):
-  def __init__(self, preconditions: List[Callable[[List[Country]], bool]], cost: float, next_state_fn: Callable[[Dict[str, Country]], Dict[str, Country]]) -> None:
-    super().__init__(preconditions, cost, next_state_fn)
+  def __init__(self, cost: float) -> None:
+    super().__init__(cost)
     self.ACTION_TYPE = ActionType.TRANSFER
 
   @property
@@ -133,24 +103,22 @@ class TransferAction(Action):
     sending_country = TransferDirection.determine_sending_country(transfer_direction, self_country, other_country)
     receiving_country = TransferDirection.determine_receiving_country(transfer_direction, self_country, other_country) 
 
-    preconditions = []
-    for resource_quantity in resource_quantities:
-      name = resource_quantity.name
-      quantity = resource_quantity.quantity
-      fn: Callable[[Dict[str, Country]], bool] = lambda countries: countries[sending_country.name].has_resource_quantity(name, quantity)
-      preconditions.append(fn)
-
-    next_state_fn: Callable[[Dict[str, Country]], Dict[str, Country]] = lambda countries: determine_country_states(self_country, other_country, countries, resource_quantities, transfer_direction)
-
     # This seems like it should be something like the delta between current state and next state
     # As viewed by the state quality function (Heuristic)
     # However, that might be considered path cost instead, not clear
     cost: float = 0.0
 
-    transfer_action = TransferAction(preconditions, cost, next_state_fn)
+    transfer_action = TransferAction(cost)
     transfer_action.SENDER = sending_country
     transfer_action.RECEIVER = receiving_country
     transfer_action.DIRECTION = transfer_direction
     transfer_action.RESOURCE_QUANTITIES = resource_quantities
+    transfer_action.REQUIREMENTS = Action.net_requirements(
+      [(sending_country.name, resource_quantity.name, resource_quantity.quantity) for resource_quantity in resource_quantities]
+    )
+    transfer_action.EFFECTS = Action.net_effects(
+      [(sending_country.name, resource_quantity.name, -resource_quantity.quantity) for resource_quantity in resource_quantities] +
+      [(receiving_country.name, resource_quantity.name, resource_quantity.quantity) for resource_quantity in resource_quantities]
+    )
 
     return transfer_action
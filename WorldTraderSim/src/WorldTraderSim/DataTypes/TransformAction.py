@@ -4,8 +4,7 @@
 # Standard Libraries
 from __future__ import annotations
 import copy
-import logging
-from typing import Callable, Dict, List
+from typing import Callable, List
 
 # Local Modules
 from .Action import Action, ActionType
@@ -13,44 +12,14 @@ from .Country import Country
 from .ResourceQuantity import ResourceQuantity
 from .TransformTemplate import TransformTemplate
 
-def determine_country_states(country_states: Dict[str, Country], transform_template: TransformTemplate, target_country: Country, multiplier: int = 1) -> Dict[str, Country]:
-  logging.debug(determine_country_states.__name__)
-  new_country_states = copy.deepcopy(country_states)
-  country = new_country_states[target_country.name]
-
-  logging.debug("Evaluating {} transform for {}".format(transform_template.name, country.name))
-
-  for input in transform_template.inputs:
-    resource_name = input.name
-    resource_quantity = input.quantity
-
-    resource = country.resources.get(resource_name)
-    resource.quantity -= (resource_quantity*multiplier)
-
-    country.resources[resource_name] = resource
-
-  for output in transform_template.outputs:
-    resource_name = output.name
-    resource_quantity = output.quantity
-
-    resource = country.resources.get(resource_name)
-    resource.quantity += (resource_quantity*multiplier)
-
-    country.resources[resource_name] = resource
-
-  new_country_states[target_country.name] = country
-  
-  return new_country_states
-
-
 # TransformTemplates need to be translated into Actions
 # These Actions operate on Country as the state
-# PRECONDITIONS are created from transform inputs to determine eligibility
-# NEXT_STATE would involve subtracting all inputs then adding all outputs
+# REQUIREMENTS are created from transform inputs to determine eligibility
+# EFFECTS subtract all inputs then add all outputs
 # ACTION_COST is less clear at this stage 
 class TransformAction(Action):
-  def __init__(self, preconditions: List[Callable[[Dict[str, Country]], bool]], cost: float, next_state_fn: Callable[[Dict[str, Country]], Dict[str, Country]]) -> None:
-    super().__init__(preconditions, cost, next_state_fn)
+  def __init__(self, cost: float) -> None:
+    super().__init__(cost)
     self.ACTION_TYPE = ActionType.TRANSFORM
 
   @property
@@ -85,18 +54,9 @@ class TransformAction(Action):
     actions = []
 
     for multiplier in range(1, (quantity_max+1)):
-      preconditions = []
-      for input in transform_template.inputs:
-        resource_name = input.name
-        resource_quantity = input.quantity*multiplier
-        fn: Callable[[Dict[str, Country]], bool] = lambda countries: countries[target_country.name].has_resource_quantity(resource_name, resource_quantity)
-        preconditions.append(fn)
-
       cost: float = 0.0
 
-      next_state_fn: Callable[[Dict[str, Country]], Dict[str, Country]] = lambda countries: determine_country_states(countries, transform_template, target_country, multiplier)
-
-      transform_action = TransformAction(preconditions, cost, next_state_fn)
+      transform_action = TransformAction(cost)
       transform_action.TARGET = target_country
       transform_action.TEMPLATE = copy.deepcopy(transform_template)
 
@@ -105,6 +65,13 @@ class TransformAction(Action):
         return resource_quantity
       transform_action.TEMPLATE.inputs = [update_quantity(resource_quantity) for resource_quantity in transform_action.TEMPLATE.inputs]
       transform_action.TEMPLATE.outputs = [update_quantity(resource_quantity) for resource_quantity in transform_action.TEMPLATE.outputs]
+      transform_action.REQUIREMENTS = Action.net_requirements(
+        [(target_country.name, input.name, input.quantity) for input in transform_action.TEMPLATE.inputs]
+      )
+      transform_action.EFFECTS = Action.net_effects(
+        [(target_country.name, input.name, -input.quantity) for input in transform_action.TEMPLATE.inputs] +
+        [(target_country.name, output.name, output.quantity) for output in transform_action.TEMPLATE.outputs]
+      )
 
       actions.append(transform_action)
     return actions
@@ -0,0 +1,87 @@
+# Standard Libraries
+from __future__ import annotations
+import json
+from typing import Dict, Iterator, List, Tuple
+
+# External Dependencies
+import numpy as np
+
+# Local Modules
+from .Country import Country
+from .ResourceQuantity import ResourceQuantity
+from .StateRegistry import StateRegistry
+
+# Array backed world state, countries x resources, indexed through a shared StateRegistry
+# The matrix is never modified in place, applying an action always produces a new WorldState
+# Read access mirrors Dict[str, Country] so reporting code works against either engine
+class WorldState(object):
+  REGISTRY: StateRegistry
+  MATRIX: np.ndarray
+
+  def __init__(self, registry: StateRegistry, matrix: np.ndarray) -> None:
+    super().__init__()
+    self.REGISTRY = registry
+    self.MATRIX = matrix
+
+  @staticmethod
+  def from_country_states(country_states: Dict[str, Country], registry: StateRegistry) -> WorldState:
+    matrix = registry.empty_matrix()
+    for country_name, country in country_states.items():
+      country_index = registry.country_index(country_name)
+      for resource_name, resource_quantity in country.resources.items():
+        matrix[country_index, registry.resource_index(resource_name)] = resource_quantity.quantity
+    return WorldState(registry, matrix)
+
+  def to_country_states(self) -> Dict[str, Country]:
+    return {country_name: self.get(country_name) for country_name in self.REGISTRY.COUNTRIES}
+
+  def quantities(self, country_name: str) -> np.ndarray:
+    return self.MATRIX[self.REGISTRY.country_index(country_name)]
+
+  def quantity(self, country_name: str, resource_name: str) -> int:
+    return int(self.MATRIX[self.REGISTRY.country_index(country_name), self.REGISTRY.resource_index(resource_name)])
+
+  def satisfies(self, indices: np.ndarray, quantities: np.ndarray) -> bool:
+    return bool(np.all(self.MATRIX.ravel()[indices] >= quantities))
+
+  def apply_delta(self, delta: np.ndarray) -> WorldState:
+    return WorldState(self.REGISTRY, self.MATRIX + delta)
+
+  # Dict[str, Country] compatible accessors, these materialize Country objects and are
+  # intended for reporting rather than the search hot path
+  def get(self, country_name: str, default: Country = None) -> Country:
+    country_index = self.REGISTRY.COUNTRY_INDEX.get(country_name)
+    if country_index is None:
+      return default
+    row = self.MATRIX[country_index]
+    resources = {}
+    for resource_index, resource_name in enumerate(self.REGISTRY.RESOURCES):
+      resources[resource_name] = ResourceQuantity(name=resource_name, quantity=int(row[resource_index]))
+    return Country(name=country_name, resources=resources)
+
+  def __getitem__(self, country_name: str) -> Country:
+    country = self.get(country_name)
+    if country is None:
+      raise KeyError(country_name)
+    return country
+
+  def __contains__(self, country_name: str) -> bool:
+    return country_name in self.REGISTRY.COUNTRY_INDEX
+
+  def __iter__(self) -> Iterator[str]:
+    return iter(self.REGISTRY.COUNTRIES)
+
+  def __len__(self) -> int:
+    return len(self.REGISTRY.COUNTRIES)
+
+  def keys(self) -> List[str]:
+    return list(self.REGISTRY.COUNTRIES)
+
+  def values(self) -> List[Country]:
+    return [self.get(country_name) for country_name in self.REGISTRY.COUNTRIES]
+
+  def items(self) -> List[Tuple[str, Country]]:
+    return [(country_name, self.get(country_name)) for country_name in self.REGISTRY.COUNTRIES]
+
+  def __str__(self) -> str:
+    return json.dumps({country_name: dict(country) for country_name, country in self.items()})
@@ -0,0 +1,75 @@
+# Standard Libraries
+from __future__ import annotations
+import hashlib
+from typing import Dict, Iterable, Tuple, Union
+
+# Local Modules
+from .Country import Country
+from .WorldState import WorldState
+
+MASK_64 = (1 << 64) - 1
+DEFAULT_SEED = 5260
+
+def splitmix64(value: int) -> int:
+  value = (value + 0x9E3779B97F4A7C15) & MASK_64
+  value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+  value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK_64
+  return value ^ (value >> 31)
+
+# 64-bit Zobrist hashing of world states
+# A state hash is the XOR of one key per (country, resource, quantity) entry, so replacing a
+# single quantity only needs the old and new keys for that entry XORed into the hash
+# Keys are derived from names with a seeded blake2b rather than Python's hash(), which is
+# randomized per process, so hashes are stable across processes and runs
+class ZobristHasher(object):
+  SEED: int
+  ENTRY_KEYS: Dict[Tuple[str, str], int]
+
+  def __init__(self, seed: int = DEFAULT_SEED) -> None:
+    super().__init__()
+    self.SEED = seed
+    self.ENTRY_KEYS = {}
+
+  def _entry_key(self, country_name: str, resource_name: str) -> int:
+    entry = (country_name, resource_name)
+    entry_key = self.ENTRY_KEYS.get(entry)
+    if entry_key is None:
+      digest = hashlib.blake2b("{}\x1f{}".format(country_name, resource_name).encode(), digest_size=8, key=self.SEED.to_bytes(8, "little"))
+      entry_key = int.from_bytes(digest.digest(), "little")
+      self.ENTRY_KEYS[entry] = entry_key
+    return entry_key
+
+  def key(self, country_name: str, resource_name: str, quantity: int) -> int:
+    return splitmix64(self._entry_key(country_name, resource_name) ^ (quantity & MASK_64))
+
+  def hash_state(self, state: Union[Dict[str, Country], WorldState]) -> int:
+    state_hash = 0
+    if isinstance(state, WorldState):
+      registry = state.REGISTRY
+      for country_index, country_name in enumerate(registry.COUNTRIES):
+        row = state.MATRIX[country_index]
+        for resource_index, resource_name in enumerate(registry.RESOURCES):
+          state_hash ^= self.key(country_name, resource_name, int(row[resource_index]))
+      return state_hash
+
+    for country_name, country in state.items():
+      for resource_name, resource_quantity in country.resources.items():
+        state_hash ^= self.key(country_name, resource_name, resource_quantity.quantity)
+    return state_hash
+
+  # Derives a child hash from its parent given the (country, resource, delta) entries an action changed
+  def update(self, parent_hash: int, parent_state: Union[Dict[str, Country], WorldState], effects: Iterable[Tuple[str, str, int]]) -> int:
+    state_hash = parent_hash
+    is_world_state = isinstance(parent_state, WorldState)
+    for country_name, resource_name, delta in effects:
+      if is_world_state:
+        old_quantity = parent_state.quantity(country_name, resource_name)
+      else:
+        resource_quantity = parent_state[country_name].resources.get(resource_name)
+        if resource_quantity is None:
+          # The action creates the resource, a missing entry has no key in the parent hash
+          state_hash ^= self.key(country_name, resource_name, delta)
+          continue
+        old_quantity = resource_quantity.quantity
+      state_hash ^= self.key(country_name, resource_name, old_quantity) ^ self.key(country_name, resource_name, old_quantity + delta)
+    return state_hash
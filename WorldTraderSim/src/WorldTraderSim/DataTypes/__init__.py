@@ -1,13 +1,23 @@
 # Make data classes available at module root
 from .Action import Action
+from .ActionDependencyIndex import ActionDependencyIndex
+from .ActionTable import ActionTable
 from .Country import Country
 from .Heuristic import Heuristic
 from .Node import Node
 from .PriorityQueue import PriorityQueue
 from .ResourceQuantity import ResourceQuantity
 from .ResourceTemplate import ResourceTemplate
+from .Scenario import Scenario
+from .ResultsStore import ResultsStore
 from .Schedule import Schedule
+from .ScheduleWriter import ScheduleWriter
+from .SearchStats import SearchStats
 from .Solution import Solution
+from .StateRegistry import StateRegistry
+from .Tracer import Tracer
 from .TransferAction import TransferAction
 from .TransformAction import TransformAction
 from .TransformTemplate import TransformTemplate
+from .WorldState import WorldState
+from .ZobristHasher import ZobristHasher
@@ -5,7 +5,7 @@ import math
 from typing import Callable, Dict
 
 # Local Modules
-from DataTypes import Country, Schedule
+from ..DataTypes import Country, Node, Schedule, Tracer
 
 # Numeric Constants
 SCHEDULE_FAILED_IMPACT=-0.35
@@ -68,29 +68,42 @@ class ScheduleEvaluator:
     end_state = schedule.get_country_state(country_name)
     return self.state_quality_fn(end_state)
 
-  def undiscounted_reward(self, country: Country, schedule: Schedule):
-    logging.debug(self.undiscounted_reward.__name__)
-
-    start_quality = self._get_initial_state_quality(country.name)
-    logging.debug(f"Start Quality {start_quality}")
-
-    end_quality = self._get_current_state_quality(country.name, schedule)
-    logging.debug(f"End Quality {end_quality}")
+  def _get_quality_deltas(self, node: Node) -> Dict[str, float]:
+    # Walk up to the nearest node with cached deltas, normally the parent, then carry them
+    # forward adding each action's precomputed quality deltas, or recomputing only the
+    # countries it impacted when the action has none
+    pending_nodes = []
+    current_node = node
+    while current_node is not None and current_node.QUALITY_DELTAS is None:
+      pending_nodes.append(current_node)
+      current_node = current_node.PARENT
+
+    quality_deltas = current_node.QUALITY_DELTAS if current_node is not None else {}
+    for pending_node in reversed(pending_nodes):
+      action = pending_node.PARENT_ACTION
+      if action is not None:
+        quality_deltas = dict(quality_deltas)
+        if action.QUALITY_DELTAS is not None:
+          for country_name, quality_delta in action.QUALITY_DELTAS.items():
+            quality_deltas[country_name] = quality_deltas.get(country_name, 0.0) + quality_delta
+        else:
+          schedule = Schedule(pending_node)
+          for country in action.get_impacted_countries():
+            start_quality = self._get_initial_state_quality(country.name)
+            end_quality = self._get_current_state_quality(country.name, schedule)
+            quality_deltas[country.name] = end_quality - start_quality
+      pending_node.QUALITY_DELTAS = quality_deltas
+
+    return quality_deltas
 
-    undiscounted_reward = end_quality - start_quality
-    logging.debug(f"Undiscounted Reward = {undiscounted_reward}")  
-    
-    return undiscounted_reward
+  def undiscounted_reward(self, country: Country, schedule: Schedule):
+    # Countries never impacted along the schedule are still in their initial state
+    return self._get_quality_deltas(schedule.node).get(country.name, 0.0)
 
   def discounted_reward(self, country: Country, schedule: Schedule) -> float:
-    logging.debug(self.discounted_reward.__name__)
-    
     undiscounted_reward = self.undiscounted_reward(country, schedule)
     discount = self.schedule_length_impact ** schedule.get_steps()
-    discounted_reward = float(undiscounted_reward * discount)
-    logging.debug(f"Discounted Reward = {discounted_reward}")
-
-    return discounted_reward
+    return float(undiscounted_reward * discount)
 
   def logistic_function(self, x: float) -> float:
     '''See https://en.wikipedia.org/wiki/Logistic_function'''
@@ -118,8 +131,6 @@ class ScheduleEvaluator:
     return float( L / ( 1 + power ) )
 
   def logistic_success(self, country: Country, schedule: Schedule) -> float:
-    logging.debug(self.logistic_success.__name__)
-
     if self.force_self_accept and self.self_country_name == country.name:
       return 1
     
@@ -130,7 +141,6 @@ class ScheduleEvaluator:
     return self.logistic_success(country, schedule)
 
   def schedule_success_probability(self, schedule: Schedule) -> float:
-    logging.debug(self.schedule_success_probability.__name__)
     countries = schedule.get_impacted_countries()
     prob = 1
     for country in countries:
@@ -158,16 +168,13 @@ class ScheduleEvaluator:
       logging.info(f"Country State Quality Change - {country.name} {undiscounted_reward}")
 
   def expected_utility(self, country: Country, schedule: Schedule) -> float:
-    logging.debug(self.expected_utility.__name__)
-    
     discounted_reward = self.discounted_reward(country, schedule)
     success_probability = self.schedule_success_probability(schedule)
     failure_probability = 1-success_probability
 
-    logging.debug(f"EU Success Probability {success_probability}")
-    logging.debug(f"EU Failure Probability {failure_probability}")
-
     expected_utility = float((success_probability * discounted_reward) + (failure_probability * self.schedule_failed_impact))
-    logging.debug(f"Expected Utility = {expected_utility}")
+    # Called for every child, traced rather than logged so it stays off the hot path
+    if Tracer.ENABLED:
+      Tracer.record("expected_utility", node=schedule.node.ID, country=country.name, discounted_reward=discounted_reward, success_probability=success_probability, expected_utility=expected_utility)
 
     return expected_utility
@@ -1,32 +1,57 @@
 # Standard Libaries
-from typing import List
+from typing import Dict, List, Optional, Union
+
+# External Dependencies
+import numpy as np
 
 # Local Modules
-from DataTypes import Country
-from DataTypes import ResourceTemplate
+from ..DataTypes import Action
+from ..DataTypes import Country
+from ..DataTypes import ResourceTemplate
+from ..DataTypes import StateRegistry
 
 class StateEvaluator:
-  def __init__(self, resources: List[ResourceTemplate]) -> None:
+  def __init__(self, resources: List[ResourceTemplate], registry: Optional[StateRegistry] = None) -> None:
     self.resources = resources
     self.resource_weights = {}
     self.resource_factors = {}
+    self.weight_vector = None
     self._build_resouce_maps()
+    if registry:
+      self.weight_vector = registry.weight_vector(self.resource_weights)
 
   def _build_resouce_maps(self):
     for resource in self.resources:
       self.resource_weights[resource.name] = resource.weight
       self.resource_factors[resource.name] = resource.factor
 
-  def weighted_sum(self, country_state: Country) -> float:
+  def weighted_sum(self, country_state: Union[Country, np.ndarray]) -> float:
+    # Array engine rows are aligned with the registry resources
+    if isinstance(country_state, np.ndarray):
+      return float(np.dot(country_state, self.weight_vector))
+
     country_resources = country_state.resources.values()
 
     weighted_sum = 0.0
     for resource_quantity in country_resources:
       resource_amount = resource_quantity.quantity
-      resource_weight = self.resource_weights[resource_quantity.name]
+      # Resources only produced or consumed by templates carry no weight
+      resource_weight = self.resource_weights.get(resource_quantity.name, 0.0)
       weighted_sum = weighted_sum + (resource_amount * resource_weight)
 
     return weighted_sum
 
-  def state_quality(self, country_state: Country) -> float:
+  def state_quality(self, country_state: Union[Country, np.ndarray]) -> float:
     return self.weighted_sum(country_state)
+
+  # State quality is linear in resource quantities, so the change an action makes to each
+  # impacted country is fixed and can be computed once from its effects
+  def action_quality_deltas(self, action: Action) -> Dict[str, float]:
+    quality_deltas = {country.name: 0.0 for country in action.get_impacted_countries()}
+    for country_name, resource_name, delta in action.EFFECTS:
+      quality_deltas[country_name] = quality_deltas.get(country_name, 0.0) + delta * self.resource_weights.get(resource_name, 0.0)
+    return quality_deltas
+
+  def build_quality_deltas(self, actions: List[Action]):
+    for action in actions:
+      action.QUALITY_DELTAS = self.action_quality_deltas(action)
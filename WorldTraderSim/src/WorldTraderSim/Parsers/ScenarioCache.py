@@ -0,0 +1,162 @@
+# Standard Libraries
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Dict, Iterable, List, Tuple
+
+# External Dependencies
+import numpy as np
+
+# Local Modules
+from ..DataTypes import \
+  Action, Country, ResourceQuantity, ResourceTemplate, Scenario, StateRegistry, \
+  TransferAction, TransformAction, TransformTemplate
+from ..DataTypes.TransferAction import TransferDirection
+
+# Bump whenever the layout below changes so older artifacts are never read
+CACHE_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+
+# A compiled scenario is a directory named by the content hash of its inputs holding
+# - manifest.json, the registry, resource weights, templates and per action metadata
+# - initial_state.npy and present.npy, the countries x resources quantities and which entries the countries define
+# - requirements.npy and effects.npy, (country, resource, quantity) rows of every action back to back,
+#   split per action by requirement_offsets.npy and effect_offsets.npy
+# Arrays are read whole on load, actions need their rows as named tuples as soon as the search is set up
+
+
+def scenario_key(input_paths: Iterable[str], options: Dict[str, str], country_name: str) -> str:
+  digest = hashlib.sha256()
+  digest.update("{}\x1f{}\x1f{}".format(CACHE_VERSION, country_name, json.dumps(sorted(options.items()))).encode())
+  for input_path in input_paths:
+    digest.update(os.path.basename(input_path).encode() + b"\x1f")
+    with open(input_path, "rb") as file:
+      digest.update(hashlib.sha256(file.read()).digest())
+  return digest.hexdigest()[:32]
+
+def _entries(action_entries: List[List[Tuple[str, str, int]]], registry: StateRegistry) -> Tuple[np.ndarray, np.ndarray]:
+  rows = [
+    (registry.country_index(country_name), registry.resource_index(resource_name), quantity)
+    for entries in action_entries for country_name, resource_name, quantity in entries
+  ]
+  offsets = np.cumsum([0] + [len(entries) for entries in action_entries], dtype=np.int64)
+  return np.array(rows, dtype=np.int64).reshape(-1, 3), offsets
+
+def _action_metadata(action: Action, country_index: Dict[str, int]) -> Dict:
+  if isinstance(action, TransferAction):
+    return {
+      "type": "TRANSFER",
+      "cost": action.ACTION_COST,
+      "sender": country_index[action.SENDER.name],
+      "receiver": country_index[action.RECEIVER.name],
+      "direction": action.DIRECTION.name,
+      "resources": [[resource_quantity.name, resource_quantity.quantity] for resource_quantity in action.RESOURCE_QUANTITIES],
+    }
+  if isinstance(action, TransformAction):
+    return {
+      "type": "TRANSFORM",
+      "cost": action.ACTION_COST,
+      "target": country_index[action.TARGET.name],
+      "template": _template_metadata(action.TEMPLATE),
+    }
+  raise Exception("Cannot cache action type '{}'".format(type(action).__name__))
+
+def _template_metadata(transform_template: TransformTemplate) -> Dict:
+  return {
+    "name": transform_template.name,
+    "inputs": [[resource_quantity.name, resource_quantity.quantity] for resource_quantity in transform_template.inputs],
+    "outputs": [[resource_quantity.name, resource_quantity.quantity] for resource_quantity in transform_template.outputs],
+  }
+
+def _template(metadata: Dict) -> TransformTemplate:
+  return TransformTemplate(
+    name=metadata["name"],
+    inputs=[ResourceQuantity(name, quantity) for name, quantity in metadata["inputs"]],
+    outputs=[ResourceQuantity(name, quantity) for name, quantity in metadata["outputs"]]
+  )
+
+def save(scenario_path: str, scenario: Scenario):
+  registry = StateRegistry.from_states(scenario.initial_state, scenario.resources, scenario.transform_templates)
+  country_index = registry.COUNTRY_INDEX
+
+  initial_state = registry.empty_matrix()
+  present = np.zeros(registry.shape, dtype=bool)
+  for country in scenario.initial_state:
+    for resource_name, resource_quantity in country.resources.items():
+      initial_state[country_index[country.name], registry.resource_index(resource_name)] = resource_quantity.quantity
+      present[country_index[country.name], registry.resource_index(resource_name)] = True
+  requirements, requirement_offsets = _entries([action.REQUIREMENTS for action in scenario.actions], registry)
+  effects, effect_offsets = _entries([action.EFFECTS for action in scenario.actions], registry)
+
+  manifest = {
+    "version": CACHE_VERSION,
+    "countries": registry.COUNTRIES,
+    "resources": registry.RESOURCES,
+    "resource_templates": [{"name": resource.name, "weight": resource.weight, "factor": resource.factor} for resource in scenario.resources],
+    "transform_templates": [_template_metadata(transform_template) for transform_template in scenario.transform_templates],
+    "actions": [_action_metadata(action, country_index) for action in scenario.actions],
+  }
+
+  # Written to a temporary directory and renamed into place so concurrent runs never see a partial artifact
+  cache_dir = os.path.dirname(os.path.abspath(scenario_path))
+  os.makedirs(cache_dir, exist_ok=True)
+  temp_path = tempfile.mkdtemp(dir=cache_dir)
+  try:
+    with open(os.path.join(temp_path, MANIFEST_FILE), "w") as file:
+      json.dump(manifest, file)
+    for name, array in [("initial_state", initial_state), ("present", present), ("requirements", requirements), ("requirement_offsets", requirement_offsets), ("effects", effects), ("effect_offsets", effect_offsets)]:
+      np.save(os.path.join(temp_path, name + ".npy"), array)
+    os.rename(temp_path, scenario_path)
+  except OSError:
+    # Another run stored the same scenario first
+    if not os.path.exists(os.path.join(scenario_path, MANIFEST_FILE)):
+      raise
+  finally:
+    shutil.rmtree(temp_path, ignore_errors=True)
+
+def load(scenario_path: str) -> Scenario:
+  with open(os.path.join(scenario_path, MANIFEST_FILE)) as file:
+    manifest = json.load(file)
+  if manifest.get("version") != CACHE_VERSION:
+    raise Exception("Scenario cache version {} is not {}".format(manifest.get("version"), CACHE_VERSION))
+  arrays = {name: np.load(os.path.join(scenario_path, name + ".npy")) for name in ["initial_state", "present", "requirements", "requirement_offsets", "effects", "effect_offsets"]}
+
+  countries, resources = manifest["countries"], manifest["resources"]
+  initial_state = []
+  for country_name, quantities, present in zip(countries, arrays["initial_state"].tolist(), arrays["present"].tolist()):
+    initial_state.append(Country(
+      name=country_name,
+      resources={resource_name: ResourceQuantity(resource_name, quantity) for resource_name, quantity, defined in zip(resources, quantities, present) if defined}
+    ))
+
+  # Rows are named once up front, each action then takes its slice
+  def entries(name: str) -> Tuple[List[Tuple[str, str, int]], List[int]]:
+    rows = [(countries[country], resources[resource], quantity) for country, resource, quantity in arrays[name + "s"].tolist()]
+    return rows, arrays[name + "_offsets"].tolist()
+  requirements, requirement_offsets = entries("requirement")
+  effects, effect_offsets = entries("effect")
+
+  actions = []
+  for position, metadata in enumerate(manifest["actions"]):
+    if metadata["type"] == "TRANSFER":
+      action = TransferAction(metadata["cost"])
+      action.SENDER = initial_state[metadata["sender"]]
+      action.RECEIVER = initial_state[metadata["receiver"]]
+      action.DIRECTION = TransferDirection[metadata["direction"]]
+      action.RESOURCE_QUANTITIES = [ResourceQuantity(name, quantity) for name, quantity in metadata["resources"]]
+    else:
+      action = TransformAction(metadata["cost"])
+      action.TARGET = initial_state[metadata["target"]]
+      action.TEMPLATE = _template(metadata["template"])
+    action.REQUIREMENTS = requirements[requirement_offsets[position]:requirement_offsets[position+1]]
+    action.EFFECTS = effects[effect_offsets[position]:effect_offsets[position+1]]
+    actions.append(action)
+
+  return Scenario(
+    initial_state=initial_state,
+    resources=[ResourceTemplate(**resource) for resource in manifest["resource_templates"]],
+    transform_templates=[_template(metadata) for metadata in manifest["transform_templates"]],
+    actions=actions
+  )
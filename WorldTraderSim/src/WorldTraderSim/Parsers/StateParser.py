@@ -4,7 +4,7 @@ import logging
 from typing import List
 
 # Local Modules
-import Constants
+from .. import Constants
 
 def read_csv(file_path: str) -> List[dict]:
   entries = []
@@ -0,0 +1,93 @@
+# Standard Libraries
+import json
+import logging
+import os
+from typing import Dict, List, Set
+
+# Local Modules
+from ..DataTypes import ResourceQuantity
+from ..DataTypes import ResourceTemplate
+from ..DataTypes import TransformTemplate
+
+CATALOG_EXTENSION = ".json"
+
+# A catalog is a directory of JSON files, each holding one template or a list of templates
+#   {"name": "Housing", "inputs": {"Population": 5, ...}, "outputs": {"Housing": 1, ...}}
+# Every file is read in a single pass and all problems are reported together before any action is built
+
+
+def build_resource_quantities(quantities: Dict, location: str, errors: List[str]) -> List[ResourceQuantity]:
+  resource_quantities = []
+  if not isinstance(quantities, dict):
+    errors.append("{} must map resource names to quantities".format(location))
+    return resource_quantities
+  for resource_name, quantity in quantities.items():
+    # bool is an int subclass, reject it explicitly
+    if not isinstance(quantity, int) or isinstance(quantity, bool) or quantity < 1:
+      errors.append("{} {} must be a positive integer, got {!r}".format(location, resource_name, quantity))
+      continue
+    resource_quantities.append(ResourceQuantity(name=resource_name, quantity=quantity))
+  return resource_quantities
+
+def build_transform_template(entry: Dict, location: str, errors: List[str]) -> TransformTemplate:
+  if not isinstance(entry, dict) or not entry.get("name"):
+    errors.append("{} must be an object with a name".format(location))
+    return None
+  location = "{} {}".format(location, entry["name"])
+  return TransformTemplate(
+    name=entry["name"],
+    inputs=build_resource_quantities(entry.get("inputs", {}), location + " inputs", errors),
+    outputs=build_resource_quantities(entry.get("outputs", {}), location + " outputs", errors)
+  )
+
+def parse_catalog(catalog_path: str) -> List[TransformTemplate]:
+  errors = []
+  transform_templates = []
+  for file_name in sorted(os.listdir(catalog_path)):
+    if not file_name.endswith(CATALOG_EXTENSION):
+      continue
+    with open(os.path.join(catalog_path, file_name)) as file:
+      try:
+        contents = json.load(file)
+      except json.JSONDecodeError as error:
+        errors.append("{} is not valid JSON, {}".format(file_name, error))
+        continue
+    entries = contents if isinstance(contents, list) else [contents]
+    for entry in entries:
+      transform_template = build_transform_template(entry, file_name, errors)
+      if transform_template is not None:
+        transform_templates.append(transform_template)
+
+  names = [transform_template.name for transform_template in transform_templates]
+  for name in sorted(set(name for name in names if names.count(name) > 1)):
+    errors.append("Template {} is defined more than once".format(name))
+  if not transform_templates and not errors:
+    errors.append("No {} templates found in {}".format(CATALOG_EXTENSION, catalog_path))
+  if errors:
+    raise Exception("Invalid template catalog {}\n  {}".format(catalog_path, "\n  ".join(errors)))
+  return transform_templates
+
+# Every resource a catalog template names must be defined in the resources file, otherwise it would be
+# registered as a new state entry with no weight and never count towards state quality
+def validate_resources(transform_templates: List[TransformTemplate], resources: List[ResourceTemplate]):
+  defined = set(resource.name for resource in resources)
+  errors = []
+  for transform_template in transform_templates:
+    undefined = sorted(set(resource_quantity.name for resource_quantity in transform_template.inputs + transform_template.outputs) - defined)
+    if undefined:
+      errors.append("Template {} uses undefined resources {}".format(transform_template.name, ", ".join(undefined)))
+  if errors:
+    raise Exception("Template resources missing from the resources file\n  {}".format("\n  ".join(errors)))
+
+# .tmpl libraries are shared by resource files that only weight some of their tiers, their undefined
+# resources are registered with no weight and reported once so typos are easy to spot
+def unweighted_resources(transform_templates: List[TransformTemplate], resources: List[ResourceTemplate]) -> Set[str]:
+  weighted = set(resource.name for resource in resources)
+  unweighted = set()
+  for transform_template in transform_templates:
+    for resource_quantity in transform_template.inputs + transform_template.outputs:
+      if resource_quantity.name not in weighted:
+        unweighted.add(resource_quantity.name)
+  if unweighted:
+    logging.warning("Template resources without a weight count 0 towards state quality: {}".format(", ".join(sorted(unweighted))))
+  return unweighted
@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 from typing import Dict, List, Optional
-from DataTypes import Action, Country, Heuristic
+from ..DataTypes import Action, Country, Heuristic
 from .Problem import Problem
 
 class ExplicitGraph(Problem):
@@ -3,8 +3,8 @@
 
 from __future__ import annotations
 from typing import Dict, List, Optional, Union
-from DataTypes import Action, Country, Heuristic, Solution
-from SearchStrategies import SearchStrategy
+from ..DataTypes import Action, Country, Heuristic, Solution
+from ..SearchStrategies import SearchStrategy
 
 class Problem(object):
 
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+from configparser import ConfigParser
+import logging
+import math
+
+import numpy as np
+
+from ..DataTypes.ZobristHasher import MASK_64, splitmix64
+from .ReachedStore import ReachedStore
+
+DEFAULT_EXPECTED_SIZE = 1000000
+DEFAULT_FALSE_POSITIVE_RATE = 0.001
+
+# Approximate reached set, a false positive prunes a state that was never actually reached
+# Sized from the expected number of states and the acceptable false positive rate, path costs
+# are not tracked so a state is only ever reported as new once
+class BloomFilterReachedStore(ReachedStore):
+
+   def __init__(self, expected_size: int = DEFAULT_EXPECTED_SIZE, false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE) -> None:
+      super().__init__()
+      if not 0.0 < false_positive_rate < 1.0:
+         raise Exception("Bloom filter false positive rate must be between 0 and 1, got {}".format(false_positive_rate))
+      self.expected_size = max(1, expected_size)
+      self.false_positive_rate = false_positive_rate
+      self.bit_count = max(8, int(math.ceil(-self.expected_size * math.log(false_positive_rate) / (math.log(2) ** 2))))
+      self.hash_count = max(1, int(round(self.bit_count / self.expected_size * math.log(2))))
+      self.bits = np.zeros((self.bit_count + 7) // 8, dtype=np.uint8)
+      self.size = 0
+      self.warned = False
+
+   def _bit_indices(self, key: int):
+      # Double hashing, h1 + i*h2 for each of the hash functions
+      first = splitmix64(key & MASK_64)
+      second = splitmix64(first) | 1
+      bit_count = self.bit_count
+      return [(first + index * second) % bit_count for index in range(self.hash_count)]
+
+   def add(self, key: int, cost: float = 0.0) -> bool:
+      bits = self.bits
+      is_new = False
+      for bit_index in self._bit_indices(key):
+         byte_index = bit_index >> 3
+         mask = 1 << (bit_index & 7)
+         if not bits[byte_index] & mask:
+            bits[byte_index] |= mask
+            is_new = True
+      if is_new:
+         self.size += 1
+         if self.size > self.expected_size and not self.warned:
+            logging.warning(f"Bloom filter exceeded its expected size of {self.expected_size}, false positive rate will exceed {self.false_positive_rate}")
+            self.warned = True
+      return is_new
+
+   def __contains__(self, key: int) -> bool:
+      bits = self.bits
+      return all(bits[bit_index >> 3] & (1 << (bit_index & 7)) for bit_index in self._bit_indices(key))
+
+   def __len__(self) -> int:
+      return self.size
+
+   def memory_bytes(self) -> int:
+      return self.bits.nbytes
+
+   def describe(self) -> str:
+      return f"{super().describe()}, Hash Functions = {self.hash_count}, Target False Positive Rate = {self.false_positive_rate}"
+
+   @classmethod
+   def from_config(cls, config: ConfigParser) -> BloomFilterReachedStore:
+      return cls(
+         config.getint("Search", "ReachedExpectedSize", fallback=DEFAULT_EXPECTED_SIZE),
+         config.getfloat("Search", "ReachedFalsePositiveRate", fallback=DEFAULT_FALSE_POSITIVE_RATE)
+      )
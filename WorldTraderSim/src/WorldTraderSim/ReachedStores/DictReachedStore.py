@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+import sys
+from typing import Dict, Iterator
+
+from .ReachedStore import ReachedStore
+
+# Bytes of the int key and float cost objects held for every entry besides the dict itself
+ENTRY_OBJECT_BYTES = sys.getsizeof(1 << 63) + sys.getsizeof(0.0)
+
+# Exact reached set as a dict of 64-bit key to best path cost
+# The fastest exact store as every probe stays in C, at about 100 bytes per key against the
+# 32 to 64 bytes of the HashTable store
+class DictReachedStore(ReachedStore):
+
+   def __init__(self) -> None:
+      super().__init__()
+      self.costs: Dict[int, float] = {}
+
+   def add(self, key: int, cost: float = 0.0) -> bool:
+      reached_cost = self.costs.get(key)
+      if reached_cost is None or cost < reached_cost:
+         self.costs[key] = cost
+         return True
+      return False
+
+   def __contains__(self, key: int) -> bool:
+      return key in self.costs
+
+   def __len__(self) -> int:
+      return len(self.costs)
+
+   def __iter__(self) -> Iterator[int]:
+      return iter(self.costs)
+
+   def clear(self):
+      self.costs.clear()
+
+   def memory_bytes(self) -> int:
+      return sys.getsizeof(self.costs) + len(self.costs) * ENTRY_OBJECT_BYTES
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+from configparser import ConfigParser
+import logging
+import os
+import shutil
+import tempfile
+from typing import List, Optional
+
+import numpy as np
+
+from .DictReachedStore import DictReachedStore
+from .ReachedStore import ReachedStore
+
+DEFAULT_SPILL_THRESHOLD = 1000000
+MAX_SPILLED_RUNS = 8
+# Keys read from each run at a time while merging
+MERGE_BLOCK_SIZE = 65536
+
+# Exact reached set for runs too large to hold in memory
+# Keys collect in an in-memory dict, once it holds spill_threshold keys they are written
+# to disk as a sorted run and memory mapped, lookups binary search each run
+# Runs are merged once there are more than MAX_SPILLED_RUNS of them, streaming blocks of every run
+# into a memory mapped output so at most one block per run is held in memory
+# Path costs are only tracked for keys still held in memory
+class DiskSpillReachedStore(ReachedStore):
+
+   def __init__(self, spill_threshold: int = DEFAULT_SPILL_THRESHOLD, spill_directory: Optional[str] = None) -> None:
+      super().__init__()
+      self.spill_threshold = max(1, spill_threshold)
+      self.spill_directory = tempfile.mkdtemp(prefix="reached-", dir=spill_directory or None)
+      self.memory = DictReachedStore()
+      self.runs: List[np.ndarray] = []
+      self.run_count = 0
+      self.spilled_size = 0
+
+   def _spilled(self, key: int) -> bool:
+      key = np.uint64(key)
+      for run in self.runs:
+         index = np.searchsorted(run, key)
+         if index < len(run) and run[index] == key:
+            return True
+      return False
+
+   def add(self, key: int, cost: float = 0.0) -> bool:
+      if key not in self.memory and self._spilled(key):
+         return False
+      is_new = self.memory.add(key, cost)
+      if len(self.memory) >= self.spill_threshold:
+         self._spill()
+      return is_new
+
+   def __contains__(self, key: int) -> bool:
+      return key in self.memory or self._spilled(key)
+
+   def __len__(self) -> int:
+      return len(self.memory) + self.spilled_size
+
+   def _write_run(self, keys: np.ndarray) -> np.ndarray:
+      run_path = os.path.join(self.spill_directory, f"run-{self.run_count}.npy")
+      self.run_count += 1
+      np.save(run_path, keys)
+      return np.load(run_path, mmap_mode="r")
+
+   def _spill(self):
+      keys = np.fromiter(self.memory, dtype=np.uint64, count=len(self.memory))
+      keys.sort()
+      self.runs.append(self._write_run(keys))
+      self.spilled_size += len(keys)
+      self.memory.clear()
+      logging.info(f"Spilled {len(keys)} reached keys to disk, {self.spilled_size} keys across {len(self.runs)} runs")
+
+      if len(self.runs) > MAX_SPILLED_RUNS:
+         self._merge_runs()
+
+   # k-way merge of the sorted runs, keys never repeat across runs as add checks them first
+   def _merge_runs(self):
+      runs = self.runs
+      total = sum(len(run) for run in runs)
+      merged_path = os.path.join(self.spill_directory, f"run-{self.run_count}.npy")
+      self.run_count += 1
+      merged = np.lib.format.open_memmap(merged_path, mode="w+", dtype=np.uint64, shape=(total,))
+
+      positions = [0] * len(runs)
+      written = 0
+      while written < total:
+         # Every key up to the smallest last key of a block that does not end its run is final
+         bound = None
+         for run, position in zip(runs, positions):
+            end = position + MERGE_BLOCK_SIZE
+            if end < len(run) and (bound is None or run[end - 1] < bound):
+               bound = run[end - 1]
+         blocks = []
+         for index, run in enumerate(runs):
+            block = run[positions[index]:positions[index] + MERGE_BLOCK_SIZE]
+            if bound is not None:
+               block = block[:np.searchsorted(block, bound, side="right")]
+            positions[index] += len(block)
+            blocks.append(block)
+         block = np.sort(np.concatenate(blocks))
+         merged[written:written + len(block)] = block
+         written += len(block)
+      merged.flush()
+      del merged
+
+      old_paths = [run.filename for run in runs]
+      self.runs = [np.load(merged_path, mmap_mode="r")]
+      del runs
+      for old_path in old_paths:
+         os.remove(old_path)
+      logging.info(f"Merged {len(old_paths)} reached runs into one of {total} keys")
+
+   def memory_bytes(self) -> int:
+      return self.memory.memory_bytes()
+
+   def disk_bytes(self) -> int:
+      return sum(run.nbytes for run in self.runs)
+
+   def describe(self) -> str:
+      return f"{super().describe()}, Disk = {self.disk_bytes()} bytes across {len(self.runs)} runs"
+
+   def close(self):
+      self.runs = []
+      shutil.rmtree(self.spill_directory, ignore_errors=True)
+
+   @classmethod
+   def from_config(cls, config: ConfigParser) -> DiskSpillReachedStore:
+      return cls(
+         config.getint("Search", "ReachedSpillThreshold", fallback=DEFAULT_SPILL_THRESHOLD),
+         config.get("Search", "ReachedSpillDirectory", fallback=None)
+      )
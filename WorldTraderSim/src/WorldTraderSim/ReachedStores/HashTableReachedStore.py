@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+from configparser import ConfigParser
+from typing import Iterator
+
+import numpy as np
+
+from .ReachedStore import ReachedStore
+
+EMPTY_KEY = 0
+DEFAULT_INITIAL_CAPACITY = 1 << 16
+MAX_LOAD_FACTOR = 0.5
+
+# Exact reached set of 64-bit keys in a NumPy open addressing table with linear probing
+# Keys are Zobrist hashes and already well mixed, so the low bits index the table directly
+# Zero marks an empty slot, a reached zero key is tracked separately
+class HashTableReachedStore(ReachedStore):
+
+   def __init__(self, initial_capacity: int = DEFAULT_INITIAL_CAPACITY) -> None:
+      super().__init__()
+      capacity = 1
+      while capacity < initial_capacity:
+         capacity <<= 1
+      self.keys = np.zeros(capacity, dtype=np.uint64)
+      self.costs = np.zeros(capacity, dtype=np.float64)
+      self.mask = capacity - 1
+      self.size = 0
+      self.zero_cost = None
+
+   def _slot(self, key: int) -> int:
+      keys = self.keys
+      mask = self.mask
+      slot = key & mask
+      while True:
+         slot_key = keys[slot]
+         if slot_key == key or slot_key == EMPTY_KEY:
+            return slot
+         slot = (slot + 1) & mask
+
+   def add(self, key: int, cost: float = 0.0) -> bool:
+      if key == EMPTY_KEY:
+         if self.zero_cost is None or cost < self.zero_cost:
+            self.size += self.zero_cost is None
+            self.zero_cost = cost
+            return True
+         return False
+
+      slot = self._slot(key)
+      if self.keys[slot] == EMPTY_KEY:
+         self.keys[slot] = key
+         self.costs[slot] = cost
+         self.size += 1
+         if self.size > MAX_LOAD_FACTOR * len(self.keys):
+            self._grow()
+         return True
+      if cost < self.costs[slot]:
+         self.costs[slot] = cost
+         return True
+      return False
+
+   def __contains__(self, key: int) -> bool:
+      if key == EMPTY_KEY:
+         return self.zero_cost is not None
+      return self.keys[self._slot(key)] == key
+
+   def __len__(self) -> int:
+      return self.size
+
+   def __iter__(self) -> Iterator[int]:
+      if self.zero_cost is not None:
+         yield EMPTY_KEY
+      yield from (int(key) for key in self.keys[self.keys != EMPTY_KEY])
+
+   def _grow(self):
+      occupied = self.keys != EMPTY_KEY
+      keys = self.keys[occupied]
+      costs = self.costs[occupied]
+      capacity = len(self.keys) * 2
+      self.keys = np.zeros(capacity, dtype=np.uint64)
+      self.costs = np.zeros(capacity, dtype=np.float64)
+      self.mask = capacity - 1
+      for key, cost in zip(keys.tolist(), costs.tolist()):
+         slot = self._slot(key)
+         self.keys[slot] = key
+         self.costs[slot] = cost
+
+   def clear(self):
+      self.keys[:] = EMPTY_KEY
+      self.size = 0
+      self.zero_cost = None
+
+   def memory_bytes(self) -> int:
+      return self.keys.nbytes + self.costs.nbytes
+
+   @classmethod
+   def from_config(cls, config: ConfigParser) -> HashTableReachedStore:
+      return cls(config.getint("Search", "ReachedInitialCapacity", fallback=DEFAULT_INITIAL_CAPACITY))
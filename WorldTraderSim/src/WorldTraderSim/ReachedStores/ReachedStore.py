@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+from configparser import ConfigParser
+
+# Records the 64-bit state hashes a search has already reached
+class ReachedStore(object):
+
+   def add(self, key: int, cost: float = 0.0) -> bool:
+      '''Returns True when key was not reached before, or was reached with a higher path cost'''
+      raise NotImplementedError('ERROR: This method must be overridden by a concrete reached store implementation')
+
+   def __contains__(self, key: int) -> bool:
+      raise NotImplementedError('ERROR: This method must be overridden by a concrete reached store implementation')
+
+   def __len__(self) -> int:
+      raise NotImplementedError('ERROR: This method must be overridden by a concrete reached store implementation')
+
+   def memory_bytes(self) -> int:
+      raise NotImplementedError('ERROR: This method must be overridden by a concrete reached store implementation')
+
+   def describe(self) -> str:
+      return f"{type(self).__name__} Size = {len(self)}, Memory = {self.memory_bytes()} bytes"
+
+   def close(self):
+      pass
+
+   @classmethod
+   def from_config(cls, config: ConfigParser) -> ReachedStore:
+      return cls()
@@ -0,0 +1,20 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from .ReachedStore import ReachedStore
+from .BloomFilterReachedStore import BloomFilterReachedStore
+from .DictReachedStore import DictReachedStore
+from .DiskSpillReachedStore import DiskSpillReachedStore
+from .HashTableReachedStore import HashTableReachedStore
+
+def reached_store_factory(reached_store_name: str) -> ReachedStore:
+    if reached_store_name == "Dict":
+        return DictReachedStore
+    if reached_store_name == "HashTable":
+        return HashTableReachedStore
+    if reached_store_name == "BloomFilter":
+        return BloomFilterReachedStore
+    if reached_store_name == "DiskSpill":
+        return DiskSpillReachedStore
+    else:
+        raise Exception("Unrecognized Reached Store '{}'".format(reached_store_name))
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+from configparser import ConfigParser
+import heapq
+import logging
+from typing import Dict, List, Tuple, Union
+
+from ..DataTypes import Action, ActionTable, Country, Heuristic, Node, Solution, Tracer
+from ..ReachedStores import ReachedStore
+from .SearchStrategy import SearchStrategy
+
+DEFAULT_BEAM_WIDTH = 10
+
+# Expands every node of the beam one depth at a time and keeps only the best BEAM_WIDTH children
+# by the heuristic, so memory is bounded by width x branching and runtime grows linearly with depth
+class BeamSearch(SearchStrategy):
+
+   BEAM_WIDTH: int
+
+   def __init__(self, tree_based_search: bool, depth_bound: int, frontier_size: int) -> None:
+      super().__init__(tree_based_search, depth_bound, frontier_size)
+      self.BEAM_WIDTH = DEFAULT_BEAM_WIDTH
+
+   def configure(self, config: ConfigParser):
+      super().configure(config)
+      beam_width = config.getint("Search", "BeamWidth", fallback=None)
+      if beam_width is not None:
+         if beam_width < 1:
+            raise Exception("Beam width must be at least 1, got '{}'".format(beam_width))
+         logging.info(f"BeamSearch set beam width to {beam_width}")
+         self.BEAM_WIDTH = beam_width
+
+   def _expand(self, actions: Union[List[Action], ActionTable], heuristic: Heuristic, node: Node) -> List[Tuple[Node, float]]:
+      return self._evaluated_children(actions, heuristic, node, lambda parent, action: parent.PATH_COST + action.ACTION_COST)
+
+   def _search(self, country_states: Dict[str, Country], actions: Union[List[Action], ActionTable], heuristic: Heuristic, reached: Union[ReachedStore, None]) -> Solution:
+      visited = []
+      node = Node(country_states, None, None, 0.0)
+      if reached is not None:
+         reached.add(node.state_hash(), node.PATH_COST)
+      beam = [ node ]
+      max_children = 0
+      while node.depth() < self.DEPTH_BOUND:
+         children = []
+         for node in beam:
+            visited.append(node)
+            if self._budget_exhausted(node):
+               return self._anytime_solution(visited)
+            expanded = self._expand(actions, heuristic, node)
+            if reached is not None:
+               self._hash_children([child for child, _utility in expanded])
+            for child, utility in expanded:
+               if reached is None or reached.add(child.state_hash(), child.PATH_COST):
+                  children.append((child, utility))
+               else:
+                  self.stats.duplicates_pruned += 1
+                  if Tracer.ENABLED:
+                     Tracer.record("duplicate", parent=node.ID, child=child.ID)
+            self._release_states(node, [child for child, _utility in expanded])
+         max_children = max(max_children, len(children))
+         self.stats.record_frontier(len(children))
+         if not children:
+            logging.info(f"Beam exhausted at depth {beam[0].depth()}")
+            break
+         # nlargest is stable so equal children keep their expansion order
+         beam = [child for child, _utility in heapq.nlargest(self.BEAM_WIDTH, children, key=lambda evaluated: evaluated[1])]
+         self.stats.frontier_dropped += len(children) - len(beam)
+         node = beam[0]
+
+      logging.info(f"Max Beam Children = {max_children}")
+      return Solution(beam[0], visited)
+
+   def search_with_reached(self, country_states: Dict[str, Country], actions: Union[List[Action], ActionTable], heuristic: Heuristic, reached: ReachedStore) -> Solution:
+      return self._search(country_states, actions, heuristic, reached)
+
+   def search_without_reached(self, country_states: Dict[str, Country], actions: Union[List[Action], ActionTable], heuristic: Heuristic) -> Solution:
+      return self._search(country_states, actions, heuristic, None)
+
+   def search(self, country_states: Dict[str, Country], actions: Union[List[Action], ActionTable], heuristic: Heuristic) -> Solution:
+      logging.info(f"Beam Width = {self.BEAM_WIDTH}")
+      return self._run_search(country_states, actions, heuristic)
@@ -3,55 +3,79 @@
 
 from __future__ import annotations
 import logging
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
-from DataTypes import Action, Country, Heuristic, Node, PriorityQueue, Solution
+from ..DataTypes import Action, ActionTable, Country, Heuristic, Node, PriorityQueue, Solution, Tracer
+from ..ReachedStores import ReachedStore
 from .SearchStrategy import SearchStrategy
 
 class BestFirstSearch(SearchStrategy):
-   def _expand(self, actions: List[Action], heuristic: Heuristic, node: Node) -> List[Node]:
-      nodes = PriorityQueue(lambda node: heuristic.apply(node), False)
-      for action in actions:
-         next_state = action.apply(node.STATE)
-         if next_state is not None:
-            logging.debug(node.STATE)
-            logging.debug(action.ACTION_TYPE)
-            nodes.add(Node(next_state, node, action, node.PATH_COST + action.ACTION_COST))
-      return nodes.as_list()
+   # Children best first with the heuristic values they were scored with, so the frontier never scores them again
+   def _expand(self, actions: Union[List[Action], ActionTable], heuristic: Heuristic, node: Node) -> List[Tuple[Node, float]]:
+      utilities = {}
+      nodes = PriorityQueue(lambda child: utilities[child.ID], False)
+      for child, utility in self._evaluated_children(actions, heuristic, node, lambda parent, action: parent.PATH_COST + action.ACTION_COST):
+         if Tracer.ENABLED:
+            Tracer.record("child", parent=node.ID, child=child.ID, action=child.PARENT_ACTION.INDEX, utility=utility)
+         utilities[child.ID] = utility
+         nodes.add(child)
+      return [(child, utilities[child.ID]) for child in nodes.as_list()]
 
-   def search_with_reached(self, country_states: Dict[str, Country], actions: List[Action], heuristic: Union[Heuristic, None]) -> Solution:
+   def search_with_reached(self, country_states: Dict[str, Country], actions: Union[List[Action], ActionTable], heuristic: Union[Heuristic, None], reached: ReachedStore) -> Solution:
       visited = []
       node = Node(country_states, None, None, 0.0)
-      frontier = PriorityQueue(lambda node: heuristic.apply(node), True).add(node)
-      reached = { node.state_hash(): node }
+      frontier = PriorityQueue(lambda node: heuristic.apply(node), True, self.MAX_FRONTIER_SIZE).add(node)
+      reached.add(node.state_hash(), node.PATH_COST)
       while not frontier.is_empty():
          node = frontier.pop()
-         visited.append(node.STATE)
+         visited.append(node)
          if node.depth() >= self.DEPTH_BOUND:
+            self._log_frontier(frontier)
             return Solution(node, visited)
-         for child in self._expand(actions, heuristic, node):
-            child_state_hash = child.state_hash()
-            if child_state_hash not in reached or child.PATH_COST < reached[child_state_hash].PATH_COST:
-               reached[child_state_hash] = child
-               if frontier.length() < self.MAX_FRONTIER_SIZE:
-                  frontier.add(child)
-      return Solution(None)
+         if self._budget_exhausted(node):
+            self._log_frontier(frontier)
+            return self._anytime_solution(visited)
+         evaluated = self._expand(actions, heuristic, node)
+         children = [child for child, _utility in evaluated]
+         self._hash_children(children)
+         for child, utility in evaluated:
+            # New states and states reached again with a lower path cost are queued
+            if reached.add(child.state_hash(), child.PATH_COST):
+               frontier.add(child, utility)
+            else:
+               self.stats.duplicates_pruned += 1
+         self.stats.record_frontier(frontier.length())
+         self._release_states(node, children)
+      self._log_frontier(frontier)
+      return Solution(None, visited)
 
-   def search_without_reached(self, country_states: Dict[str, Country], actions: List[Action], heuristic: Union[Heuristic, None]) -> Solution:
+   def search_without_reached(self, country_states: Dict[str, Country], actions: Union[List[Action], ActionTable], heuristic: Union[Heuristic, None]) -> Solution:
       visited = []
       node = Node(country_states, None, None, 0.0)
-      frontier = PriorityQueue(lambda node: heuristic.apply(node), True).add(node)
+      frontier = PriorityQueue(lambda node: heuristic.apply(node), True, self.MAX_FRONTIER_SIZE).add(node)
       while not frontier.is_empty():
          node = frontier.pop()
-         visited.append(node.STATE)
+         visited.append(node)
          if node.depth() >= self.DEPTH_BOUND:
+            self._log_frontier(frontier)
             return Solution(node, visited)
-         for child in self._expand(actions, heuristic, node):
-            if frontier.length() < self.MAX_FRONTIER_SIZE:
-               frontier.add(child)
-      return Solution(None)
+         if self._budget_exhausted(node):
+            self._log_frontier(frontier)
+            return self._anytime_solution(visited)
+         evaluated = self._expand(actions, heuristic, node)
+         children = [child for child, _utility in evaluated]
+         for child, utility in evaluated:
+            frontier.add(child, utility)
+         self.stats.record_frontier(frontier.length())
+         self._release_states(node, children)
+      self._log_frontier(frontier)
+      return Solution(None, visited)
 
-   def search(self, country_states: Dict[str, Country], actions: List[Action], heuristic: Union[Heuristic, None]) -> Solution:
+   def _log_frontier(self, frontier: PriorityQueue):
+      # Once the frontier is full, children that beat the worst queued node evict it
+      self.stats.frontier_dropped = frontier.evicted_count + frontier.dropped_count
+      logging.info(f"Frontier Evicted = {frontier.evicted_count}, Dropped = {frontier.dropped_count}")
+
+   def search(self, country_states: Dict[str, Country], actions: Union[List[Action], ActionTable], heuristic: Union[Heuristic, None]) -> Solution:
       logging.info(f"Searching with frontier size {self.MAX_FRONTIER_SIZE}")
-      search_function = self.search_without_reached if self.TREE_BASED_SEARCH else self.search_with_reached
-      return search_function(country_states, actions, heuristic)
+      return self._run_search(country_states, actions, heuristic)
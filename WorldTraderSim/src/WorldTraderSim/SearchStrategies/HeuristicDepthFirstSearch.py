@@ -3,22 +3,23 @@
 
 from __future__ import annotations
 import logging
-from typing import Dict, List
+from typing import Dict, List, Union
 
-from DataTypes import Action, Country, Heuristic, Node, PriorityQueue, Solution
+from ..DataTypes import Action, ActionTable, Country, Heuristic, Node, PriorityQueue, Solution, Tracer
+from ..ReachedStores import ReachedStore
 from .SearchStrategy import SearchStrategy
 
 class HeuristicDepthFirstSearch(SearchStrategy):
    expand_count = 1
 
-   def _expand(self, actions: List[Action], heuristic: Heuristic, node: Node) -> List[Node]:
-      nodes = PriorityQueue(lambda node: heuristic.apply(node), True)
-      for action in actions:
-         next_state = action.apply(node.STATE)
-         if next_state is not None:
-            logging.debug(node.STATE)
-            logging.debug(action.ACTION_TYPE)
-            nodes.add(Node(next_state, node, action, 0))
+   def _expand(self, actions: Union[List[Action], ActionTable], heuristic: Heuristic, node: Node) -> List[Node]:
+      utilities = {}
+      nodes = PriorityQueue(lambda child: utilities[child.ID], True)
+      for child, utility in self._evaluated_children(actions, heuristic, node, lambda parent, action: 0):
+         if Tracer.ENABLED:
+            Tracer.record("child", parent=node.ID, child=child.ID, action=child.PARENT_ACTION.INDEX, utility=utility)
+         utilities[child.ID] = utility
+         nodes.add(child)
 
       node_list = nodes.as_list()
       if self.expand_count % 10 == 0:
@@ -27,25 +28,34 @@ class HeuristicDepthFirstSearch(SearchStrategy):
       self.expand_count += 1
       return node_list
 
-   def search_with_reached(self, country_states: Dict[str, Country], actions: List[Action], heuristic: Heuristic) -> Solution:
+   def search_with_reached(self, country_states: Dict[str, Country], actions: Union[List[Action], ActionTable], heuristic: Heuristic, reached: ReachedStore) -> Solution:
       max_frontier_length = 1
       visited = []
       node = Node(country_states, None, None, 0.0)
       frontier = [ node ]
-      reached = [ node.state_hash() ]
+      reached.add(node.state_hash())
       while len(frontier):
          node = frontier.pop()
-         visited.append(node.STATE)
+         visited.append(node)
          if node.depth() < self.DEPTH_BOUND:
-            for child in self._expand(actions, heuristic, node):
-               if child.state_hash() not in reached:
-                  reached.append(child.state_hash())
+            if self._budget_exhausted(node):
+               return self._anytime_solution(visited)
+            children = self._expand(actions, heuristic, node)
+            self._hash_children(children)
+            for child in children:
+               if reached.add(child.state_hash()):
                   if len(frontier) < self.MAX_FRONTIER_SIZE:
                      frontier.append(child)
+                  else:
+                     self.stats.frontier_dropped += 1
                else:
-                  logging.debug("CHILD DETECTED AS REACHED")
+                  self.stats.duplicates_pruned += 1
+                  if Tracer.ENABLED:
+                     Tracer.record("duplicate", parent=node.ID, child=child.ID)
+            self._release_states(node, children)
             
             new_frontier_length = len(frontier)
+            self.stats.record_frontier(new_frontier_length)
             if new_frontier_length > max_frontier_length:
                max_frontier_length = new_frontier_length
          else:
@@ -54,21 +64,27 @@ class HeuristicDepthFirstSearch(SearchStrategy):
       logging.info(f"Max Frontier Length {max_frontier_length}")
       return Solution(node, visited)
 
-   def search_without_reached(self, country_states: Dict[str, Country], actions: List[Action], heuristic: Heuristic) -> Solution:
+   def search_without_reached(self, country_states: Dict[str, Country], actions: Union[List[Action], ActionTable], heuristic: Heuristic) -> Solution:
       visited = []
       frontier = [ Node(country_states, None, None, 0.0) ]
       while len(frontier):
          node = frontier.pop()
-         visited.append(node.STATE)
+         visited.append(node)
          if node.depth() < self.DEPTH_BOUND:
-            for child in self._expand(actions, heuristic, node):
+            if self._budget_exhausted(node):
+               return self._anytime_solution(visited)
+            children = self._expand(actions, heuristic, node)
+            for child in children:
                if len(frontier) < self.MAX_FRONTIER_SIZE:
                   frontier.append(child)
+               else:
+                  self.stats.frontier_dropped += 1
+            self.stats.record_frontier(len(frontier))
+            self._release_states(node, children)
          else:
             return Solution(node, visited)
       return Solution(node, visited)
 
-   def search(self, country_states: Dict[str, Country], actions: List[Action], heuristic: Heuristic) -> Solution:
+   def search(self, country_states: Dict[str, Country], actions: Union[List[Action], ActionTable], heuristic: Heuristic) -> Solution:
       logging.info(f"Max Frontier Size = {self.MAX_FRONTIER_SIZE}")
-      search_function = self.search_without_reached if self.TREE_BASED_SEARCH else self.search_with_reached
-      return search_function(country_states, actions, heuristic)
+      return self._run_search(country_states, actions, heuristic)
@@ -2,23 +2,343 @@
 # -*- coding: utf-8 -*-
 
 from __future__ import annotations
-from typing import List, Union
-from DataTypes import Action, Country, Heuristic, Solution
+from configparser import ConfigParser
+import copy
+import logging
+import pickle
+import signal
+import threading
+import time
+from typing import Callable, Dict, List, Tuple, Union
+
+import numpy as np
+
+from ..DataTypes import Action, ActionDependencyIndex, ActionTable, Country, Heuristic, Node, SearchStats, Solution, Tracer, WorldState
+from ..ReachedStores import DictReachedStore, ReachedStore, reached_store_factory
 
 DEFAULT_DEPTH_BOUND = 10
 DEFAULT_MAX_FRONTIER_SIZE = 100
 
+# Strategy, actions and heuristic of the running search, handed to forked child evaluation workers
+CHILD_EVALUATION_CONTEXT: Tuple[SearchStrategy, Union[List[Action], ActionTable], Heuristic] = None
+
+def init_child_worker(search_strategy: SearchStrategy, actions: Union[List[Action], ActionTable], heuristic: Heuristic):
+   global CHILD_EVALUATION_CONTEXT
+   CHILD_EVALUATION_CONTEXT = (search_strategy, actions, heuristic)
+
+# Builds and scores the children of the action positions [start, stop) of a pickled parent, returning
+# each child's state with its heuristic value and the quality deltas the evaluator cached on it
+# Dict states only return the countries the action modified, the rest are the parent's
+def evaluate_children(parent_bytes: bytes, start: int, stop: int) -> List[Tuple[int, Union[Dict[str, Country], WorldState], float, Dict[str, float]]]:
+   search_strategy, actions, heuristic = CHILD_EVALUATION_CONTEXT
+   parent = pickle.loads(parent_bytes)
+   children = []
+   for position, action, next_state in search_strategy._successors(actions, parent, start, stop):
+      child = Node(next_state, parent, action, parent.PATH_COST + action.ACTION_COST)
+      utility = heuristic.apply(child)
+      if not isinstance(next_state, WorldState):
+         next_state = {country_name: next_state[country_name] for country_name, _resource_name, _delta in action.EFFECTS}
+      children.append((position, next_state, utility, child.QUALITY_DELTAS))
+   return children
+
+def merge_child_state(parent_state: Union[Dict[str, Country], WorldState], child_state: Union[Dict[str, Country], WorldState]) -> Union[Dict[str, Country], WorldState]:
+   if isinstance(child_state, WorldState):
+      return child_state
+   # Unmodified countries are shared or deep copied as Action.next_state would have
+   if Action.COPY_ON_WRITE:
+      country_states = dict(parent_state)
+      country_states.update(child_state)
+      return country_states
+   return {country_name: child_state[country_name] if country_name in child_state else copy.deepcopy(country) for country_name, country in parent_state.items()}
+
 class SearchStrategy(object):
 
    DEPTH_BOUND: int
    MAX_FRONTIER_SIZE: int
    TREE_BASED_SEARCH: bool
+   REACHED_STORE: Callable[[], ReachedStore]
+   BATCH_EXPANSION: bool
+   INCREMENTAL_APPLICABILITY: bool
+   # Anytime budgets, None is unlimited
+   TIME_BUDGET: Union[float, None]
+   EXPANSION_BUDGET: Union[int, None]
+   # Processes generating and scoring the children of each expanded node, 1 evaluates in process
+   CHILD_WORKERS: int
+   # Set by the parent of schedule workers when it is interrupted, a set event interrupts every search
+   STOP_EVENT = None
 
    def __init__(self, tree_based_search: bool, depth_bound: int = DEFAULT_DEPTH_BOUND, frontier_size: int = DEFAULT_MAX_FRONTIER_SIZE) -> None:
       super().__init__()
       self.TREE_BASED_SEARCH = tree_based_search
       self.DEPTH_BOUND = depth_bound
       self.MAX_FRONTIER_SIZE = frontier_size
+      self.REACHED_STORE = DictReachedStore
+      self.BATCH_EXPANSION = True
+      self.INCREMENTAL_APPLICABILITY = True
+      self.dependency_index = None
+      self.TIME_BUDGET = None
+      self.EXPANSION_BUDGET = None
+      self.CHILD_WORKERS = 1
+      self.child_pool = None
+      self.stats = SearchStats(type(self).__name__)
+      self._reset_budget()
+
+   def configure(self, config: ConfigParser):
+      reached_store_name = config.get("Search", "ReachedStore", fallback=None)
+      if reached_store_name is not None:
+         logging.info(f"SearchStrategy set reached store to {reached_store_name}")
+         reached_store_class = reached_store_factory(reached_store_name)
+         self.REACHED_STORE = lambda: reached_store_class.from_config(config)
+
+      batch_expansion = config.getboolean("Search", "BatchExpansion", fallback=None)
+      if batch_expansion is not None:
+         logging.info(f"SearchStrategy set batch expansion to {batch_expansion}")
+         self.BATCH_EXPANSION = batch_expansion
+
+      incremental_applicability = config.getboolean("Search", "IncrementalApplicability", fallback=None)
+      if incremental_applicability is not None:
+         logging.info(f"SearchStrategy set incremental applicability to {incremental_applicability}")
+         self.INCREMENTAL_APPLICABILITY = incremental_applicability
+
+      # Empty budgets are unlimited
+      time_budget = config.get("Search", "TimeBudget", fallback="")
+      if time_budget:
+         logging.info(f"SearchStrategy set time budget to {time_budget}s")
+         self.TIME_BUDGET = float(time_budget)
+
+      expansion_budget = config.get("Search", "ExpansionBudget", fallback="")
+      if expansion_budget:
+         logging.info(f"SearchStrategy set expansion budget to {expansion_budget}")
+         self.EXPANSION_BUDGET = int(expansion_budget)
+
+      child_workers = config.getint("Search", "ChildWorkers", fallback=None)
+      if child_workers is not None:
+         logging.info(f"SearchStrategy set child workers to {child_workers}")
+         self.CHILD_WORKERS = max(1, child_workers)
+
+   def _prepare_actions(self, initial_state: Union[Dict[str, Country], WorldState], actions: List[Action]) -> Union[List[Action], ActionTable]:
+      # Batch expansion needs the array engine, the table keeps the order of the given actions
+      if self.BATCH_EXPANSION and isinstance(initial_state, WorldState) and not isinstance(actions, ActionTable):
+         actions = ActionTable(actions, initial_state.REGISTRY)
+      # Positions in the index follow the order of the prepared actions
+      self.dependency_index = ActionDependencyIndex(actions) if self.INCREMENTAL_APPLICABILITY else None
+      return actions
+
+   def _applicable_rows(self, node: Node) -> np.ndarray:
+      # Children of expanded nodes only re-check the actions depending on what the last action changed
+      parent = node.PARENT
+      if node.APPLICABLE is None:
+         if parent is not None and parent.APPLICABLE is not None and node.PARENT_ACTION is not None:
+            node.APPLICABLE = self.dependency_index.update(parent.APPLICABLE, node.STATE, node.PARENT_ACTION.EFFECTS)
+         else:
+            node.APPLICABLE = self.dependency_index.applicable(node.STATE)
+      return np.flatnonzero(node.APPLICABLE)
+
+   def _successors(self, actions: Union[List[Action], ActionTable], node: Node, start: int = 0, stop: int = None) -> List[Tuple[int, Action, Union[Dict[str, Country], WorldState]]]:
+      # Applicable actions among the positions [start, stop) with their position and next state
+      stop = len(actions) if stop is None else stop
+      if self.dependency_index is not None or isinstance(actions, ActionTable):
+         rows = self._applicable_rows(node) if self.dependency_index is not None else actions.applicable(node.STATE)
+         if start > 0 or stop < len(actions):
+            rows = rows[(rows >= start) & (rows < stop)]
+         if isinstance(actions, ActionTable):
+            return [(position, action, next_state) for position, (action, next_state) in zip(rows.tolist(), actions.successors(node.STATE, rows))]
+         return [(position, actions[position], actions[position].next_state(node.STATE)) for position in rows.tolist()]
+      successors = []
+      for position in range(start, stop):
+         next_state = actions[position].apply(node.STATE)
+         if next_state is not None:
+            successors.append((position, actions[position], next_state))
+      return successors
+
+   def _evaluated_children(self, actions: Union[List[Action], ActionTable], heuristic: Heuristic, node: Node, path_cost_fn: Callable[[Node, Action], float]) -> List[Tuple[Node, float]]:
+      # Children in action order with their heuristic values, the same order and values with or without the child pool
+      self.stats.expanded += 1
+      if Tracer.ENABLED:
+         Tracer.record("expand", node=node.ID, depth=node.DEPTH, path_cost=node.PATH_COST)
+      if self.child_pool is None:
+         start = time.perf_counter()
+         children = [Node(next_state, node, action, path_cost_fn(node, action)) for _position, action, next_state in self._successors(actions, node)]
+         self.stats.apply_seconds += time.perf_counter() - start
+         self.stats.generated += len(children)
+
+         start = time.perf_counter()
+         evaluated = [(child, heuristic.apply(child)) for child in children]
+         self.stats.heuristic_seconds += time.perf_counter() - start
+         self._track_best(evaluated)
+         return evaluated
+
+      # The parent is cut from the path and pickled once per expansion, it is only complete
+      # once the evaluator has cached its quality deltas and the index its applicable actions
+      start = time.perf_counter()
+      if node.QUALITY_DELTAS is None:
+         heuristic.apply(node)
+      if self.dependency_index is not None:
+         self._applicable_rows(node)
+      parent = Node(node.STATE, None, None, node.PATH_COST)
+      parent.DEPTH = node.DEPTH
+      parent.IMPACTED = node.IMPACTED
+      parent.QUALITY_DELTAS = node.QUALITY_DELTAS
+      parent.APPLICABLE = node.APPLICABLE
+      parent_bytes = pickle.dumps(parent, pickle.HIGHEST_PROTOCOL)
+
+      # One range of action positions per worker, results come back in range order
+      action_count = len(actions)
+      chunk_size = -(-action_count // self.CHILD_WORKERS)
+      starts = list(range(0, action_count, chunk_size))
+      stops = [min(start + chunk_size, action_count) for start in starts]
+      built = [child for children in self.child_pool.map(evaluate_children, [parent_bytes]*len(starts), starts, stops) for child in children]
+      # Worker time covers both generating and scoring the children
+      self.stats.heuristic_seconds += time.perf_counter() - start
+
+      start = time.perf_counter()
+      evaluated = []
+      for position, next_state, utility, quality_deltas in built:
+         action = actions[position]
+         child = Node(merge_child_state(node.STATE, next_state), node, action, path_cost_fn(node, action))
+         child.QUALITY_DELTAS = quality_deltas
+         evaluated.append((child, utility))
+      self.stats.apply_seconds += time.perf_counter() - start
+      self.stats.generated += len(evaluated)
+      self._track_best(evaluated)
+      return evaluated
+
+   def _hash_children(self, children: List[Node]):
+      # Hashes are cached on the nodes, later state_hash calls are lookups
+      start = time.perf_counter()
+      for child in children:
+         child.state_hash()
+      self.stats.state_hash_seconds += time.perf_counter() - start
+
+   def _start_child_pool(self, actions: Union[List[Action], ActionTable], heuristic: Heuristic):
+      if self.CHILD_WORKERS <= 1:
+         return
+      # Imported on use, most searches never start a pool
+      from concurrent.futures import ProcessPoolExecutor
+      import multiprocessing
+      # Workers inherit the strategy, actions and heuristic closures by forking rather than pickling them
+      if "fork" not in multiprocessing.get_all_start_methods():
+         logging.info("Child evaluation workers need the fork start method, evaluating children in process")
+         return
+      logging.info(f"Evaluating children across {self.CHILD_WORKERS} workers")
+      self.child_pool = ProcessPoolExecutor(
+         max_workers=self.CHILD_WORKERS,
+         mp_context=multiprocessing.get_context("fork"),
+         initializer=init_child_worker,
+         initargs=(self, actions, heuristic)
+      )
+
+   def _stop_child_pool(self):
+      if self.child_pool is not None:
+         self.child_pool.shutdown()
+         self.child_pool = None
+
+   def _search_with_reached_store(self, search_function: Callable[..., Solution], *args) -> Solution:
+      reached = self.REACHED_STORE()
+      try:
+         return search_function(*args, reached)
+      finally:
+         self.stats.peak_reached = len(reached)
+         logging.info(f"Reached Store {reached.describe()}")
+         reached.close()
+
+   def _reset_budget(self):
+      self.deadline = None
+      self.expansion_count = 0
+      self.track_best = False
+      self.interrupted = False
+      self.best_node = None
+      self.best_utility = None
+      self.previous_sigint_handler = None
+
+   def _start_budget(self):
+      self._reset_budget()
+      # Without a budget only an interrupt ends the search early, which returns the node about to be expanded
+      self.track_best = self.TIME_BUDGET is not None or self.EXPANSION_BUDGET is not None
+      if self.TIME_BUDGET is not None:
+         self.deadline = time.monotonic() + self.TIME_BUDGET
+      # Signal handlers can only be installed from the main thread
+      if threading.current_thread() is threading.main_thread():
+         self.previous_sigint_handler = signal.signal(signal.SIGINT, self._handle_interrupt)
+
+   def _stop_budget(self):
+      if self.previous_sigint_handler is not None:
+         signal.signal(signal.SIGINT, self.previous_sigint_handler)
+         self.previous_sigint_handler = None
+
+   def _handle_interrupt(self, signum, frame):
+      logging.info("Search interrupted, returning the best schedule found so far")
+      self.interrupted = True
+      # A second interrupt falls through to the original handler
+      self._stop_budget()
+
+   def _track_best(self, evaluated: List[Tuple[Node, float]]):
+      # Every generated child with the heuristic value its expansion already computed
+      if not self.track_best:
+         return
+      for child, utility in evaluated:
+         if self.best_utility is None or utility > self.best_utility:
+            self.best_node = child
+            self.best_utility = utility
+
+   def _budget_exhausted(self, node: Node) -> bool:
+      # Called once per expansion with the node about to be expanded
+      self.expansion_count += 1
+      if self.interrupted or (SearchStrategy.STOP_EVENT is not None and SearchStrategy.STOP_EVENT.is_set()):
+         self.stats.stop_reason = "interrupted"
+      elif self.EXPANSION_BUDGET is not None and self.expansion_count > self.EXPANSION_BUDGET:
+         logging.info(f"Expansion budget of {self.EXPANSION_BUDGET} exhausted")
+         self.stats.stop_reason = "expansion_budget"
+      elif self.deadline is not None and time.monotonic() >= self.deadline:
+         logging.info(f"Time budget of {self.TIME_BUDGET}s exhausted after {self.expansion_count} expansions")
+         self.stats.stop_reason = "time_budget"
+      else:
+         return False
+      # Stopped before any child was generated, or interrupted without a budget tracking the best
+      if self.best_node is None:
+         self.best_node = node
+      return True
+
+   def _release_states(self, node: Node, children: List[Node]):
+      # Once hashed and scored, children and their expanded parent only keep checkpoint states
+      for child in children:
+         child.release_state()
+      node.release_state()
+
+   def _anytime_solution(self, visited: List[Node]) -> Solution:
+      logging.info(f"Returning best schedule seen at depth {self.best_node.depth()} with heuristic value {self.best_utility}")
+      return Solution(self.best_node, visited)
+
+   def _run_search(self, initial_state: Union[Dict[str, Country], WorldState], actions: List[Action], heuristic: Union[Heuristic, None]) -> Solution:
+      self.stats = SearchStats(type(self).__name__)
+      start = time.perf_counter()
+      actions = self._prepare_actions(initial_state, actions)
+      self._start_child_pool(actions, heuristic)
+      self._start_budget()
+      try:
+         if self.TREE_BASED_SEARCH:
+            solution = self.search_without_reached(initial_state, actions, heuristic)
+         else:
+            solution = self._search_with_reached_store(self.search_with_reached, initial_state, actions, heuristic)
+      finally:
+         self._stop_budget()
+         self._stop_child_pool()
+
+      self.stats.search_seconds = time.perf_counter() - start
+      if not self.stats.stop_reason:
+         self.stats.stop_reason = "depth_bound" if solution.NODE is not None and solution.NODE.depth() >= self.DEPTH_BOUND else "exhausted"
+      self._log_node_memory(solution)
+      solution.STATS = self.stats
+      if Tracer.ENABLED:
+         Tracer.mark("search", **self.stats.to_dict())
+      return solution
+
+   def _log_node_memory(self, solution: Solution):
+      # Sampled along the solution path, node records only as states may be shared
+      if not solution.PATH:
+         return
+      self.stats.bytes_per_node = sum(node.memory_bytes() for node in solution.PATH) / len(solution.PATH)
+      logging.info(f"Nodes Generated = {self.stats.generated}, Node Memory = {self.stats.bytes_per_node:.0f} bytes per node excluding state")
 
    def search(self, initial_state: List[Country], actions: List[Action], heuristic: Union[Heuristic, None]) -> Solution:
       raise NotImplementedError('ERROR: This method must be overridden by a concrete search strategy implementation')
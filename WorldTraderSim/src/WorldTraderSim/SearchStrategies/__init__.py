@@ -2,10 +2,13 @@
 # -*- coding: utf-8 -*-
 
 from .SearchStrategy import SearchStrategy
+from .BeamSearch import BeamSearch
 from .BestFirstSearch import BestFirstSearch
 from .HeuristicDepthFirstSearch import HeuristicDepthFirstSearch
 
 def search_strategy_factory(search_strategy_class_name: str) -> SearchStrategy:
+    if search_strategy_class_name == "BeamSearch":
+        return BeamSearch
     if search_strategy_class_name == "BestFirstSearch":
         return BestFirstSearch
     if search_strategy_class_name == "HeuristicDepthFirstSearch":
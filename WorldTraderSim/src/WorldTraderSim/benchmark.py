@@ -0,0 +1,230 @@
+# Standard Libraries
+import argparse
+import configparser
+import itertools
+import json
+import logging
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+from typing import Dict, List, Union
+
+# Running the file directly (python benchmark.py) imports it as a module of the WorldTraderSim package
+if __name__ == "__main__" and not __package__:
+  sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+  __package__ = "WorldTraderSim"
+
+CWD_PATH = os.path.abspath(os.getcwd())
+SCRIPT_PATH = os.path.dirname(os.path.abspath(__file__))
+DATA_PATH = os.path.join(SCRIPT_PATH, "data")
+BENCHMARKS_PATH = os.path.join(DATA_PATH, "benchmarks")
+
+# Bundled scenarios, name -> (initial state file, resources file)
+SCENARIOS = {
+  "rich": ("initial-rich.csv", "resources-balanced.csv"),
+  "poor": ("initial-poor.csv", "resources-balanced.csv"),
+  "multiple-tiers": ("initial-multiple-tiers.csv", "resources-multiple-tiers.csv"),
+  "housing3": ("initial-housing3.csv", "resources-housing3.csv"),
+}
+STRATEGIES = ["HeuristicDepthFirstSearch", "BestFirstSearch", "BeamSearch"]
+DEPTHS = [25, 50]
+
+# Whether a larger value of each recorded metric is an improvement
+METRICS = {
+  "expansions_per_second": True,
+  "peak_rss_kb": False,
+  "wall_time": False,
+  "best_expected_utility": True,
+}
+
+
+def case_name(scenario: str, strategy: str, reached: bool, depth: int) -> str:
+  return "{}/{}/{}/d{}".format(scenario, strategy, "reached" if reached else "tree", depth)
+
+def run_case(args) -> Dict[str, Union[float, int, None]]:
+  # Runs in its own process so peak RSS belongs to this case alone
+  from . import main
+  from .DataTypes import Schedule
+
+  config = configparser.ConfigParser()
+  config.read(args.config)
+  config.set("Search", "Strategy", args.strategy)
+  config.set("Search", "EnableReached", str(args.reached))
+  main.CONFIG = config
+
+  initial_state_file, resources_file = SCENARIOS[args.scenario]
+  scenario = main.load_scenario(args.country_name, initial_state_file, resources_file)
+  context = main.build_scheduler_context(args.country_name, scenario)
+
+  expansions = 0
+  best_expected_utility = None
+  start = time.perf_counter()
+  for schedule_index in range(1, args.num_schedules+1):
+    actions = main.shuffle_actions(context.all_actions, main.schedule_rng(args.seed, schedule_index))
+    search_strategy = main.build_search_strategy(args.depth, args.frontier_size)
+    solution = main.search_schedule(context, actions, search_strategy)
+    expansions += solution.STATS.expanded
+    if solution.NODE is not None:
+      expected_utility = context.schedule_evaluator.expected_utility(context.self_country, Schedule(solution.NODE))
+      if best_expected_utility is None or expected_utility > best_expected_utility:
+        best_expected_utility = expected_utility
+  wall_time = time.perf_counter() - start
+
+  return {
+    "expansions": expansions,
+    "expansions_per_second": expansions / wall_time if wall_time else 0.0,
+    "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "wall_time": wall_time,
+    "best_expected_utility": best_expected_utility,
+  }
+
+def spawn_case(args, scenario: str, strategy: str, reached: bool, depth: int) -> Dict[str, Union[float, int, None]]:
+  command = [
+    sys.executable, os.path.abspath(__file__), "--run-case",
+    "--scenario", scenario, "--strategy", strategy, "--reached", str(reached), "--depth", str(depth),
+    "--config", args.config, "-c", args.country_name, "-n", str(args.num_schedules),
+    "-f", str(args.frontier_size), "--seed", str(args.seed),
+  ]
+  completed = subprocess.run(command, cwd=SCRIPT_PATH, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+  if completed.returncode != 0:
+    raise Exception("Benchmark case {} failed\n{}".format(case_name(scenario, strategy, reached, depth), completed.stderr))
+  return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+  regressions = []
+  for name, metrics in results.items():
+    baseline_metrics = baseline.get(name)
+    if baseline_metrics is None:
+      continue
+    for metric, higher_is_better in METRICS.items():
+      current = metrics.get(metric)
+      previous = baseline_metrics.get(metric)
+      if current is None or previous is None:
+        continue
+      change = current - previous if higher_is_better else previous - current
+      if change < -threshold * abs(previous):
+        regressions.append("{} {} regressed from {:.4g} to {:.4g}".format(name, metric, previous, current))
+  return regressions
+
+def benchmark(args) -> int:
+  settings = {
+    "country_name": args.country_name,
+    "num_schedules": args.num_schedules,
+    "frontier_size": args.frontier_size,
+    "seed": args.seed,
+    "config": os.path.relpath(args.config, SCRIPT_PATH),
+  }
+  results = {}
+  for scenario, strategy, reached, depth in itertools.product(args.scenarios, args.strategies, [True, False] if args.reached is None else [args.reached], args.depths):
+    name = case_name(scenario, strategy, reached, depth)
+    logging.info(f"Running {name}...")
+    results[name] = spawn_case(args, scenario, strategy, reached, depth)
+    logging.info(f"{name} {json.dumps(results[name])}")
+
+  os.makedirs(os.path.dirname(os.path.abspath(args.output_file)), exist_ok=True)
+  with open(args.output_file, "w") as file:
+    json.dump({"settings": settings, "results": results}, file, indent=2)
+  logging.info(f"Wrote results to {args.output_file}")
+
+  if args.write_baseline:
+    with open(args.baseline, "w") as file:
+      json.dump({"settings": settings, "results": results}, file, indent=2)
+    logging.info(f"Wrote baseline to {args.baseline}")
+    return 0
+
+  if not os.path.exists(args.baseline):
+    logging.info(f"No baseline at {args.baseline}, run with --write-baseline to record one")
+    return 0
+
+  with open(args.baseline) as file:
+    baseline = json.load(file)
+  if baseline.get("settings") != settings:
+    logging.warning(f"Baseline settings {baseline.get('settings')} differ from this run {settings}")
+
+  regressions = compare(results, baseline.get("results", {}), args.threshold)
+  for regression in regressions:
+    logging.error(regression)
+  logging.info(f"{len(regressions)} regressions beyond {args.threshold:.0%} of the baseline")
+  return 1 if regressions else 0
+
+# Adds random 64-bit keys to every reached store then looks up as many again, half of them reached
+def benchmark_reached_stores(key_count: int, seed: int) -> int:
+  from .ReachedStores import reached_store_factory
+
+  rng = random.Random(seed)
+  keys = [rng.getrandbits(64) for _ in range(key_count)]
+  probes = keys[::2] + [rng.getrandbits(64) for _ in range(key_count - key_count // 2)]
+  print("{:>10}  {:>12}  {:>12}  {:>10}".format("store", "adds/s", "lookups/s", "bytes/key"))
+  for store_name in ["Dict", "HashTable", "BloomFilter"]:
+    store = reached_store_factory(store_name)()
+    start = time.perf_counter()
+    for key in keys:
+      store.add(key, 1.0)
+    add_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    for key in probes:
+      key in store
+    lookup_seconds = time.perf_counter() - start
+    print("{:>10}  {:>12.0f}  {:>12.0f}  {:>10.1f}".format(store_name, key_count / add_seconds, len(probes) / lookup_seconds, store.memory_bytes() / key_count))
+    store.close()
+  return 0
+
+
+def parseCmdLineArgs():
+  parser = argparse.ArgumentParser (description="WorldTraderSim Benchmark")
+
+  parser.add_argument ("-c", "--country-name", default="Atlantis", help="A country name that will be used for the AI's perspective (self)")
+
+  # Arguments governing the benchmark matrix
+  parser.add_argument ("--scenarios", nargs="+", default=list(SCENARIOS.keys()), choices=list(SCENARIOS.keys()), help="Bundled scenarios to run")
+  parser.add_argument ("--strategies", nargs="+", default=STRATEGIES, choices=STRATEGIES, help="Search strategies to run")
+  parser.add_argument ("--depths", nargs="+", type=int, default=DEPTHS, help="Depth bounds to run")
+  parser.add_argument ("--reached", type=lambda value: value.lower() == "true", default=None, help="Only run with reached enabled (True) or disabled (False), default runs both")
+  parser.add_argument ("-n", "--num-schedules", type=int, default=1, help="The number of schedules searched per case")
+  parser.add_argument ("-f", "--frontier-size", type=int, default=20000, help="Max size of the Frontier")
+  parser.add_argument ("--seed", type=int, default=5260, help="Base random seed so cases search the same action orders every run")
+  parser.add_argument ("--config", default=SCRIPT_PATH+"/config.ini", help="configuration file (default: config.ini)")
+
+  # Arguments governing results and regressions
+  parser.add_argument ("-o", "--output-file", default=os.path.join(BENCHMARKS_PATH, "latest.json"), help="JSON file to write this run's results to")
+  parser.add_argument ("--baseline", default=os.path.join(BENCHMARKS_PATH, "baseline.json"), help="JSON baseline results are compared against")
+  parser.add_argument ("--write-baseline", action="store_true", help="Record this run as the baseline instead of comparing against it")
+  parser.add_argument ("--threshold", type=float, default=0.2, help="Fraction a metric may worsen against the baseline before it is a regression")
+
+  # Runs a single case and prints its metrics, used internally
+  parser.add_argument ("--reached-stores", type=int, default=0, help="Time adding and looking up this many keys in each reached store instead of running the matrix")
+
+  parser.add_argument ("--run-case", action="store_true", help=argparse.SUPPRESS)
+  parser.add_argument ("--scenario", choices=list(SCENARIOS.keys()), help=argparse.SUPPRESS)
+  parser.add_argument ("--strategy", choices=STRATEGIES, help=argparse.SUPPRESS)
+  parser.add_argument ("--depth", type=int, help=argparse.SUPPRESS)
+
+  # Logging level
+  parser.add_argument ("-l", "--logging-level", type=int, default=logging.INFO, choices=[logging.DEBUG,logging.INFO,logging.WARNING,logging.ERROR,logging.CRITICAL], help="logging level, choices 10,20,30,40,50: default 10=logging.DEBUG")
+
+  return parser.parse_args()
+
+def main():
+  args = parseCmdLineArgs ()
+  if args.run_case:
+    logging.getLogger().setLevel(logging.WARNING)
+    print(json.dumps(run_case(args)))
+    return 0
+
+  logging.getLogger().setLevel(args.logging_level)
+  if args.reached_stores:
+    return benchmark_reached_stores(args.reached_stores, args.seed)
+  logging.info("Benchmarking WorldTraderSim...")
+  return benchmark(args)
+
+def run():
+    # set underlying default logging capabilities
+  logging.basicConfig (level=logging.DEBUG,
+                       format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+  return main()
+
+if __name__ == "__main__":
+  sys.exit(run())
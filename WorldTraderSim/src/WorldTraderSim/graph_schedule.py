@@ -1,30 +1,65 @@
 # Standard Libraries
 import argparse
+import csv
+import glob
 import json
 import logging
 import os
-from typing import Callable, Dict, List
+import sys
+from typing import Callable, Dict, List, Tuple, Union
 
-# External Dependencies
-import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
-import seaborn as sns
+# Running the file directly (python graph_schedule.py) imports it as a module of the WorldTraderSim package
+if __name__ == "__main__" and not __package__:
+  sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+  __package__ = "WorldTraderSim"
+
+# Local Modules
+from .startup_profile import profile_startup
 
 CWD_PATH = os.path.abspath(os.getcwd())
 SCRIPT_PATH = os.path.dirname(os.path.abspath(__file__))
 DATA_PATH = os.path.join(SCRIPT_PATH, "data")
+A4_DIMS = (11.7, 8.27)
+SCHEDULE_COLUMNS = ["step", "expected_utility"]
+# Older schedule CSVs were written without it
+OPTIONAL_COLUMNS = ["state_quality"]
+# Comparison charts of more schedules than this are drawn without a legend
+MAX_LEGEND_ENTRIES = 12
+
+
+# Steps of the best schedule of a stored run, ties go to the later schedule as in best_solution.csv
+def load_run_best_schedule(results_dir: str, run_id: str):
+  import pandas as pd
+  from .DataTypes import ResultsStore
+  from .DataTypes.ResultsStore import PARTITION_EXTENSION
 
+  partitions = ResultsStore.partitions(results_dir, run_id=None if run_id == "latest" else run_id)
+  if not partitions:
+    raise Exception("No stored run {} in {}".format(run_id, results_dir))
+  run_id = os.path.basename(partitions[-1])[:-len(PARTITION_EXTENSION)]
+  schedules = pd.DataFrame(ResultsStore.query(results_dir, run_id=run_id, schedules=True))
+  best_schedule = schedules.loc[schedules["schedule_expected_utility"][::-1].idxmax(), "schedule"]
+  steps = pd.DataFrame(ResultsStore.query(results_dir, run_id=run_id))
+  return run_id, steps[steps["schedule"] == best_schedule]
 
 def graph_schedule(args):
+  # External Dependencies, imported on use as they dominate startup time
+  import matplotlib.pyplot as plt
+  import pandas as pd
+  import seaborn as sns
+
   sns.set(font_scale=1.25)
-  a4_dims = (11.7, 8.27)
-  fig, ax = plt.subplots(figsize=a4_dims)
+  fig, ax = plt.subplots(figsize=A4_DIMS)
 
   ax.grid(False)
   ax.text(x=0.5, y=1.06, s='Expected Utility vs State Quality', fontsize=20, weight='bold', ha='center', va='bottom', transform=ax.transAxes)
 
-  df = pd.read_csv(os.path.join(args.schedules_dir, "best_solution.csv"))
+  if args.run_id:
+    run_id, df = load_run_best_schedule(args.results_dir, args.run_id)
+    output_file = "{}_best_solution.png".format(run_id)
+  else:
+    df = pd.read_csv(os.path.join(args.schedules_dir, "best_solution.csv"))
+    output_file = "best_solution.png"
   
   sns.lineplot(x="step", y="expected_utility", data=df, color="b", ax=ax, label="Expected Utility")
   ax.set_xlabel("Depth")
@@ -37,7 +72,130 @@ def graph_schedule(args):
   ax2.set_ylabel("State Quality")
   ax2.legend(loc="upper right")
   
-  plt.savefig(os.path.join(args.schedules_dir, "best_solution.png"))
+  plt.savefig(os.path.join(args.schedules_dir, output_file))
+
+
+# Batch mode renders every schedule CSV matched by a directory or glob to a PNG of the same name
+# Plots use the non-interactive Agg backend and plain matplotlib lines on a figure each worker
+# creates once and clears between schedules, so a file costs one CSV read, one draw and one save
+BATCH_FIGURE = None
+
+def schedule_csv_paths(pattern: str) -> List[str]:
+  if os.path.isdir(pattern):
+    pattern = os.path.join(pattern, "*.csv")
+  return sorted(glob.glob(pattern))
+
+# Step columns of a schedule CSV, None for CSVs that are not schedules
+def read_schedule_csv(csv_path: str) -> Union[Dict[str, List[float]], None]:
+  with open(csv_path, newline="") as file:
+    reader = csv.DictReader(file)
+    if not reader.fieldnames or not set(SCHEDULE_COLUMNS).issubset(reader.fieldnames):
+      return None
+    names = SCHEDULE_COLUMNS + [column for column in OPTIONAL_COLUMNS if column in reader.fieldnames]
+    columns = {column: [] for column in names}
+    for row in reader:
+      for column in names:
+        columns[column].append(float(row[column]))
+  return columns
+
+def init_batch_worker():
+  global BATCH_FIGURE
+  # External Dependencies, the backend is chosen before pyplot is imported
+  import matplotlib
+  matplotlib.use("Agg")
+  import matplotlib.pyplot as plt
+  import seaborn as sns
+
+  sns.set(font_scale=1.25)
+  fig, ax = plt.subplots(figsize=A4_DIMS)
+  BATCH_FIGURE = (fig, ax, ax.twinx())
+
+def draw_schedule(ax, ax2, columns: Dict[str, List[float]]):
+  ax.grid(False)
+  ax.text(x=0.5, y=1.06, s='Expected Utility vs State Quality', fontsize=20, weight='bold', ha='center', va='bottom', transform=ax.transAxes)
+  ax.plot(columns["step"], columns["expected_utility"], color="b", label="Expected Utility")
+  ax.set_xlabel("Depth")
+  ax.set_ylabel("Expected Utility")
+  ax.legend(loc="upper left")
+
+  # Clearing a twin axis moves its ticks back to the left
+  ax2.yaxis.tick_right()
+  ax2.yaxis.set_label_position("right")
+  ax2.grid(False)
+  ax2.set_visible("state_quality" in columns)
+  if "state_quality" not in columns:
+    return
+  ax2.plot(columns["step"], columns["state_quality"], color="g", label="State Quality")
+  ax2.set_ylabel("State Quality")
+  ax2.legend(loc="upper right")
+
+def render_schedule(csv_path: str) -> Union[str, None]:
+  columns = read_schedule_csv(csv_path)
+  if columns is None:
+    return None
+  fig, ax, ax2 = BATCH_FIGURE
+  ax.cla()
+  ax2.cla()
+  draw_schedule(ax, ax2, columns)
+  png_path = os.path.splitext(csv_path)[0] + ".png"
+  fig.savefig(png_path)
+  return png_path
+
+# Overlays the expected utility and state quality of every schedule on one chart
+def graph_comparison(csv_paths: List[str], output_path: str) -> int:
+  import matplotlib
+  matplotlib.use("Agg")
+  import matplotlib.pyplot as plt
+  import seaborn as sns
+
+  sns.set(font_scale=1.25)
+  fig, (ax, ax2) = plt.subplots(2, 1, sharex=True, figsize=A4_DIMS)
+  fig.suptitle('Expected Utility and State Quality by Schedule', fontsize=20, weight='bold')
+  compared = 0
+  for csv_path in csv_paths:
+    columns = read_schedule_csv(csv_path)
+    if columns is None:
+      continue
+    label = os.path.splitext(os.path.basename(csv_path))[0]
+    ax.plot(columns["step"], columns["expected_utility"], label=label)
+    if "state_quality" in columns:
+      ax2.plot(columns["step"], columns["state_quality"], label=label)
+    compared += 1
+  ax.set_ylabel("Expected Utility")
+  ax2.set_ylabel("State Quality")
+  ax2.set_xlabel("Depth")
+  if 0 < compared <= MAX_LEGEND_ENTRIES:
+    ax.legend(loc="upper left", fontsize="x-small")
+  fig.savefig(output_path)
+  plt.close(fig)
+  return compared
+
+def graph_schedules(args) -> Tuple[int, int]:
+  csv_paths = schedule_csv_paths(args.batch)
+  workers = max(1, min(args.workers, len(csv_paths)))
+  logging.info(f"Rendering {len(csv_paths)} schedule files across {workers} workers")
+
+  if workers > 1:
+    # Imported on use, single process runs never need it
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_batch_worker) as executor:
+      png_paths = list(executor.map(render_schedule, csv_paths, chunksize=max(1, len(csv_paths) // (workers * 4))))
+  else:
+    init_batch_worker()
+    png_paths = [render_schedule(csv_path) for csv_path in csv_paths]
+
+  for csv_path, png_path in zip(csv_paths, png_paths):
+    if png_path is None:
+      logging.warning(f"Skipped {csv_path}, it has no {', '.join(SCHEDULE_COLUMNS)} columns")
+  rendered = sum(png_path is not None for png_path in png_paths)
+  logging.info(f"Rendered {rendered} schedule graphs")
+
+  if args.compare:
+    compare_path = os.path.join(args.schedules_dir, args.compare)
+    compared = graph_comparison(csv_paths, compare_path)
+    logging.info(f"Compared {compared} schedules in {compare_path}")
+  return rendered, len(csv_paths)
 
 
 def parseCmdLineArgs():
@@ -45,11 +203,19 @@ def parseCmdLineArgs():
 
   # Arguments governing file paths
   parser.add_argument ("-s", "--schedules-dir", default=DATA_PATH+"/schedules/", help="Directory containing schedule files")
+  parser.add_argument ("--results-dir", default=DATA_PATH+"/results/", help="Directory of the results store written by main")
+  parser.add_argument ("--run-id", default=None, help="Graph the best schedule of this stored run, or the most recent with latest, instead of best_solution.csv")
+  parser.add_argument ("-b", "--batch", default=None, help="Directory or glob of schedule CSVs, each is rendered to a PNG of the same name")
+  parser.add_argument ("-w", "--workers", type=int, default=os.cpu_count() or 1, help="Batch mode, number of processes rendering graphs")
+  parser.add_argument ("--compare", default=None, help="Batch mode, PNG file under the schedules directory overlaying every schedule on one chart")
   parser.add_argument ("-o", "--output-file", default="schedules.txt", help="Output file to save graph")
 
   # Logging level
   parser.add_argument ("-l", "--logging-level", type=int, default=logging.INFO, choices=[logging.DEBUG,logging.INFO,logging.WARNING,logging.ERROR,logging.CRITICAL], help="logging level, choices 10,20,30,40,50: default 10=logging.DEBUG")
   
+  # Print where startup time goes instead of running
+  parser.add_argument ("--startup-profile", action="store_true", help="Print an import time breakdown of the grapher and exit")
+  
   return parser.parse_args()
 
 def main(): 
@@ -57,10 +223,19 @@ def main():
   args = parseCmdLineArgs ()
   logging.getLogger().setLevel(args.logging_level)
 
-  graph_schedule(args)
+  if args.startup_profile:
+    return profile_startup("WorldTraderSim.graph_schedule")
 
-if __name__ == "__main__":
+  if args.batch:
+    graph_schedules(args)
+  else:
+    graph_schedule(args)
+
+def run():
     # set underlying default logging capabilities
   logging.basicConfig (level=logging.DEBUG,
                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-  main()
+  return main()
+
+if __name__ == "__main__":
+  sys.exit(run())
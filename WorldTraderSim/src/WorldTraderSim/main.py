@@ -2,28 +2,42 @@
 import argparse
 import configparser
 import copy
+from dataclasses import dataclass
 import logging
 import os
 import random
-from typing import Callable, Dict, List
+import signal
+import sys
+import threading
+from types import ModuleType
+from typing import Callable, Dict, Iterator, List, Tuple, Union
+
+# Running the file directly (python main.py) imports it as a module of the WorldTraderSim package
+if __name__ == "__main__" and not __package__:
+  sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+  __package__ = "WorldTraderSim"
 
 # Local Modules
-from DataTypes import \
-  Country, Heuristic, Node, \
-  ResourceQuantity, ResourceTemplate, Schedule, \
-  TransferAction, TransformAction, TransformTemplate
-from DataTypes.TransferAction import TransferDirection
-from Parsers import StateParser, TransformTemplateParser
-from Evaluators import StateEvaluator, ScheduleEvaluator
-from ProblemFormulations import ImplicitGraph
-from SearchStrategies import search_strategy_factory
+from .DataTypes import \
+  Action, Country, Heuristic, Node, \
+  ResourceQuantity, ResourceTemplate, ResultsStore, Scenario, Schedule, ScheduleWriter, SearchStats, Solution, StateRegistry, \
+  Tracer, TransferAction, TransformAction, TransformTemplate, WorldState
+from .DataTypes.ScheduleWriter import SCHEDULE_FORMATS
+from .DataTypes.TransferAction import TransferDirection
+from .Parsers import ScenarioCache, StateParser, TemplateCatalogParser, TransformTemplateParser
+from .Evaluators import StateEvaluator, ScheduleEvaluator
+from .ProblemFormulations import ImplicitGraph
+from .SearchStrategies import SearchStrategy, search_strategy_factory
+from .startup_profile import profile_startup
 
 CWD_PATH = os.path.abspath(os.getcwd())
 SCRIPT_PATH = os.path.dirname(os.path.abspath(__file__))
 DATA_PATH = os.path.join(SCRIPT_PATH, "data")
 STATES_PATH = os.path.join(DATA_PATH, "states")
 TEMPLATE_EXTENSION=".tmpl"
-TRANSFORM_TEMPLATES_PATH = os.path.join(DATA_PATH, "templates/base")
+TEMPLATES_PATH = os.path.join(DATA_PATH, "templates")
+SCENARIO_CACHE_PATH = os.path.join(DATA_PATH, "cache")
+RESULTS_PATH = os.path.join(DATA_PATH, "results")
 
 CONFIG: configparser.ConfigParser = None
 
@@ -66,14 +80,32 @@ def load_states(initial_state_file, resources_file):
 
     return  initial_state, resources
 
+def transform_templates_path() -> str:
+  return os.path.join(TEMPLATES_PATH, CONFIG.get("Templates", "Directory", fallback="base"))
+
+def transform_templates_format() -> str:
+  templates_format = CONFIG.get("Templates", "Format", fallback="tmpl")
+  if templates_format not in ["tmpl", "json"]:
+    raise Exception("Unrecognized Templates Format '{}'".format(templates_format))
+  return templates_format
+
+def transform_template_paths() -> List[str]:
+  templates_path = transform_templates_path()
+  extension = TEMPLATE_EXTENSION if transform_templates_format() == "tmpl" else TemplateCatalogParser.CATALOG_EXTENSION
+  return [os.path.join(templates_path, file_path) for file_path in os.listdir(templates_path) if file_path.endswith(extension)]
+
 def load_transform_templates() -> List[TransformTemplate]:
+  # json reads the whole directory as one catalog, tmpl parses each template file on its own
+  if transform_templates_format() == "json":
+    transform_templates = TemplateCatalogParser.parse_catalog(transform_templates_path())
+    logging.info(f"Loaded {len(transform_templates)} templates from catalog {transform_templates_path()}")
+    return transform_templates
+
   transform_templates = []
-  for file_path in os.listdir(TRANSFORM_TEMPLATES_PATH):
-    if file_path.endswith(TEMPLATE_EXTENSION):
-      template_path = os.path.join(TRANSFORM_TEMPLATES_PATH,file_path)
-      transform_template = TransformTemplateParser.parse(template_path)
-      logging.debug(transform_template)
-      transform_templates.append(transform_template)
+  for template_path in transform_template_paths():
+    transform_template = TransformTemplateParser.parse(template_path)
+    logging.debug(transform_template)
+    transform_templates.append(transform_template)
   return transform_templates
 
 def build_country_states_map(initial_state: List[Country]) -> Dict[str, Country]:
@@ -131,18 +163,84 @@ def build_transform_actions(transform_templates: List[TransformTemplate], target
   logging.info(f"Created {len(actions)} Transform Actions")
   return actions
 
-def country_scheduler(country_name, resources_file,
-                      initial_state_file, output_file,
-                      num_schedules, depth_bound,
-                      frontier_size):
+def build_start_state(state_engine: str, country_states: Dict[str, Country], registry: StateRegistry, actions: List[Action]) -> Union[Dict[str, Country], WorldState]:
+  # Dict keeps a Dict[str, Country] per node
+  # Array keeps a single countries x resources matrix per node and applies actions as deltas
+  if state_engine == "Dict":
+    return country_states
+  if state_engine == "Array":
+    for action in actions:
+      action.compile(registry)
+    logging.info(f"Compiled {len(actions)} actions against {registry.shape[0]} countries x {registry.shape[1]} resources")
+    return WorldState.from_country_states(country_states, registry)
+  raise Exception("Unrecognized State Engine '{}'".format(state_engine))
+
+@dataclass
+class SchedulerContext:
+  self_country: Country
+  start_state: Union[Dict[str, Country], WorldState]
+  # Canonical action order, Action.INDEX is the position in this list
+  all_actions: List[Action]
+  state_evaluator: StateEvaluator
+  schedule_evaluator: ScheduleEvaluator
+  heuristic: Heuristic
+
+def compile_scenario(country_name: str, initial_state: List[Country], resources: List[ResourceTemplate], transform_templates: List[TransformTemplate]) -> Scenario:
+  country_states = build_country_states_map(initial_state)
+  self_country: Country = country_states.get(country_name)
+  if not self_country:
+    raise Exception("Agent country {} not defined in initial state".format(country_name))
+
+  logging.info("Building transfer actions...")
+  transfer_actions = build_transfer_actions(resources, country_states, self_country)
+  logging.info("Transfer actions built")
+
+  logging.info("Building transform actions...")
+  transform_actions = build_transform_actions(transform_templates, target_country=self_country)
+  logging.info("Transform actions built")
+
+  return Scenario(initial_state, resources, transform_templates, transfer_actions + transform_actions)
+
+def parse_scenario(country_name: str, initial_state_file: str, resources_file: str) -> Scenario:
   logging.info("Loading initial state and resources...")
   initial_state, resources = load_states(initial_state_file, resources_file)
   logging.info("Initial state and resources loaded")
 
   logging.info("Loading transform templates...")
   transform_templates = load_transform_templates()
+  if transform_templates_format() == "json":
+    TemplateCatalogParser.validate_resources(transform_templates, resources)
+  else:
+    TemplateCatalogParser.unweighted_resources(transform_templates, resources)
   logging.info("Transform templates loaded")
 
+  return compile_scenario(country_name, initial_state, resources, transform_templates)
+
+# Identifies a scenario by the contents of its input files, the [Actions] options and the self country
+def scenario_key(country_name: str, initial_state_file: str, resources_file: str) -> str:
+  input_paths = [os.path.join(STATES_PATH, initial_state_file), os.path.join(STATES_PATH, resources_file)] + sorted(transform_template_paths())
+  options = dict(CONFIG.items("Actions")) if CONFIG.has_section("Actions") else {}
+  return ScenarioCache.scenario_key(input_paths, options, country_name)
+
+def load_scenario(country_name: str, initial_state_file: str, resources_file: str) -> Scenario:
+  # Compiled scenarios are reused while the scenario key is unchanged
+  if not CONFIG.getboolean("Scenario", "Cache", fallback=False):
+    return parse_scenario(country_name, initial_state_file, resources_file)
+
+  cache_dir = CONFIG.get("Scenario", "CacheDirectory", fallback="") or SCENARIO_CACHE_PATH
+  scenario_path = os.path.join(cache_dir, scenario_key(country_name, initial_state_file, resources_file))
+  if os.path.exists(scenario_path):
+    scenario = ScenarioCache.load(scenario_path)
+    logging.info(f"Loaded compiled scenario {os.path.basename(scenario_path)} with {len(scenario.actions)} actions")
+    return scenario
+
+  scenario = parse_scenario(country_name, initial_state_file, resources_file)
+  ScenarioCache.save(scenario_path, scenario)
+  logging.info(f"Stored compiled scenario {os.path.basename(scenario_path)}")
+  return scenario
+
+def build_scheduler_context(country_name: str, scenario: Scenario) -> SchedulerContext:
+  initial_state, resources, transform_templates = scenario.initial_state, scenario.resources, scenario.transform_templates
   logging.info("Building country states map...")
   country_states = build_country_states_map(initial_state)
   logging.info("Country states map built")
@@ -151,24 +249,25 @@ def country_scheduler(country_name, resources_file,
   if not self_country:
     raise Exception("Agent country {} not defined in initial state".format(country_name))
 
-  logging.info("Building transfer actions...")
-  transfer_actions = build_transfer_actions(resources, country_states, self_country)
-  logging.info("Transfer actions built")
-
-  logging.info("Building transform actions...")
-  transform_actions = build_transform_actions(transform_templates, target_country=self_country)
-  logging.info("Transform actions built")
-
-  # Combine all the actions into a single list
-  # Shuffle the list randomly so as not to have any implied bias to actions via ordering
-  all_actions = transfer_actions + transform_actions
+  state_engine = CONFIG.get("State", "Engine", fallback="Dict")
+  logging.info("State Engine = {}".format(state_engine))
+  Action.COPY_ON_WRITE = CONFIG.getboolean("State", "CopyOnWrite", fallback=True)
+  logging.info("Copy On Write = {}".format(Action.COPY_ON_WRITE))
+  Node.CHECKPOINT_INTERVAL = CONFIG.getint("State", "CheckpointInterval", fallback=0)
+  logging.info("Checkpoint Interval = {}".format(Node.CHECKPOINT_INTERVAL))
+  registry = StateRegistry.from_states(initial_state, resources, transform_templates)
+  start_state = build_start_state(state_engine, country_states, registry, scenario.actions)
+
+  # Each search shuffles its own copy so as not to have any implied bias to actions via ordering
+  all_actions = list(scenario.actions)
+  for index, action in enumerate(all_actions):
+    action.INDEX = index
   logging.info("Loaded {} total actions".format(len(all_actions)))
-  if CONFIG.getboolean("Actions", "Shuffle"):
-    random.shuffle(all_actions)
   
   logging.info("Establishing evaluation functions...")
   initial_country_states = copy.deepcopy(country_states)
-  state_evaluator = StateEvaluator(resources)
+  state_evaluator = StateEvaluator(resources, registry)
+  state_evaluator.build_quality_deltas(all_actions)
   schedule_evaluator = ScheduleEvaluator(
     initial_state=initial_country_states,
     state_quality_fn=state_evaluator.state_quality,
@@ -179,46 +278,185 @@ def country_scheduler(country_name, resources_file,
   heuristic = Heuristic(utility_fn)
   logging.info("Evaluation functions established")
 
-  start_country_state = initial_country_states[self_country.name]
-  logging.debug("Start Agent Country State = {}".format(start_country_state))
-  logging.info("Start Agent Country State Quality = {}".format(state_evaluator.state_quality(start_country_state)))
-  
-  solutions = {}
-  for _schedule_count in range(1, num_schedules+1):
-    logging.info("Building search graph...")
-    shuffled_all_actions = copy.deepcopy(all_actions)
-    if CONFIG.getboolean("Actions", "Shuffle"):
-      random.shuffle(shuffled_all_actions)
-    graph = ImplicitGraph(country_states, shuffled_all_actions, heuristic)
-
-    strategy = search_strategy_factory(CONFIG.get("Search", "Strategy"))
-    enable_reached = CONFIG.getboolean("Search", "EnableReached")
-    logging.info("Executing {} strategy...".format(strategy.__name__))
-    logging.info("Reached Enabled = {}".format(enable_reached))
-    solution = graph.search(country_states, strategy((not enable_reached), depth_bound, frontier_size))
-    
-    final_state = solution.NODE.STATE
-    final_country_state = final_state[self_country.name]
-    logging.debug("Final Agent Country State = {}".format(final_country_state))
-    logging.info("Final Agent Country State Quality = {}".format(state_evaluator.state_quality(final_country_state)))
-
-    schedule = Schedule(solution.NODE)
-    expected_utility = schedule_evaluator.expected_utility(start_country_state, schedule)
-    logging.info("Schedule Expected Utility = {}".format(expected_utility))
-    schedule_evaluator.log_country_probabilities(schedule)
-    schedule_evaluator.log_country_states_diff(schedule)
-    solutions[expected_utility] = solution
+  return SchedulerContext(self_country, start_state, all_actions, state_evaluator, schedule_evaluator, heuristic)
 
-  Schedule.write_solutions(solutions, schedule_evaluator.expected_utility, self_country, output_file)
+def shuffle_actions(actions: List[Action], rng: Union[random.Random, ModuleType]) -> List[Action]:
+  shuffled_actions = list(actions)
+  if CONFIG.getboolean("Actions", "Shuffle"):
+    rng.shuffle(shuffled_actions)
+  return shuffled_actions
+
+def schedule_rng(seed: Union[int, None], schedule_index: int) -> Union[random.Random, ModuleType]:
+  # Seeded runs give every schedule its own generator so results do not depend on which worker ran it
+  return random.Random(seed + schedule_index) if seed is not None else random
+
+def build_search_strategy(depth_bound: int, frontier_size: int) -> SearchStrategy:
+  strategy = search_strategy_factory(CONFIG.get("Search", "Strategy"))
+  enable_reached = CONFIG.getboolean("Search", "EnableReached")
+  logging.info("Executing {} strategy...".format(strategy.__name__))
+  logging.info("Reached Enabled = {}".format(enable_reached))
+  search_strategy = strategy((not enable_reached), depth_bound, frontier_size)
+  search_strategy.configure(CONFIG)
+  return search_strategy
+
+def search_schedule(context: SchedulerContext, actions: List[Action], search_strategy: SearchStrategy) -> Solution:
+  logging.info("Building search graph...")
+  graph = ImplicitGraph(context.start_state, actions, context.heuristic)
+  return graph.search(context.start_state, search_strategy)
+
+def replay_solution(context: SchedulerContext, action_indices: List[int], stats: Union[Dict, None] = None) -> Solution:
+  node = Node(context.start_state, None, None, 0.0)
+  for action_index in action_indices:
+    action = context.all_actions[action_index]
+    node = Node(action.apply(node.STATE), node, action, node.PATH_COST + action.ACTION_COST)
+  solution = Solution(node, [])
+  if stats is not None:
+    solution.STATS = SearchStats(**stats)
+  return solution
+
+# Process pool workers build their own context once from the scenario and return each
+# schedule as canonical action indices with its search stats and trace events, which the parent replays
+# into a Solution and merges into its own trace
+# An interrupted parent sets the shared stop event, running searches return their best schedule so far
+# and schedules not yet started are skipped
+WORKER_CONTEXT: SchedulerContext = None
+
+def init_schedule_worker(config: Dict[str, Dict[str, str]], logging_level: int, country_name: str, scenario: Scenario, stop_event):
+  global CONFIG, WORKER_CONTEXT
+  # Ctrl+C reaches every worker, only a running search handles it, the parent decides what to keep
+  signal.signal(signal.SIGINT, signal.SIG_IGN)
+  SearchStrategy.STOP_EVENT = stop_event
+  CONFIG = configparser.ConfigParser()
+  CONFIG.read_dict(config)
+  logging.getLogger().setLevel(logging_level)
+  Tracer.configure(CONFIG)
+  WORKER_CONTEXT = build_scheduler_context(country_name, scenario)
+
+def search_schedule_worker(schedule_index: int, seed: int, depth_bound: int, frontier_size: int) -> Union[Tuple[List[int], Dict, List], None]:
+  if SearchStrategy.STOP_EVENT.is_set():
+    return None
+  actions = shuffle_actions(WORKER_CONTEXT.all_actions, schedule_rng(seed, schedule_index))
+  solution = search_schedule(WORKER_CONTEXT, actions, build_search_strategy(depth_bound, frontier_size))
+  return [node.PARENT_ACTION.INDEX for node in solution.PATH if node.PARENT_ACTION], solution.STATS.to_dict(), Tracer.drain()
+
+def search_schedules_parallel(context: SchedulerContext, workers: int, seed: int,
+                              country_name: str, scenario: Scenario,
+                              num_schedules: int, depth_bound: int, frontier_size: int) -> Iterator[Solution]:
+  # Imported on use, single process runs never need it
+  from concurrent.futures import ProcessPoolExecutor
+  import multiprocessing
+
+  config = {section: dict(CONFIG.items(section, raw=True)) for section in CONFIG.sections()}
+  schedule_indices = list(range(1, num_schedules+1))
+  stop_event = multiprocessing.get_context().Event()
+  logging.info(f"Searching {num_schedules} schedules across {workers} workers")
+  with ProcessPoolExecutor(
+    max_workers=workers,
+    initializer=init_schedule_worker,
+    initargs=(config, logging.getLogger().level, country_name, scenario, stop_event)
+  ) as executor:
+    results = executor.map(search_schedule_worker, schedule_indices, [seed]*num_schedules, [depth_bound]*num_schedules, [frontier_size]*num_schedules)
+
+    def handle_interrupt(signum, frame):
+      logging.info("Search interrupted, collecting the best schedules found so far")
+      stop_event.set()
+      # A second interrupt falls through to the original handler
+      signal.signal(signal.SIGINT, previous_sigint_handler)
+
+    # Signal handlers can only be installed from the main thread
+    previous_sigint_handler = None
+    if threading.current_thread() is threading.main_thread():
+      previous_sigint_handler = signal.signal(signal.SIGINT, handle_interrupt)
+    try:
+      # Yielded as each result arrives so it can be written while later schedules are searched
+      for result in results:
+        if result is None:
+          continue
+        path, stats, events = result
+        Tracer.extend(events)
+        yield replay_solution(context, path, stats)
+    finally:
+      if previous_sigint_handler is not None and signal.getsignal(signal.SIGINT) is handle_interrupt:
+        signal.signal(signal.SIGINT, previous_sigint_handler)
+
+def search_schedules(context: SchedulerContext, seed: int, num_schedules: int, depth_bound: int, frontier_size: int) -> Iterator[Solution]:
+  for schedule_index in range(1, num_schedules+1):
+    actions = shuffle_actions(context.all_actions, schedule_rng(seed, schedule_index))
+    solution = search_schedule(context, actions, build_search_strategy(depth_bound, frontier_size))
+    yield solution
+    # An interrupt ends the run with the schedules found so far, as it does across workers
+    if solution.STATS.stop_reason == "interrupted":
+      break
 
-  best_eu = None
-  best_solution = None
-  for eu, solution in solutions.items():
-    if not best_eu or eu > best_eu:
-      best_eu = eu
-      best_solution = solution
+def country_scheduler(country_name, resources_file,
+                      initial_state_file, output_file,
+                      num_schedules, depth_bound,
+                      frontier_size, workers=1, seed=None, stats_file=None, output_format="text"):
+  scenario = load_scenario(country_name, initial_state_file, resources_file)
+  context = build_scheduler_context(country_name, scenario)
+  self_country = context.self_country
+  state_evaluator = context.state_evaluator
+  schedule_evaluator = context.schedule_evaluator
+
+  start_country_state = schedule_evaluator.initial_state[self_country.name]
+  logging.debug("Start Agent Country State = {}".format(start_country_state))
+  logging.info("Start Agent Country State Quality = {}".format(state_evaluator.state_quality(start_country_state)))
 
-  Schedule.write_csv(best_solution, state_evaluator.state_quality, schedule_evaluator.expected_utility, self_country, "best_solution.csv")
+  workers = max(1, min(workers, num_schedules))
+  if workers > 1:
+    if seed is None:
+      seed = random.randrange(2**32)
+    logging.info(f"Schedule Seed = {seed}")
+    found_solutions = search_schedules_parallel(context, workers, seed,
+                                                country_name, scenario,
+                                                num_schedules, depth_bound, frontier_size)
+  else:
+    found_solutions = search_schedules(context, seed, num_schedules, depth_bound, frontier_size)
+
+  # Installed packages ship without the schedules directory
+  os.makedirs(os.path.join(DATA_PATH, "schedules"), exist_ok=True)
+
+  # Every schedule's steps are also added to the run's partition of the results store
+  results_store = None
+  if CONFIG.getboolean("Results", "Enabled", fallback=False):
+    run_config = {section: dict(CONFIG.items(section, raw=True)) for section in CONFIG.sections()}
+    run_config["Run"] = {"depth_bound": str(depth_bound), "frontier_size": str(frontier_size), "num_schedules": str(num_schedules)}
+    results_dir = CONFIG.get("Results", "Directory", fallback="") or RESULTS_PATH
+    results_store = ResultsStore(results_dir, scenario_key(country_name, initial_state_file, resources_file), run_config, seed, self_country)
+
+  # Each schedule is written as soon as its search finishes, only its stats are kept afterwards
+  all_stats = []
+  with ScheduleWriter(os.path.join(DATA_PATH, "schedules", output_file), output_format, self_country, state_evaluator.state_quality, schedule_evaluator.expected_utility) as schedule_writer:
+    for solution in found_solutions:
+      schedule = Schedule(solution.NODE)
+      final_country_state = schedule.get_country_state(self_country.name)
+      logging.debug("Final Agent Country State = {}".format(final_country_state))
+      logging.info("Final Agent Country State Quality = {}".format(state_evaluator.state_quality(final_country_state)))
+
+      expected_utility = schedule_evaluator.expected_utility(start_country_state, schedule)
+      logging.info("Schedule Expected Utility = {}".format(expected_utility))
+      schedule_evaluator.log_country_probabilities(schedule)
+      schedule_evaluator.log_country_states_diff(schedule)
+      steps = schedule_writer.write(solution, expected_utility)
+      if results_store:
+        results_store.add(steps, expected_utility, solution.STATS)
+      all_stats.append(solution.STATS)
+
+  if results_store:
+    partition_path = results_store.write()
+    logging.info(f"Results of run {results_store.RUN_ID} stored in {os.path.relpath(partition_path, results_store.DIRECTORY)}")
+
+  if stats_file:
+    Schedule.write_stats(all_stats, stats_file)
+    logging.info(f"Search stats written to {stats_file}")
+
+  schedule_writer.write_best_csv("best_solution.csv", os.path.join(DATA_PATH, "schedules"))
+
+  if Tracer.ENABLED:
+    trace_file = CONFIG.get("Trace", "File", fallback="trace.jsonl")
+    logging.info(f"Trace {Tracer.describe()}")
+    event_count = Tracer.dump(os.path.join(DATA_PATH, "schedules", trace_file))
+    logging.info(f"Wrote {event_count} trace events to {trace_file}")
 
 def parseCmdLineArgs():
   parser = argparse.ArgumentParser (description="WorldTraderSim")
@@ -230,17 +468,24 @@ def parseCmdLineArgs():
   parser.add_argument ("-r", "--resources-file", default="resources.csv", help="CSV file containing resource definitions")
   parser.add_argument ("-i", "--initial-state-file", default="initial.csv", help="CSV file containing the initial game state")
   parser.add_argument ("-o", "--output-file", default="schedules.txt", help="Output file to hold schedules generated by the AI agent")
+  parser.add_argument ("--output-format", default="text", choices=SCHEDULE_FORMATS, help="text keeps the schedules file format, jsonl writes one JSON object per schedule with its steps")
+  parser.add_argument ("--stats-file", default=None, help="JSON file written next to the output file with each schedule's search stats")
 
   # Arguments governing AI agent limitations and performance
   parser.add_argument ("-n", "--num-schedules", type=int, default=1, help="The number of output schedules to generate")
   parser.add_argument ("-d", "--depth-bound", type=int, default=100, help="How deep the AI agent is allowed to search")
   parser.add_argument ("-f", "--frontier-size", type=int, default=20000, help="Max size of the Frontier")
+  parser.add_argument ("-w", "--workers", type=int, default=1, help="Number of processes searching schedules in parallel")
+  parser.add_argument ("--seed", type=int, default=None, help="Base random seed, schedule N shuffles its actions with seed + N")
   
   # Pass all parameters as a config (overrides)
   parser.add_argument ("--config", default=SCRIPT_PATH+"/config.ini", help="configuration file (default: config.ini)")
 
   # Logging level
   parser.add_argument ("-l", "--logging-level", type=int, default=logging.INFO, choices=[logging.DEBUG,logging.INFO,logging.WARNING,logging.ERROR,logging.CRITICAL], help="logging level, choices 10,20,30,40,50: default 10=logging.DEBUG")
+
+  # Print where startup time goes instead of running
+  parser.add_argument ("--startup-profile", action="store_true", help="Print an import time breakdown of the scheduler and exit")
   
   return parser.parse_args()
 
@@ -255,15 +500,23 @@ def main():
   args = parseCmdLineArgs ()
   logging.getLogger().setLevel(args.logging_level)
 
+  if args.startup_profile:
+    return profile_startup("WorldTraderSim.main")
+
   parseConfig(args)
+  Tracer.configure(CONFIG)
 
   country_scheduler(args.country_name, args.resources_file, args.initial_state_file,
                     args.output_file, args.num_schedules,
-                    args.depth_bound, args.frontier_size)
+                    args.depth_bound, args.frontier_size,
+                    args.workers, args.seed, args.stats_file, args.output_format)
 
 
-if __name__ == "__main__":
+def run():
     # set underlying default logging capabilities
   logging.basicConfig (level=logging.DEBUG,
                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-  main()
+  return main()
+
+if __name__ == "__main__":
+  sys.exit(run())
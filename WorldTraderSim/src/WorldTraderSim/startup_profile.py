@@ -0,0 +1,46 @@
+# Standard Libraries
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+SRC_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_times(module_name: str) -> List[Tuple[str, int, int, int]]:
+  # Imports the module in a fresh interpreter so nothing is already cached in sys.modules
+  env = dict(os.environ)
+  env["PYTHONPATH"] = os.pathsep.join([SRC_PATH] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else []))
+  completed = subprocess.run([sys.executable, "-X", "importtime", "-c", "import {}".format(module_name)], env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+  if completed.returncode != 0:
+    raise Exception("Importing {} failed\n{}".format(module_name, completed.stderr))
+
+  # Lines read "import time: self [us] | cumulative | imported package", nesting is the name's indent
+  times = []
+  for line in completed.stderr.splitlines():
+    if not line.startswith("import time:") or "[us]" in line:
+      continue
+    self_us, cumulative_us, name = line[len("import time:"):].split("|")
+    depth = (len(name) - len(name.lstrip()) - 1) // 2
+    times.append((name.strip(), int(self_us), int(cumulative_us), depth))
+  return times
+
+def profile_startup(module_name: str, limit: int = 20) -> int:
+  times = import_times(module_name)
+  total_us = sum(cumulative_us for _name, _self_us, cumulative_us, depth in times if depth == 0)
+
+  by_package: Dict[str, int] = {}
+  for name, self_us, _cumulative_us, _depth in times:
+    package = name.split(".")[0]
+    by_package[package] = by_package.get(package, 0) + self_us
+
+  print("Import time of {}: {:.1f} ms across {} modules".format(module_name, total_us / 1000, len(times)))
+  print()
+  print("{:>10}  {}".format("self ms", "top level package"))
+  for package, self_us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:limit]:
+    print("{:>10.1f}  {}".format(self_us / 1000, package))
+  print()
+  print("{:>10}  {:>10}  {}".format("cumul ms", "self ms", "module"))
+  for name, self_us, cumulative_us, _depth in sorted(times, key=lambda time: time[2], reverse=True)[:limit]:
+    print("{:>10.1f}  {:>10.1f}  {}".format(cumulative_us / 1000, self_us / 1000, name))
+  return 0
@@ -0,0 +1,43 @@
+# Standard Libraries
+import configparser
+from typing import Callable, Dict, List, Tuple
+
+# External Dependencies
+import pytest
+
+# Local Modules
+from WorldTraderSim import main
+
+# Scheduler context of the bundled scenario, options override the shipped config.ini
+def build_context(options: Dict[str, Dict[str, str]] = None, country_name: str = "Atlantis") -> main.SchedulerContext:
+  config = configparser.ConfigParser()
+  config.read(main.SCRIPT_PATH + "/config.ini")
+  config.read_dict({"Scenario": {"Cache": "False"}, "Results": {"Enabled": "False"}})
+  config.read_dict(options or {})
+  main.CONFIG = config
+
+  scenario = main.load_scenario(country_name, "initial.csv", "resources.csv")
+  return main.build_scheduler_context(country_name, scenario)
+
+# Searches run in process, returns every schedule as its action strings and final expected utility
+def run_schedules(options: Dict[str, Dict[str, str]] = None, num_schedules: int = 2, depth_bound: int = 20, frontier_size: int = 20000, seed: int = 3, country_name: str = "Atlantis") -> List[Tuple[List[str], float]]:
+  context = build_context(options, country_name)
+  start_country_state = context.schedule_evaluator.initial_state[country_name]
+  schedules = []
+  for schedule_index in range(1, num_schedules+1):
+    actions = main.shuffle_actions(context.all_actions, main.schedule_rng(seed, schedule_index))
+    solution = main.search_schedule(context, actions, main.build_search_strategy(depth_bound, frontier_size))
+    path = [node.PARENT_ACTION.to_string(context.self_country) for node in solution.PATH if node.PARENT_ACTION]
+    schedules.append((path, context.schedule_evaluator.expected_utility(start_country_state, main.Schedule(solution.NODE))))
+  return schedules
+
+@pytest.fixture
+def context() -> Callable[..., main.SchedulerContext]:
+  yield build_context
+  main.CONFIG = None
+
+@pytest.fixture
+def schedules() -> Callable[..., List[Tuple[List[str], float]]]:
+  yield run_schedules
+  # Later tests and runs start from the shipped defaults
+  main.CONFIG = None
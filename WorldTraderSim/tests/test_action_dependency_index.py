@@ -0,0 +1,21 @@
+# External Dependencies
+import pytest
+
+# Local Modules
+from WorldTraderSim import main
+from WorldTraderSim.DataTypes import ActionDependencyIndex
+
+
+@pytest.mark.parametrize("engine", ["Dict", "Array"])
+def test_incremental_applicability_finds_same_schedules(schedules, engine):
+  incremental = schedules({"State": {"Engine": engine}, "Search": {"IncrementalApplicability": "True"}})
+  full = schedules({"State": {"Engine": engine}, "Search": {"IncrementalApplicability": "False"}})
+  assert incremental == full
+
+def test_incremental_applicability_is_on_when_the_config_omits_it(context):
+  scheduler_context = context()
+  main.CONFIG.remove_option("Search", "IncrementalApplicability")
+  search_strategy = main.build_search_strategy(10, 100)
+  assert search_strategy.INCREMENTAL_APPLICABILITY is True
+  search_strategy._prepare_actions(scheduler_context.start_state, scheduler_context.all_actions)
+  assert isinstance(search_strategy.dependency_index, ActionDependencyIndex)
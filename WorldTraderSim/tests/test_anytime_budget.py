@@ -0,0 +1,41 @@
+# Standard Libraries
+from typing import List
+
+# External Dependencies
+import pytest
+
+# Local Modules
+from WorldTraderSim import main
+from WorldTraderSim.SearchStrategies import BeamSearch, BestFirstSearch, HeuristicDepthFirstSearch
+
+
+# Keeps the heuristic value of every child the search generates
+def recording(strategy_class: type) -> type:
+  class RecordingStrategy(strategy_class):
+    def _evaluated_children(self, *args) -> List:
+      evaluated = super()._evaluated_children(*args)
+      self.generated_utilities.extend(utility for _child, utility in evaluated)
+      return evaluated
+  return RecordingStrategy
+
+def search(scheduler_context: main.SchedulerContext, strategy_class: type):
+  search_strategy = recording(strategy_class)(False, 20, 20000)
+  search_strategy.configure(main.CONFIG)
+  search_strategy.generated_utilities = []
+  actions = main.shuffle_actions(scheduler_context.all_actions, main.schedule_rng(3, 1))
+  return main.search_schedule(scheduler_context, actions, search_strategy), search_strategy
+
+
+@pytest.mark.parametrize("strategy_class", [HeuristicDepthFirstSearch, BestFirstSearch, BeamSearch])
+def test_expansion_budget_returns_best_generated_child(context, strategy_class):
+  scheduler_context = context({"Search": {"ExpansionBudget": "5"}})
+  solution, search_strategy = search(scheduler_context, strategy_class)
+  assert solution.STATS.stop_reason == "expansion_budget"
+  assert search_strategy.best_utility == max(search_strategy.generated_utilities)
+  assert scheduler_context.heuristic.apply(solution.NODE) == search_strategy.best_utility
+
+def test_best_node_is_not_tracked_without_a_budget(context):
+  scheduler_context = context()
+  solution, search_strategy = search(scheduler_context, BestFirstSearch)
+  assert solution.STATS.stop_reason == "depth_bound"
+  assert search_strategy.best_node is None
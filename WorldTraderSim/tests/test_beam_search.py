@@ -0,0 +1,64 @@
+# Standard Libraries
+from collections import Counter
+from typing import List
+
+# External Dependencies
+import pytest
+
+# Local Modules
+from WorldTraderSim import main
+from WorldTraderSim.DataTypes import Node
+from WorldTraderSim.SearchStrategies import BeamSearch, BestFirstSearch
+
+
+# Keeps the depth of every node the beam expands
+class RecordingBeamSearch(BeamSearch):
+  def _expand(self, actions, heuristic, node: Node) -> List:
+    self.expanded_depths.append(node.depth())
+    return super()._expand(actions, heuristic, node)
+
+def beam_search(scheduler_context: main.SchedulerContext, actions: List, depth_bound: int) -> main.Solution:
+  search_strategy = RecordingBeamSearch(False, depth_bound, 20000)
+  search_strategy.configure(main.CONFIG)
+  search_strategy.expanded_depths = []
+  solution = main.search_schedule(scheduler_context, actions, search_strategy)
+  return solution, search_strategy
+
+# Every node the actions reach at the given depth, no pruning
+def enumerate_nodes(node: Node, actions: List, depth: int) -> List[Node]:
+  if node.depth() == depth:
+    return [node]
+  children = [Node(action.next_state(node.STATE), node, action, node.PATH_COST + action.ACTION_COST) for action in actions if action.is_applicable(node.STATE)]
+  return [leaf for child in children for leaf in enumerate_nodes(child, actions, depth)]
+
+
+@pytest.mark.parametrize("beam_width", [1, 3])
+def test_beam_is_capped_at_its_width(context, beam_width):
+  scheduler_context = context({"Search": {"BeamWidth": str(beam_width)}})
+  actions = main.shuffle_actions(scheduler_context.all_actions, main.schedule_rng(3, 1))
+  solution, search_strategy = beam_search(scheduler_context, actions, 6)
+
+  assert solution.NODE.depth() == 6
+  # The root alone, then a full beam at every depth after it
+  assert Counter(search_strategy.expanded_depths) == {1: 1, **{depth: beam_width for depth in range(2, 6)}}
+  assert solution.STATS.frontier_dropped > 0
+
+@pytest.mark.parametrize("engine", ["Dict", "Array"])
+def test_beam_wide_enough_for_every_child_finds_the_best_node(context, engine):
+  scheduler_context = context({"State": {"Engine": engine}, "Search": {"BeamWidth": "100000", "EnableReached": "False"}})
+  heuristic = scheduler_context.heuristic
+  actions = main.shuffle_actions(scheduler_context.all_actions, main.schedule_rng(3, 1))
+  root = Node(scheduler_context.start_state, None, None, 0.0)
+  # A small scenario, the first actions applicable from the start state
+  actions = [action for action in actions if action.is_applicable(root.STATE)][:6]
+
+  # One expansion, the beam keeps the child best first search ranks first
+  solution, _search_strategy = beam_search(scheduler_context, actions, 2)
+  ranked = BestFirstSearch(True, 2, 20000)._expand(actions, heuristic, root)
+  assert heuristic.apply(solution.NODE) == ranked[0][1] == max(utility for _child, utility in ranked)
+
+  # Deeper, nothing is dropped so the beam ends on the best node of the whole depth
+  solution, _search_strategy = beam_search(scheduler_context, actions, 4)
+  assert solution.STATS.frontier_dropped == 0
+  assert solution.NODE.depth() == 4
+  assert heuristic.apply(solution.NODE) == max(heuristic.apply(node) for node in enumerate_nodes(root, actions, 4))
@@ -0,0 +1,32 @@
+# Standard Libraries
+import json
+import os
+import subprocess
+import sys
+
+# External Dependencies
+import pytest
+
+# Local Modules
+from WorldTraderSim import benchmark
+
+
+# Runs every strategy of a bundled scenario through the benchmark command at a small depth
+@pytest.mark.parametrize("scenario", list(benchmark.SCENARIOS))
+def test_benchmark_runs_every_scenario(tmp_path, scenario):
+  output_file = tmp_path / "latest.json"
+  completed = subprocess.run([
+    sys.executable, os.path.join(benchmark.SCRIPT_PATH, "benchmark.py"),
+    "--scenarios", scenario, "--depths", "3", "-f", "100",
+    "-o", str(output_file), "--baseline", str(tmp_path / "baseline.json"), "--write-baseline", "-l", "40",
+  ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+  assert completed.returncode == 0, completed.stderr
+
+  with open(output_file) as file:
+    results = json.load(file)["results"]
+  assert sorted(results) == sorted(
+    benchmark.case_name(scenario, strategy, reached, 3) for strategy in benchmark.STRATEGIES for reached in [True, False]
+  )
+  for metrics in results.values():
+    assert metrics["expansions"] > 0
+    assert metrics["best_expected_utility"] is not None
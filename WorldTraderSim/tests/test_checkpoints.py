@@ -0,0 +1,42 @@
+# External Dependencies
+import pytest
+
+# Local Modules
+from WorldTraderSim import main
+from WorldTraderSim.DataTypes import Node
+
+
+def country_states(state):
+  return {country_name: country for country_name, country in state.items()}
+
+@pytest.mark.parametrize("strategy", ["HeuristicDepthFirstSearch", "BestFirstSearch", "BeamSearch"])
+@pytest.mark.parametrize("engine", ["Dict", "Array"])
+def test_checkpoints_find_same_schedules_as_kept_states(schedules, monkeypatch, strategy, engine):
+  monkeypatch.setattr(Node, "CHECKPOINT_INTERVAL", 0)
+  kept = schedules({"State": {"Engine": engine, "CheckpointInterval": "0"}, "Search": {"Strategy": strategy}})
+  checkpointed = schedules({"State": {"Engine": engine, "CheckpointInterval": "3"}, "Search": {"Strategy": strategy}})
+  assert Node.CHECKPOINT_INTERVAL == 3
+  assert checkpointed == kept
+  assert all(path for path, _eu in kept)
+
+@pytest.mark.parametrize("engine", ["Dict", "Array"])
+def test_released_states_replay_from_their_checkpoint(context, monkeypatch, engine):
+  monkeypatch.setattr(Node, "CHECKPOINT_INTERVAL", 0)
+  scheduler_context = context({"State": {"Engine": engine, "CheckpointInterval": "3"}})
+  actions = main.shuffle_actions(scheduler_context.all_actions, main.schedule_rng(3, 1))
+
+  nodes = [Node(scheduler_context.start_state, None, None, 0.0)]
+  while len(nodes) < 10:
+    node = nodes[-1]
+    action = next(action for action in actions if action.is_applicable(node.STATE))
+    nodes.append(Node(action.next_state(node.STATE), node, action, node.PATH_COST + action.ACTION_COST))
+  expected = [(country_states(node.STATE), node.state_hash()) for node in nodes]
+
+  for node in nodes:
+    node.release_state()
+  assert [node.DEPTH for node in nodes if node._STATE is not None] == [1, 3, 6, 9]
+
+  # Deepest first, so each replay starts from the nearest kept ancestor
+  for node, (state, state_hash) in reversed(list(zip(nodes, expected))):
+    assert country_states(node.STATE) == state
+    assert Node.HASHER.hash_state(node.STATE) == state_hash
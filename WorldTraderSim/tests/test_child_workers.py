@@ -0,0 +1,18 @@
+# External Dependencies
+import pytest
+
+
+@pytest.mark.parametrize("strategy", ["HeuristicDepthFirstSearch", "BestFirstSearch"])
+@pytest.mark.parametrize("state, incremental", [
+  ({"Engine": "Dict", "CopyOnWrite": "True"}, "True"),
+  ({"Engine": "Dict", "CopyOnWrite": "False"}, "True"),
+  ({"Engine": "Dict", "CopyOnWrite": "True"}, "False"),
+  ({"Engine": "Array"}, "True"),
+  ({"Engine": "Array"}, "False"),
+])
+def test_child_workers_find_same_schedules_as_serial(schedules, strategy, state, incremental):
+  search = {"Strategy": strategy, "IncrementalApplicability": incremental}
+  serial = schedules({"State": state, "Search": {**search, "ChildWorkers": "1"}}, depth_bound=10)
+  parallel = schedules({"State": state, "Search": {**search, "ChildWorkers": "2"}}, depth_bound=10)
+  assert parallel == serial
+  assert all(path for path, _eu in serial)
@@ -0,0 +1,41 @@
+# Standard Libraries
+import copy
+import random
+
+# External Dependencies
+import pytest
+
+# Local Modules
+from WorldTraderSim import main
+from WorldTraderSim.DataTypes import Action
+
+
+@pytest.mark.parametrize("strategy", ["HeuristicDepthFirstSearch", "BestFirstSearch", "BeamSearch"])
+def test_copy_on_write_finds_same_schedules_as_eager_copies(schedules, strategy):
+  copied = schedules({"State": {"Engine": "Dict", "CopyOnWrite": "True"}, "Search": {"Strategy": strategy}}, depth_bound=8)
+  eager = schedules({"State": {"Engine": "Dict", "CopyOnWrite": "False"}, "Search": {"Strategy": strategy}}, depth_bound=8)
+  assert copied == eager
+
+def test_copy_on_write_states_match_eager_states_and_never_modify_parents(context):
+  scheduler_context = context({"State": {"Engine": "Dict", "CopyOnWrite": "True"}})
+  rng = random.Random(11)
+  state = scheduler_context.start_state
+  for _step in range(60):
+    action = rng.choice([action for action in scheduler_context.all_actions if action.is_applicable(state)])
+    parent_snapshot = copy.deepcopy(state)
+
+    Action.COPY_ON_WRITE = False
+    eager_state = action.apply(state)
+    Action.COPY_ON_WRITE = True
+    child_state = action.apply(state)
+
+    assert {name: country.resources for name, country in child_state.items()} == {name: country.resources for name, country in eager_state.items()}
+    assert {name: country.resources for name, country in state.items()} == {name: country.resources for name, country in parent_snapshot.items()}
+    state = child_state
+
+def test_copy_on_write_is_on_when_the_config_omits_it(context):
+  context({"State": {"CopyOnWrite": "False"}})
+  assert Action.COPY_ON_WRITE is False
+  main.CONFIG.remove_option("State", "CopyOnWrite")
+  main.build_scheduler_context("Atlantis", main.load_scenario("Atlantis", "initial.csv", "resources.csv"))
+  assert Action.COPY_ON_WRITE is True
@@ -0,0 +1,49 @@
+# Standard Libraries
+import argparse
+import shutil
+
+# External Dependencies
+import pytest
+
+# Local Modules
+from WorldTraderSim import graph_schedule
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+# Two schedule CSVs in the current format, one written before state quality was recorded and a CSV that is not a schedule
+@pytest.fixture
+def results_dir(tmp_path):
+  shutil.copy(graph_schedule.DATA_PATH + "/schedules/example1_best_solution.csv", tmp_path / "example1.csv")
+  shutil.copy(graph_schedule.DATA_PATH + "/schedules/example2_best_solution.csv", tmp_path / "example2.csv")
+  (tmp_path / "older.csv").write_text("action_type,step,expected_utility\nActionType.TRANSFER,2,0.5\nActionType.TRANSFORM,3,0.75\n")
+  (tmp_path / "notes.csv").write_text("name,value\nwidth,10\n")
+  return tmp_path
+
+def is_png(path) -> bool:
+  with open(path, "rb") as file:
+    return file.read(len(PNG_SIGNATURE)) == PNG_SIGNATURE
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_renders_every_schedule_headless(results_dir, monkeypatch, workers):
+  import matplotlib
+  import matplotlib.pyplot as plt
+
+  monkeypatch.setattr(graph_schedule, "BATCH_FIGURE", None)
+  args = argparse.Namespace(batch=str(results_dir), workers=workers, compare="compare.png", schedules_dir=str(results_dir))
+  assert graph_schedule.graph_schedules(args) == (3, 4)
+
+  assert matplotlib.get_backend().lower() == "agg"
+  assert sorted(path.name for path in results_dir.glob("*.png")) == ["compare.png", "example1.png", "example2.png", "older.png"]
+  assert all(is_png(path) for path in results_dir.glob("*.png"))
+  plt.close("all")
+
+def test_comparison_overlays_only_schedules(results_dir):
+  import matplotlib.pyplot as plt
+
+  open_figures = plt.get_fignums()
+  csv_paths = graph_schedule.schedule_csv_paths(str(results_dir / "*.csv"))
+  assert graph_schedule.graph_comparison(csv_paths, str(results_dir / "compare.png")) == 3
+  assert is_png(results_dir / "compare.png")
+  # The comparison figure is closed once saved
+  assert plt.get_fignums() == open_figures
@@ -0,0 +1,47 @@
+# Standard Libraries
+import os
+import signal
+import threading
+import time
+
+# Local Modules
+from WorldTraderSim import main
+
+# Deep enough that no search finishes before it is interrupted
+DEPTH_BOUND = 400
+
+
+def interrupt_after(seconds: float) -> threading.Timer:
+  timer = threading.Timer(seconds, os.kill, (os.getpid(), signal.SIGINT))
+  timer.start()
+  return timer
+
+def test_interrupted_workers_return_best_schedules(context):
+  scheduler_context = context({"Search": {"Strategy": "BestFirstSearch"}})
+  scenario = main.load_scenario("Atlantis", "initial.csv", "resources.csv")
+
+  start = time.perf_counter()
+  timer = interrupt_after(2.0)
+  solutions = list(main.search_schedules_parallel(scheduler_context, 2, 3, "Atlantis", scenario, 4, DEPTH_BOUND, 20000))
+  timer.join()
+
+  assert time.perf_counter() - start < 30
+  # The two running searches return what they had, the two queued ones are skipped
+  assert len(solutions) == 2
+  assert all(solution.STATS.stop_reason == "interrupted" for solution in solutions)
+  assert all(solution.NODE.depth() > 1 for solution in solutions)
+  assert signal.getsignal(signal.SIGINT) is signal.default_int_handler
+
+def test_interrupted_serial_search_returns_best_schedule(context):
+  scheduler_context = context({"Search": {"Strategy": "BestFirstSearch"}})
+
+  start = time.perf_counter()
+  timer = interrupt_after(1.0)
+  solutions = list(main.search_schedules(scheduler_context, 3, 4, DEPTH_BOUND, 20000))
+  timer.join()
+
+  assert time.perf_counter() - start < 30
+  assert len(solutions) == 1
+  assert solutions[0].STATS.stop_reason == "interrupted"
+  assert solutions[0].NODE.depth() > 1
+  assert signal.getsignal(signal.SIGINT) is signal.default_int_handler
@@ -0,0 +1,77 @@
+# Standard Libraries
+import random
+
+# Local Modules
+from WorldTraderSim.DataTypes import PriorityQueue
+
+# Nodes are plain names here, the evaluation function looks up their priority
+def queue_of(priorities, ascending=False, capacity=None):
+  return PriorityQueue(lambda name: priorities[name], ascending, capacity)
+
+def pop_all(queue):
+  names = []
+  while not queue.is_empty():
+    names.append(queue.pop())
+  return names
+
+
+def test_pops_best_first_and_most_recent_of_ties_first():
+  priorities = {"a": 1, "b": 3, "c": 3, "d": 2, "e": 3}
+  queue = queue_of(priorities)
+  for name in "abcde":
+    queue.add(name)
+  assert pop_all(queue) == ["e", "c", "b", "d", "a"]
+
+  queue = queue_of(priorities, ascending=True)
+  for name in "abcde":
+    queue.add(name)
+  assert pop_all(queue) == ["a", "d", "e", "c", "b"]
+
+def test_bounded_queue_evicts_the_entry_popped_last():
+  priorities = {"a": 1, "b": 5, "c": 3, "d": 4, "e": 0}
+  queue = queue_of(priorities, capacity=3)
+  for name in "abcd":
+    queue.add(name)
+  # d (4) evicts a (1), the entry that would be popped last
+  assert queue.evicted_count == 1 and queue.length() == 3
+  # e (0) is worse than everything kept so it is dropped
+  queue.add("e")
+  assert queue.dropped_count == 1
+  assert pop_all(queue) == ["b", "d", "c"]
+
+def test_bounded_queue_evicts_the_oldest_of_tied_worst_entries():
+  priorities = {"a": 2, "b": 2, "c": 2, "d": 9}
+  queue = queue_of(priorities, capacity=2)
+  for name in "abc":
+    queue.add(name)
+  # Of equal entries the oldest is popped last, so c replaces a
+  assert queue.evicted_count == 1 and queue.dropped_count == 0
+  queue.add("d")
+  # d evicts b, the oldest of the remaining tie
+  assert pop_all(queue) == ["d", "c"]
+
+def test_bounded_queue_matches_a_sorted_list_under_random_operations():
+  rng = random.Random(5)
+  for capacity in [1, 4, 16]:
+    priorities = {}
+    queue = queue_of(priorities, capacity=capacity)
+    # Reference model, (negated priority, negated insertion order) sorts in pop order
+    model = []
+    for operation in range(2000):
+      if model and rng.random() < 0.3:
+        model.sort()
+        assert queue.pop() == model.pop(0)[2]
+      else:
+        name = "n{}".format(operation)
+        priorities[name] = rng.randint(0, 10)
+        entry = (-priorities[name], -operation, name)
+        if len(model) >= capacity:
+          worst = max(model)
+          if entry >= worst:
+            queue.add(name)
+            continue
+          model.remove(worst)
+        model.append(entry)
+        queue.add(name)
+      assert queue.length() == len(model)
+    assert pop_all(queue) == [name for _priority, _order, name in sorted(model)]
@@ -0,0 +1,63 @@
+# Standard Libraries
+import importlib
+import os
+import random
+
+# External Dependencies
+import numpy as np
+import pytest
+
+# Local Modules
+from WorldTraderSim.ReachedStores import DictReachedStore, DiskSpillReachedStore, HashTableReachedStore
+
+# The package exports the class under the module's name
+disk_spill_module = importlib.import_module("WorldTraderSim.ReachedStores.DiskSpillReachedStore")
+
+
+def random_keys(count, seed=1):
+  rng = random.Random(seed)
+  return [rng.getrandbits(64) for _ in range(count)] + [0]
+
+@pytest.mark.parametrize("store_class", [DictReachedStore, HashTableReachedStore])
+def test_exact_stores_track_the_best_path_cost(store_class):
+  store = store_class()
+  reference = {}
+  rng = random.Random(2)
+  keys = random_keys(500)
+  for _ in range(5000):
+    key = rng.choice(keys)
+    cost = float(rng.randint(0, 20))
+    expected = key not in reference or cost < reference[key]
+    if expected:
+      reference[key] = cost
+    assert store.add(key, cost) == expected
+  assert len(store) == len(reference)
+  assert all(key in store for key in reference)
+  assert not any(key in store for key in random_keys(100, seed=3)[:-1])
+
+def test_disk_spill_merges_runs_by_streaming_blocks(monkeypatch):
+  monkeypatch.setattr(disk_spill_module, "MERGE_BLOCK_SIZE", 7)
+  store = DiskSpillReachedStore(spill_threshold=50)
+  try:
+    keys = random_keys(3000)
+    for key in keys:
+      assert store.add(key)
+      # Keys already spilled or held in memory are never new again
+      assert not store.add(key)
+    assert len(store) == len(set(keys))
+    assert all(key in store for key in keys)
+    assert not any(key in store for key in random_keys(200, seed=4)[:-1])
+
+    # Merged runs stay sorted and disjoint, and only live runs are left on disk
+    assert len(store.runs) <= disk_spill_module.MAX_SPILLED_RUNS
+    for run in store.runs:
+      assert np.all(run[1:] > run[:-1])
+    spilled = np.concatenate(store.runs)
+    assert len(np.unique(spilled)) == len(spilled)
+    assert sorted(os.listdir(store.spill_directory)) == sorted(os.path.basename(run.filename) for run in store.runs)
+  finally:
+    store.close()
+
+@pytest.mark.parametrize("options", [{"ReachedStore": "HashTable"}, {"ReachedStore": "DiskSpill", "ReachedSpillThreshold": "64"}])
+def test_exact_stores_find_the_same_schedules(schedules, options):
+  assert schedules({"Search": dict(options, Strategy="BestFirstSearch")}) == schedules({"Search": {"ReachedStore": "Dict", "Strategy": "BestFirstSearch"}})
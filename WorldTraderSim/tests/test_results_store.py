@@ -0,0 +1,90 @@
+# Standard Libraries
+import os
+from typing import Dict, List
+
+# External Dependencies
+import numpy as np
+
+# Local Modules
+from WorldTraderSim import main
+from WorldTraderSim.DataTypes import ResultsStore, Schedule
+
+
+def solution_steps(context: main.SchedulerContext, seed: int) -> List:
+  steps = []
+  for solution in main.search_schedules(context, seed, 2, 6, 20000):
+    expected_utility = context.schedule_evaluator.expected_utility(context.schedule_evaluator.initial_state["Atlantis"], Schedule(solution.NODE))
+    steps.append((Schedule.path_steps(solution, context.state_evaluator.state_quality, context.schedule_evaluator.expected_utility, context.self_country), expected_utility, solution.STATS))
+  return steps
+
+def write_run(context: main.SchedulerContext, directory: str, run_id: str, scenario: str, config: Dict, seed: int, schedules: List) -> ResultsStore:
+  results_store = ResultsStore(directory, scenario, config, seed, context.self_country)
+  # Fixed so partitions sort in write order
+  results_store.RUN_ID = run_id
+  for steps, expected_utility, stats in schedules:
+    results_store.add(steps, expected_utility, stats)
+  results_store.write()
+  return results_store
+
+
+def test_query_returns_rows_of_matching_partitions(context, tmp_path):
+  scheduler_context = context()
+  directory = str(tmp_path)
+  first_schedules, second_schedules = solution_steps(scheduler_context, 3), solution_steps(scheduler_context, 4)
+  config = {"Search": {"Strategy": "HeuristicDepthFirstSearch"}}
+  other_config = {"Search": {"Strategy": "BestFirstSearch"}}
+  runs = [
+    write_run(scheduler_context, directory, "20260101T000000-00000001", "atlantis", config, 3, first_schedules),
+    # A schedule without steps still has its schedule row
+    write_run(scheduler_context, directory, "20260101T000000-00000002", "atlantis", config, 4, [([], 0.0, None)]),
+    write_run(scheduler_context, directory, "20260101T000000-00000003", "atlantis", config, 4, second_schedules),
+    write_run(scheduler_context, directory, "20260101T000000-00000004", "erewhon", other_config, 3, first_schedules),
+  ]
+  run_ids = [results_store.RUN_ID for results_store in runs]
+
+  assert [os.path.basename(partition) for partition in ResultsStore.partitions(directory)] == [run_id + ".npz" for run_id in run_ids]
+  assert len(ResultsStore.partitions(directory, scenario="atlantis")) == 3
+  assert len(ResultsStore.partitions(directory, seed=3)) == 2
+  assert len(ResultsStore.partitions(directory, config=ResultsStore.config_key(other_config))) == 1
+  assert len(ResultsStore.partitions(directory, run_id=run_ids[2])) == 1
+
+  # Rows of each partition follow each other oldest run first, with their own run keys
+  rows = ResultsStore.query(directory, scenario="atlantis")
+  expected_steps = [(run_id, seed, schedule, step) for run_id, seed, schedules in [(run_ids[0], 3, first_schedules), (run_ids[2], 4, second_schedules)]
+                    for schedule, (steps, _eu, _stats) in enumerate(schedules, start=1) for step in steps]
+  assert len(rows["step"]) == len(expected_steps) > 0
+  assert list(rows["run_id"]) == [run_id for run_id, _seed, _schedule, _step in expected_steps]
+  assert list(rows["seed"]) == [str(seed) for _run_id, seed, _schedule, _step in expected_steps]
+  assert set(rows["scenario"]) == {"atlantis"}
+  assert list(rows["schedule"]) == [schedule for _run_id, _seed, schedule, _step in expected_steps]
+  assert list(rows["step"]) == [step["step"] for _run_id, _seed, _schedule, step in expected_steps]
+  assert list(rows["action"]) == [step["action"].to_string(scheduler_context.self_country) for _run_id, _seed, _schedule, step in expected_steps]
+  assert list(rows["action_type"]) == [step["action"].ACTION_TYPE.name for _run_id, _seed, _schedule, step in expected_steps]
+  assert list(rows["expected_utility"]) == [step["expected_utility"] for _run_id, _seed, _schedule, step in expected_steps]
+  assert list(rows["state_quality"]) == [step["state_quality"] for _run_id, _seed, _schedule, step in expected_steps]
+
+  schedule_rows = ResultsStore.query(directory, scenario="atlantis", seed=4, schedules=True)
+  assert list(schedule_rows["run_id"]) == [run_ids[1]] + [run_ids[2]] * len(second_schedules)
+  assert list(schedule_rows["schedule"]) == [1] + list(range(1, len(second_schedules)+1))
+  assert list(schedule_rows["schedule_steps"]) == [0] + [len(steps) for steps, _eu, _stats in second_schedules]
+  assert list(schedule_rows["schedule_expected_utility"]) == [0.0] + [eu for _steps, eu, _stats in second_schedules]
+  assert list(schedule_rows["schedule_generated"]) == [0] + [stats.generated for _steps, _eu, stats in second_schedules]
+
+  assert all(len(values) == 0 for values in ResultsStore.query(directory, seed=5).values())
+
+def test_runs_store_results_only_when_enabled(context, tmp_path, monkeypatch):
+  monkeypatch.setattr(main, "DATA_PATH", str(tmp_path))
+  directory = str(tmp_path / "results")
+  for enabled in ["False", "True"]:
+    context({"Results": {"Enabled": enabled, "Directory": directory}})
+    main.country_scheduler("Atlantis", "resources.csv", "initial.csv", "new.txt", 2, 6, 20000, seed=3)
+    if enabled == "False":
+      assert not os.path.exists(directory)
+
+  partitions = ResultsStore.partitions(directory, seed=3)
+  assert len(partitions) == 1
+  assert partitions == ResultsStore.partitions(directory, scenario=main.scenario_key("Atlantis", "initial.csv", "resources.csv"))
+  rows = ResultsStore.query(directory, schedules=True)
+  assert list(rows["schedule"]) == [1, 2]
+  assert np.all(rows["schedule_steps"] > 0)
+  assert sorted(os.listdir(tmp_path / "schedules")) == ["best_solution.csv", "new.txt"]
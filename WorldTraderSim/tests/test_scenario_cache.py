@@ -0,0 +1,65 @@
+# Standard Libraries
+import os
+import shutil
+
+# Local Modules
+from WorldTraderSim import main
+from WorldTraderSim.Parsers import ScenarioCache
+
+
+def describe(scenario):
+  return (
+    [(country.name, {name: resource.quantity for name, resource in country.resources.items()}) for country in scenario.initial_state],
+    [(resource.name, resource.weight, resource.factor) for resource in scenario.resources],
+    [(template.name, [(quantity.name, quantity.quantity) for quantity in template.inputs], [(quantity.name, quantity.quantity) for quantity in template.outputs]) for template in scenario.transform_templates],
+    [(type(action).__name__, action.ACTION_COST, list(action.REQUIREMENTS), list(action.EFFECTS)) for action in scenario.actions],
+  )
+
+def test_scenario_cache_round_trip(context, tmp_path):
+  context()
+  parsed = main.parse_scenario("Atlantis", "initial.csv", "resources.csv")
+  ScenarioCache.save(str(tmp_path / "scenario"), parsed)
+  loaded = ScenarioCache.load(str(tmp_path / "scenario"))
+  assert describe(loaded) == describe(parsed)
+  self_country = parsed.initial_state[0]
+  assert [action.to_string(self_country) for action in loaded.actions] == [action.to_string(self_country) for action in parsed.actions]
+
+def test_cached_scenario_finds_same_schedules(schedules, tmp_path, monkeypatch):
+  cached = {"Scenario": {"Cache": "True", "CacheDirectory": str(tmp_path)}}
+  stored = schedules(cached, depth_bound=10)
+  assert len(os.listdir(tmp_path)) == 1
+
+  # Later runs load the compiled scenario without parsing anything
+  def parse_scenario(*args):
+    raise AssertionError("Scenario was parsed rather than loaded from the cache")
+  monkeypatch.setattr(main, "parse_scenario", parse_scenario)
+  loaded = schedules(cached, depth_bound=10)
+  monkeypatch.undo()
+
+  assert loaded == stored == schedules(depth_bound=10)
+
+def test_changed_sources_invalidate_cached_scenario(context, tmp_path, monkeypatch):
+  states_path = tmp_path / "states"
+  shutil.copytree(main.STATES_PATH, states_path)
+  monkeypatch.setattr(main, "STATES_PATH", str(states_path))
+  cache_path = tmp_path / "cache"
+  context({"Scenario": {"Cache": "True", "CacheDirectory": str(cache_path)}})
+
+  key = main.scenario_key("Atlantis", "initial.csv", "resources.csv")
+  main.load_scenario("Atlantis", "initial.csv", "resources.csv")
+  assert os.listdir(cache_path) == [key]
+
+  # Options and the self country are part of the key as well as the files
+  assert main.scenario_key("Europa", "initial.csv", "resources.csv") != key
+  main.CONFIG.set("Actions", "TransferQuantityMax", "2")
+  assert main.scenario_key("Atlantis", "initial.csv", "resources.csv") != key
+  main.CONFIG.set("Actions", "TransferQuantityMax", "5")
+
+  resources_csv = states_path / "resources.csv"
+  resources_csv.write_text(resources_csv.read_text().replace("Population,0.3,", "Population,0.5,"))
+  changed_key = main.scenario_key("Atlantis", "initial.csv", "resources.csv")
+  assert changed_key != key
+
+  scenario = main.load_scenario("Atlantis", "initial.csv", "resources.csv")
+  assert sorted(os.listdir(cache_path)) == sorted([key, changed_key])
+  assert next(resource.weight for resource in scenario.resources if resource.name == "Population") == 0.5
@@ -0,0 +1,102 @@
+# Standard Libraries
+import csv
+import json
+from typing import Dict, List
+
+# Local Modules
+from WorldTraderSim import main
+from WorldTraderSim.DataTypes import Schedule, ScheduleWriter, Solution
+
+
+# The schedules file as written before schedules were streamed, every path walked back from each step's node
+def previous_schedules_text(solutions: Dict[float, Solution], context: main.SchedulerContext) -> str:
+  text = ""
+  for utility in sorted(solutions, reverse=True):
+    if text:
+      text += ",\n"
+    text += "[\n"
+    for node in solutions[utility].PATH:
+      if node.PARENT_ACTION:
+        eu = context.schedule_evaluator.expected_utility(context.self_country, Schedule(node))
+        text += "  " + node.PARENT_ACTION.to_string(context.self_country) + " EU: {}\n".format(eu)
+    text += "]"
+  return text
+
+def previous_best_csv(solution: Solution, context: main.SchedulerContext, output_path: str):
+  rows = []
+  for index, node in enumerate(solution.PATH):
+    if node.PARENT_ACTION:
+      schedule = Schedule(node)
+      rows.append({
+        "action_type": node.PARENT_ACTION.ACTION_TYPE,
+        "step": index+1,
+        "expected_utility": context.schedule_evaluator.expected_utility(context.self_country, schedule),
+        "state_quality": context.state_evaluator.state_quality(schedule.get_country_state(context.self_country.name)),
+      })
+  with open(output_path, "w", newline="") as file:
+    csv_file = csv.DictWriter(file, fieldnames=["action_type", "step", "expected_utility", "state_quality"])
+    csv_file.writeheader()
+    csv_file.writerows(rows)
+
+def found_solutions(context: main.SchedulerContext) -> List[Solution]:
+  return list(main.search_schedules(context, 3, 3, 15, 20000))
+
+def schedule_writer(context: main.SchedulerContext, output_path: str, output_format: str) -> ScheduleWriter:
+  return ScheduleWriter(output_path, output_format, context.self_country, context.state_evaluator.state_quality, context.schedule_evaluator.expected_utility)
+
+def expected_utility(context: main.SchedulerContext, solution: Solution) -> float:
+  return context.schedule_evaluator.expected_utility(context.schedule_evaluator.initial_state["Atlantis"], Schedule(solution.NODE))
+
+
+def test_text_output_matches_previous_writer(context, tmp_path):
+  scheduler_context = context()
+  solutions = found_solutions(scheduler_context)
+  # The first schedule found again, the file keeps one schedule per EU
+  solutions.append(solutions[0])
+  output_path = str(tmp_path / "schedules.txt")
+
+  with schedule_writer(scheduler_context, output_path, "text") as writer:
+    previous_solutions = {}
+    for solution in solutions:
+      writer.write(solution, expected_utility(scheduler_context, solution))
+      previous_solutions[expected_utility(scheduler_context, solution)] = solution
+      if len(previous_solutions) == 1:
+        # Written as soon as its search finishes
+        with open(output_path) as file:
+          assert file.read() == previous_schedules_text(previous_solutions, scheduler_context)
+  with open(output_path) as file:
+    assert file.read() == previous_schedules_text(previous_solutions, scheduler_context)
+
+  best_eu = max(previous_solutions)
+  writer.write_best_csv("best.csv", str(tmp_path))
+  previous_best_csv(previous_solutions[best_eu], scheduler_context, str(tmp_path / "previous_best.csv"))
+  with open(tmp_path / "best.csv", "rb") as file, open(tmp_path / "previous_best.csv", "rb") as previous_file:
+    assert file.read() == previous_file.read()
+
+def test_jsonl_output_has_one_record_per_schedule(context, tmp_path):
+  scheduler_context = context()
+  solutions = found_solutions(scheduler_context)
+  output_path = str(tmp_path / "schedules.jsonl")
+
+  with schedule_writer(scheduler_context, output_path, "jsonl") as writer:
+    for solution in solutions:
+      writer.write(solution, expected_utility(scheduler_context, solution))
+
+  with open(output_path) as file:
+    lines = file.read().splitlines()
+  assert len(lines) == len(solutions)
+  for schedule_number, (line, solution) in enumerate(zip(lines, solutions), start=1):
+    record = json.loads(line)
+    assert sorted(record) == ["expected_utility", "schedule", "steps"]
+    assert record["schedule"] == schedule_number
+    assert record["expected_utility"] == expected_utility(scheduler_context, solution)
+
+    path = [node for node in solution.PATH if node.PARENT_ACTION]
+    assert len(record["steps"]) == len(path) > 0
+    for step, node in zip(record["steps"], path):
+      assert sorted(step) == ["action", "action_type", "expected_utility", "state_quality", "step"]
+      assert step["step"] == node.depth()
+      assert step["action_type"] == node.PARENT_ACTION.ACTION_TYPE.name
+      assert step["action"] == node.PARENT_ACTION.to_string(scheduler_context.self_country)
+      assert step["expected_utility"] == scheduler_context.schedule_evaluator.expected_utility(scheduler_context.self_country, Schedule(node))
+      assert isinstance(step["state_quality"], float)
@@ -0,0 +1,23 @@
+# External Dependencies
+import pytest
+
+# Local Modules
+from WorldTraderSim import main
+
+
+# Every generated child is scored once, plus the root the frontier starts from
+@pytest.mark.parametrize("strategy", ["HeuristicDepthFirstSearch", "BestFirstSearch", "BeamSearch"])
+def test_heuristic_is_applied_once_per_generated_node(context, strategy):
+  scheduler_context = context({"Search": {"Strategy": strategy}})
+  evaluation = scheduler_context.heuristic.EVALUATION
+  calls = []
+  def counted(node):
+    calls.append(node.ID)
+    return evaluation(node)
+  scheduler_context.heuristic.EVALUATION = counted
+
+  actions = main.shuffle_actions(scheduler_context.all_actions, main.schedule_rng(3, 1))
+  solution = main.search_schedule(scheduler_context, actions, main.build_search_strategy(20, 20000))
+  assert solution.STATS.generated > 0
+  assert len(set(calls)) == len(calls)
+  assert len(calls) <= solution.STATS.generated + 1
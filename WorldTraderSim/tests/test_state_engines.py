@@ -0,0 +1,24 @@
+# Local Modules
+from WorldTraderSim import main
+from WorldTraderSim.DataTypes import ActionTable
+
+
+
+def test_array_and_dict_engines_find_identical_schedules(schedules):
+  dict_schedules = schedules({"State": {"Engine": "Dict"}})
+  array_schedules = schedules({"State": {"Engine": "Array"}})
+  assert [path for path, _eu in dict_schedules] == [path for path, _eu in array_schedules]
+  assert [eu for _path, eu in dict_schedules] == [eu for _path, eu in array_schedules]
+  assert all(path for path, _eu in dict_schedules)
+
+def test_array_engine_without_batch_expansion_matches_batched(schedules):
+  batched = schedules({"State": {"Engine": "Array"}, "Search": {"BatchExpansion": "True"}})
+  unbatched = schedules({"State": {"Engine": "Array"}, "Search": {"BatchExpansion": "False"}})
+  assert batched == unbatched
+
+def test_batch_expansion_is_on_when_the_config_omits_it(context):
+  scheduler_context = context({"State": {"Engine": "Array"}})
+  main.CONFIG.remove_option("Search", "BatchExpansion")
+  search_strategy = main.build_search_strategy(10, 100)
+  assert search_strategy.BATCH_EXPANSION is True
+  assert isinstance(search_strategy._prepare_actions(scheduler_context.start_state, scheduler_context.all_actions), ActionTable)
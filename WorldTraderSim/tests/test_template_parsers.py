@@ -0,0 +1,92 @@
+# Standard Libraries
+import json
+import os
+
+# External Dependencies
+import pytest
+
+# Local Modules
+from WorldTraderSim import main
+from WorldTraderSim.DataTypes import ResourceTemplate, TransformAction
+from WorldTraderSim.Parsers import TemplateCatalogParser, TransformTemplateParser
+
+
+def quantities(resource_quantities):
+  return [(resource_quantity.name, resource_quantity.quantity) for resource_quantity in resource_quantities]
+
+def test_tmpl_parses_multi_digit_quantities(tmp_path):
+  template_path = tmp_path / "housing.tmpl"
+  template_path.write_text("""(TRANSFORM C
+    (INPUTS (Population 12)
+            (Timber 150)
+            (Water 3))
+    (OUTPUTS (Housing 10)
+             (Population 12)))""")
+  transform_template = TransformTemplateParser.parse(str(template_path))
+  assert transform_template.name == "housing"
+  assert quantities(transform_template.inputs) == [("Population", 12), ("Timber", 150), ("Water", 3)]
+  assert quantities(transform_template.outputs) == [("Housing", 10), ("Population", 12)]
+
+def test_json_catalog_reads_single_templates_and_lists(tmp_path):
+  (tmp_path / "housing.json").write_text(json.dumps({"name": "Housing", "inputs": {"Population": 12, "Water": 150}, "outputs": {"Housing": 10}}))
+  (tmp_path / "alloys.json").write_text(json.dumps([
+    {"name": "Alloys", "inputs": {"MetallicElements": 2}, "outputs": {"MetallicAlloys": 1}},
+    {"name": "Alloys2", "inputs": {"MetallicAlloys": 25}, "outputs": {"MetallicAlloys2": 1}},
+  ]))
+  (tmp_path / "notes.txt").write_text("not a template")
+  transform_templates = TemplateCatalogParser.parse_catalog(str(tmp_path))
+  # Files are read in name order
+  assert [transform_template.name for transform_template in transform_templates] == ["Alloys", "Alloys2", "Housing"]
+  assert quantities(transform_templates[2].inputs) == [("Population", 12), ("Water", 150)]
+  assert quantities(transform_templates[1].inputs) == [("MetallicAlloys", 25)]
+
+def test_json_catalog_reports_every_error_together(tmp_path):
+  (tmp_path / "broken.json").write_text("{")
+  (tmp_path / "housing.json").write_text(json.dumps([
+    {"name": "Housing", "inputs": {"Population": 0, "Timber": True}, "outputs": {"Housing": 1.5}},
+    {"inputs": {}},
+    {"name": "Housing", "inputs": {"Population": 1}, "outputs": {"Housing": 1}},
+  ]))
+  with pytest.raises(Exception) as error:
+    TemplateCatalogParser.parse_catalog(str(tmp_path))
+  message = str(error.value)
+  assert "broken.json is not valid JSON" in message
+  assert "housing.json Housing inputs Population must be a positive integer, got 0" in message
+  assert "housing.json Housing inputs Timber must be a positive integer, got True" in message
+  assert "housing.json Housing outputs Housing must be a positive integer, got 1.5" in message
+  assert "housing.json must be an object with a name" in message
+  assert "Template Housing is defined more than once" in message
+
+def test_json_catalog_must_not_be_empty(tmp_path):
+  with pytest.raises(Exception, match="No .json templates found"):
+    TemplateCatalogParser.parse_catalog(str(tmp_path))
+
+def test_template_resources_must_be_defined(tmp_path):
+  (tmp_path / "housing.json").write_text(json.dumps({"name": "Housing", "inputs": {"Population": 5, "Water": 5}, "outputs": {"Housing": 1, "AvailableLand": 1}}))
+  transform_templates = TemplateCatalogParser.parse_catalog(str(tmp_path))
+  resources = [ResourceTemplate(name="Population", weight=0.3, factor=""), ResourceTemplate(name="Housing", weight=0.9, factor="")]
+  with pytest.raises(Exception, match="Template Housing uses undefined resources AvailableLand, Water"):
+    TemplateCatalogParser.validate_resources(transform_templates, resources)
+  TemplateCatalogParser.validate_resources(transform_templates, resources + [ResourceTemplate(name="Water", weight=0.05, factor=""), ResourceTemplate(name="AvailableLand", weight=0.1, factor="")])
+
+@pytest.mark.parametrize("directory", ["base", "extended_base"])
+def test_bundled_json_catalogs_build_transform_actions(context, directory):
+  context()
+  main.CONFIG.read_dict({"Templates": {"Directory": directory, "Format": "json"}})
+  scenario = main.parse_scenario("Atlantis", "initial-extended.csv", "resources-extended.csv")
+  transform_actions = [action for action in scenario.actions if isinstance(action, TransformAction)]
+  assert sorted(set(action.TEMPLATE.name for action in transform_actions)) == ["Electronics", "Housing", "MetallicAlloys"]
+
+  with pytest.raises(Exception, match="Template resources missing from the resources file"):
+    main.parse_scenario("Atlantis", "initial.csv", "resources.csv")
+
+STATE_FILES = sorted(os.listdir(main.STATES_PATH))
+
+# Every bundled initial state with every bundled resources file, .tmpl templates only warn about resources a file leaves out
+@pytest.mark.parametrize("initial_state_file", [file_name for file_name in STATE_FILES if file_name.startswith("initial")])
+@pytest.mark.parametrize("resources_file", [file_name for file_name in STATE_FILES if file_name.startswith("resources")])
+def test_bundled_scenarios_parse_with_tmpl_templates(context, initial_state_file, resources_file):
+  context()
+  scenario = main.parse_scenario("Atlantis", initial_state_file, resources_file)
+  scheduler_context = main.build_scheduler_context("Atlantis", scenario)
+  assert any(isinstance(action, TransformAction) for action in scheduler_context.all_actions)
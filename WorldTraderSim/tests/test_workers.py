@@ -0,0 +1,27 @@
+# External Dependencies
+import pytest
+
+# Local Modules
+from WorldTraderSim import main
+
+
+def schedules(context: main.SchedulerContext, solutions):
+  start_country_state = context.schedule_evaluator.initial_state["Atlantis"]
+  return [(
+    [node.PARENT_ACTION.to_string(context.self_country) for node in solution.PATH if node.PARENT_ACTION],
+    context.schedule_evaluator.expected_utility(start_country_state, main.Schedule(solution.NODE)),
+    (solution.STATS.generated, solution.STATS.expanded, solution.STATS.stop_reason),
+  ) for solution in solutions]
+
+# Workers replay each schedule from its action indices, a seeded run must not depend on where it was searched
+@pytest.mark.parametrize("strategy", ["HeuristicDepthFirstSearch", "BestFirstSearch"])
+@pytest.mark.parametrize("engine", ["Dict", "Array"])
+def test_workers_find_same_schedules_as_serial(context, strategy, engine):
+  scheduler_context = context({"State": {"Engine": engine}, "Search": {"Strategy": strategy}})
+  scenario = main.load_scenario("Atlantis", "initial.csv", "resources.csv")
+
+  serial = schedules(scheduler_context, main.search_schedules(scheduler_context, 3, 3, 15, 20000))
+  parallel = schedules(scheduler_context, main.search_schedules_parallel(scheduler_context, 2, 3, "Atlantis", scenario, 3, 15, 20000))
+  assert parallel == serial
+  assert len(serial) == 3
+  assert all(path for path, _eu, _stats in serial)
@@ -0,0 +1,34 @@
+# Standard Libraries
+import random
+
+# External Dependencies
+import pytest
+
+# Local Modules
+from WorldTraderSim.DataTypes import Country, Node, ResourceQuantity, ZobristHasher
+
+
+@pytest.mark.parametrize("engine, copy_on_write", [("Dict", "True"), ("Dict", "False"), ("Array", "False")])
+def test_incremental_update_matches_full_rehash(context, engine, copy_on_write):
+  scheduler_context = context({"State": {"Engine": engine, "CopyOnWrite": copy_on_write}})
+  rng = random.Random(7)
+  node = Node(scheduler_context.start_state, None, None, 0.0)
+  assert node.state_hash() == Node.HASHER.hash_state(node.STATE)
+
+  for _step in range(60):
+    applicable = [action for action in scheduler_context.all_actions if action.is_applicable(node.STATE)]
+    action = rng.choice(applicable)
+    node = Node(action.apply(node.STATE), node, action, node.PATH_COST + action.ACTION_COST)
+    # The parent is hashed, so the child's hash comes from ZobristHasher.update
+    assert node.state_hash() == Node.HASHER.hash_state(node.STATE)
+
+def test_keys_are_stable_across_hashers():
+  assert ZobristHasher().key("Atlantis", "Population", 12) == ZobristHasher().key("Atlantis", "Population", 12)
+  assert ZobristHasher().key("Atlantis", "Population", 12) != ZobristHasher(seed=1).key("Atlantis", "Population", 12)
+
+def test_created_resource_updates_like_a_full_rehash():
+  parent_state = {"Atlantis": Country(name="Atlantis", resources={"Population": ResourceQuantity("Population", 5)})}
+  child_state = {"Atlantis": Country(name="Atlantis", resources={"Population": ResourceQuantity("Population", 4), "Water": ResourceQuantity("Water", 3)})}
+  hasher = ZobristHasher()
+  updated = hasher.update(hasher.hash_state(parent_state), parent_state, [("Atlantis", "Population", -1), ("Atlantis", "Water", 3)])
+  assert updated == hasher.hash_state(child_state)